@@ -0,0 +1,116 @@
+"""Smoke check of the HTTP API exports with markup characters in every user text.
+
+    python benchmarks/api_smoke.py [--url http://127.0.0.1:8765]
+
+Starts ``python -m decision_compass.api`` on a free port against a temporary SQLite
+store (or uses a running server with ``--url``), then requests every module as PDF,
+XLSX and CSV twice: posted in the body of ``/export/<module>.<fmt>``, and stored in a
+workspace and fetched from ``/workspaces/<ws>/<module>.<fmt>``, plus the workspace
+bundle. Texts contain ``<``, ``>`` and ``&``. Exits with status 1 when a request does
+not return 200 with a file of the requested format.
+"""
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import uuid
+from urllib.error import HTTPError
+from urllib.parse import urlsplit
+from urllib.request import Request, urlopen
+
+from load_test import freier_port, warten
+from suite import ROOT
+
+TEXT = "a<b & <x> c>d"
+FORMATE = {"pdf": b"%PDF", "xlsx": b"PK", "csv": None}
+INHALT = {
+    "task_analysis": {"antworten": [4, 5, 3, 6, 2, 4, 5, 3, 6, 2, 4, 5]},
+    "swot_analysis": {"felder": [f"{TEXT}\nzweite Zeile", TEXT, "", TEXT]},
+    "eisenhower_matrix": {"tasks": [{"beschreibung": TEXT, "wichtigkeit": "Wichtig", "dringlichkeit": "Dringend"}]},
+    "raci_matrix": {"aufgaben": [{"Aufgabe": TEXT, f"Rolle {TEXT}": "R", "Rolle 2": "A"}]},
+    "balanced_scorecard": {"ziele": [{"perspektive": "finanzen", "bereich": TEXT, "ziel": TEXT, "kennzahl": TEXT,
+                                      "zielwert": 10, "istwert": 8, "massnahmen": f"{TEXT}\n{TEXT}"}]},
+}
+STORE = {"eisenhower_matrix": "/eisenhower", "raci_matrix": "/raci", "balanced_scorecard": "/bsc"}
+
+
+def anfrage(basis, pfad, daten=None):
+    """(status, body) of a GET, or a POST when ``daten`` is given"""
+    body = json.dumps(daten).encode() if daten is not None else None
+    request = Request(basis + pfad, data=body, headers={"Content-Type": "application/json"})
+    try:
+        with urlopen(request, timeout=120) as antwort:
+            return antwort.status, antwort.read()
+    except HTTPError as exc:
+        return exc.code, exc.read()
+
+
+def pruefe_datei(basis, pfad, fmt, daten=None, text=True):
+    """Error message, or None when the export came back as a file of its format (a CSV with ``TEXT`` verbatim)"""
+    status, body = anfrage(basis, pfad, daten)
+    if status != 200:
+        return f"{pfad}: status {status}: {body[:200]!r}"
+    kennung = FORMATE[fmt]
+    if kennung is not None and not body.startswith(kennung):
+        return f"{pfad}: not a {fmt} file"
+    if fmt == "csv" and text and TEXT not in body.decode("utf-8-sig"):
+        return f"{pfad}: {TEXT!r} missing from the CSV"
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="Use a running API server instead of starting one")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        prozess = None
+        if args.url:
+            ziel = urlsplit(args.url)
+            basis = f"http://{ziel.hostname}:{ziel.port or 80}"
+        else:
+            host, port = "127.0.0.1", freier_port()
+            basis = f"http://{host}:{port}"
+            prozess = subprocess.Popen([sys.executable, "-m", "decision_compass.api", "--host", host, "--port", str(port),
+                                        "--storage", f"sqlite:///{tmp}/smoke.db"],
+                                       cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            if prozess is not None:
+                warten(host, port, prozess)
+            fehler, anzahl = [], 0
+            workspace = f"smoke{uuid.uuid4().hex[:8]}"
+            for modul, daten in INHALT.items():
+                for fmt in FORMATE:
+                    anzahl += 1
+                    fehler.append(pruefe_datei(basis, f"/export/{modul}.{fmt}", fmt, daten, text=modul != "task_analysis"))
+                if modul in STORE:
+                    status, body = anfrage(basis, STORE[modul], dict(daten, workspace=workspace))
+                    if status != 200:
+                        fehler.append(f"{STORE[modul]}: status {status}: {body[:200]!r}")
+                        continue
+                    for fmt in FORMATE:
+                        anzahl += 1
+                        fehler.append(pruefe_datei(basis, f"/workspaces/{workspace}/{modul}.{fmt}", fmt))
+            for fmt in ("xlsx", "pdf"):
+                anzahl += 1
+                fehler.append(pruefe_datei(basis, f"/workspaces/{workspace}/bundle.{fmt}", fmt))
+            status, _ = anfrage(basis, f"/workspaces/{workspace}/bundle.zip")
+            anzahl += 1
+            fehler.append(None if status == 200 else f"/workspaces/{workspace}/bundle.zip: status {status}")
+        finally:
+            if prozess is not None:
+                prozess.terminate()
+                prozess.wait()
+
+    fehler = [meldung for meldung in fehler if meldung]
+    for meldung in fehler:
+        print(f"FAIL: {meldung}")
+    if fehler:
+        return 1
+    print(f"OK: {anzahl} exports with {TEXT!r}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
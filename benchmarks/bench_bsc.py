@@ -0,0 +1,94 @@
+"""Balanced Scorecard at scale: index build, rollups, cached page rerun.
+
+    python benchmarks/bench_bsc.py [--objectives 5000] [--units 50]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from decision_compass.bsc import BscIndex  # noqa: E402
+from decision_compass.storage import PERSPEKTIVEN, open_storage  # noqa: E402
+from seiten import oeffne  # noqa: E402
+
+WORKSPACE = "benchmark"
+
+
+def fuellen(storage, n, units, seed=0):
+    rng = np.random.default_rng(seed)
+    start = time.perf_counter()
+    for i in range(n):
+        ziel = float(rng.integers(10, 1000))
+        storage.add_objective(
+            WORKSPACE, PERSPEKTIVEN[i % 4], f"Ziel {i}", "KPI", ziel, "",
+            istwert=ziel * rng.uniform(0.3, 1.3), gewicht=float(rng.integers(1, 4)), bereich=f"Bereich {i % units}"
+        )
+    return time.perf_counter() - start
+
+
+def rollup_listen(ziele):
+    """Per-perspective list filtering, as the page did before the index"""
+    ergebnis = {}
+    for p in PERSPEKTIVEN:
+        gruppe = [z for z in ziele if z["perspektive"] == p]
+        quoten = [min(max(z["istwert"] / z["zielwert"], 0.0), 1.0) for z in gruppe if z["zielwert"] and z["istwert"] is not None]
+        ergebnis[p] = (len([z for z in ziele if z["perspektive"] == p]), sum(quoten) / len(quoten) if quoten else None)
+    return ergebnis
+
+
+def best_of(fn, repeat=5):
+    zeiten = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        ergebnis = fn()
+        zeiten.append(time.perf_counter() - start)
+    return min(zeiten), ergebnis
+
+
+def rerun(db_url, repeat=5):
+    from streamlit.testing.v1 import AppTest
+
+    os.environ["DECISION_COMPASS_STORAGE"] = db_url
+    at = AppTest.from_file(str(ROOT / "app.py"), default_timeout=300)
+    at.query_params["ws"] = WORKSPACE
+    at.run()
+    start = time.perf_counter()
+    oeffne(at, "balanced_scorecard").run()
+    kalt = time.perf_counter() - start
+    warm, _ = best_of(at.run, repeat)
+    assert not at.exception, at.exception
+    return kalt, warm
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--objectives", type=int, default=5000)
+    parser.add_argument("--units", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_url = f"sqlite:///{tmp}/bench.db"
+        for url in ("memory://", db_url):
+            storage = open_storage(url)
+            schreiben = fuellen(storage, args.objectives, args.units)
+            laden, ziele = best_of(lambda: storage.list_objectives(WORKSPACE))
+            index_zeit, index = best_of(lambda: BscIndex(ziele))
+            rollup_zeit, _ = best_of(lambda: (index.rollup(), index.rollup(nach_bereich=True)))
+            legacy, _ = best_of(lambda: rollup_listen(ziele))
+            print(f"{url.split(':')[0]:>7}: {args.objectives} objectives / {args.units} units, inserts {schreiben:.2f}s, "
+                  f"load {laden * 1000:.1f} ms, index {index_zeit * 1000:.1f} ms, rollups {rollup_zeit * 1000:.2f} ms "
+                  f"(list filtering {legacy * 1000:.1f} ms, without unit breakdown)")
+
+        kalt, warm = rerun(db_url)
+        print(f"page with {args.objectives} objectives: first run {kalt * 1000:.0f} ms, cached rerun {warm * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
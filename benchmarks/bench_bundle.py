@@ -0,0 +1,83 @@
+"""Global export bundle: per-module render times against the parallel ZIP/XLSX/PDF bundle.
+
+    python benchmarks/bench_bundle.py [--tasks 3000] [--objectives 3000] [--raci 1000x20]
+"""
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from decision_compass import bundle  # noqa: E402
+from decision_compass.cache import artifact_cache  # noqa: E402
+from decision_compass.raci import CODES, RaciMatrix  # noqa: E402
+from decision_compass.scoring import FRAGEN  # noqa: E402
+from decision_compass.storage import PERSPEKTIVEN, QUADRANTEN, open_storage  # noqa: E402
+
+WORKSPACE = "benchmark"
+SPRACHE = "DE"
+
+
+def fuellen(storage, tasks, objectives, raci_tasks, raci_roles):
+    for i in range(tasks):
+        storage.add_task(WORKSPACE, f"Aufgabe {i}", "Wichtig", "Dringend", QUADRANTEN[i % 4])
+    rollen = [f"Rolle {j}" for j in range(raci_roles)]
+    storage.ensure_roles(WORKSPACE, rollen)
+    for i in range(raci_tasks):
+        storage.add_raci_task(WORKSPACE, f"Aufgabe {i}", {rolle: CODES[1 + (i + j) % 4] for j, rolle in enumerate(rollen) if (i + j) % 3 == 0})
+    for i in range(objectives):
+        storage.add_objective(WORKSPACE, PERSPEKTIVEN[i % 4], f"Ziel {i}", "KPI", 100.0, "Maßnahme", istwert=float(i % 120))
+
+
+def quellen(storage):
+    return [
+        lambda: bundle.analyse_export([(f["typ"], 1 + i % 7) for i, f in enumerate(FRAGEN)], SPRACHE),
+        lambda: bundle.swot_export(["Stärke", "Schwäche", "Chance", "Risiko"], SPRACHE),
+        lambda: bundle.eisenhower_export(storage.list_tasks(WORKSPACE), SPRACHE),
+        lambda: bundle.raci_export(RaciMatrix.from_snapshot(storage.raci_snapshot(WORKSPACE)), SPRACHE),
+        lambda: bundle.bsc_export(storage.list_objectives(WORKSPACE), SPRACHE),
+    ]
+
+
+def zeit(fn):
+    artifact_cache().clear()
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=3000)
+    parser.add_argument("--objectives", type=int, default=3000)
+    parser.add_argument("--raci", default="1000x20")
+    args = parser.parse_args()
+    raci_tasks, raci_roles = map(int, args.raci.split("x"))
+
+    storage = open_storage("memory://")
+    fuellen(storage, args.tasks, args.objectives, raci_tasks, raci_roles)
+    inhalte = bundle.sammle_module(quellen(storage))
+
+    einzeln = {i.name: zeit(lambda: [bundle.render_modul(i, fmt, "DE") for fmt in ("pdf", "xlsx", "csv")]) for i in inhalte}
+    for name, dauer in einzeln.items():
+        print(f"{name:>20}: {dauer * 1000:7.0f} ms (pdf + xlsx + csv, sequential)")
+    print(f"{'sum of modules':>20}: {sum(einzeln.values()) * 1000:7.0f} ms, slowest {max(einzeln.values()) * 1000:.0f} ms")
+
+    bundle.export_pool()  # spawn workers outside the measurement
+    zeit(lambda: bundle.bundle_export(inhalte, "zip", SPRACHE))
+    print(f"{'zip, processes':>20}: {zeit(lambda: bundle.bundle_export(inhalte, 'zip', SPRACHE)) * 1000:7.0f} ms "
+          f"({bundle.export_pool()._max_workers} workers)")
+    for fmt in ("xlsx", "pdf"):
+        print(f"{fmt + ', one file':>20}: {zeit(lambda: bundle.bundle_export(inhalte, fmt, SPRACHE)) * 1000:7.0f} ms")
+
+    bundle.export_pool().shutdown()
+    bundle._pool = None
+    os.environ["DECISION_COMPASS_EXPORT_WORKERS"] = "0"
+    print(f"{'zip, threads':>20}: {zeit(lambda: bundle.bundle_export(inhalte, 'zip', SPRACHE)) * 1000:7.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
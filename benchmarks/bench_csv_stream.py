@@ -0,0 +1,68 @@
+"""CSV export from the store: peak memory and time, DataFrame.to_csv vs. chunked generator.
+
+    python benchmarks/bench_csv_stream.py [--sizes 10000 100000 500000]
+
+"legacy" loads the records, builds a DataFrame and encodes one ``to_csv`` string (the
+former ``export_to_csv``, kept here only as the baseline); "chunks" consumes
+csv_chunks straight from a SQLite cursor (as a streaming response would); "bytes" joins the
+chunks into the download (adds the file itself, nothing else).
+"""
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from decision_compass.bundle import store_tabelle  # noqa: E402
+from decision_compass.export import csv_chunks, csv_datei, csv_format  # noqa: E402
+from decision_compass.storage import open_storage  # noqa: E402
+
+WORKSPACE = "benchmark"
+
+
+def fuellen(storage, n):
+    conn = storage._conn()
+    with conn:
+        conn.executemany(
+            "INSERT INTO eisenhower_tasks (workspace, beschreibung, wichtigkeit, dringlichkeit, quadrant) VALUES (?, ?, ?, ?, ?)",
+            ((WORKSPACE, f"Aufgabe {i}: Angebot für Kunde {i % 97} prüfen", "Wichtig", "Dringend", f"Q{i % 4 + 1}") for i in range(n)),
+        )
+
+
+def messen(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    groesse = fn()
+    dauer = time.perf_counter() - start
+    _, spitze = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return dauer, spitze, groesse
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 500000])
+    args = parser.parse_args()
+
+    import pandas as pd
+
+    faelle = {
+        "legacy": lambda s: len(pd.DataFrame(s.list_tasks(WORKSPACE)).to_csv(index=False).encode("utf-8")),
+        "chunks": lambda s: sum(len(c) for c in csv_chunks(*store_tabelle(s, WORKSPACE, "eisenhower_matrix", "DE"), *csv_format("DE"))),
+        "bytes": lambda s: len(csv_datei(*store_tabelle(s, WORKSPACE, "eisenhower_matrix", "DE"), "DE")),
+    }
+    print(f"{'rows':>7} {'case':<7} {'seconds':>8} {'peak MiB':>9} {'csv MiB':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in args.sizes:
+            storage = open_storage(f"sqlite:///{tmp}/bench_{n}.db")
+            fuellen(storage, n)
+            for name, fall in faelle.items():
+                dauer, spitze, groesse = messen(lambda: fall(storage))
+                print(f"{n:>7} {name:<7} {dauer:>8.2f} {spitze / 2**20:>9.1f} {groesse / 2**20:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Eisenhower matrix at scale: storage writes, per-quadrant page reads and full page rerun.
+
+    python benchmarks/bench_eisenhower.py [--tasks 10000]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from decision_compass.storage import QUADRANTEN, open_storage  # noqa: E402
+from seiten import oeffne  # noqa: E402
+
+WORKSPACE = "benchmark"
+
+
+def fuellen(storage, n):
+    start = time.perf_counter()
+    for i in range(n):
+        q = QUADRANTEN[i % 4]
+        storage.add_task(WORKSPACE, f"Aufgabe {i}", "Wichtig" if q in ("Q1", "Q2") else "Nicht Wichtig",
+                         "Dringend" if q in ("Q1", "Q3") else "Nicht Dringend", q)
+    return time.perf_counter() - start
+
+
+def lesen(storage, page_size=25, repeat=20):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        storage.count_tasks(WORKSPACE)
+        for q in QUADRANTEN:
+            storage.list_tasks(WORKSPACE, quadrant=q, offset=0, limit=page_size)
+    return (time.perf_counter() - start) / repeat
+
+
+def rerun(db_url, repeat=5):
+    """Time a rerun of the Eisenhower page and measure the HTML sent for the matrix"""
+    from streamlit.testing.v1 import AppTest
+
+    os.environ["DECISION_COMPASS_STORAGE"] = db_url
+    at = AppTest.from_file(str(ROOT / "app.py"), default_timeout=120)
+    at.query_params["ws"] = WORKSPACE
+    at.run()
+    oeffne(at, "eisenhower_matrix").run()
+    zeiten = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        at.run()
+        zeiten.append(time.perf_counter() - start)
+    assert not at.exception, at.exception
+    payload = sum(len(m.value) for m in at.markdown if "quadrant" in m.value)
+    return min(zeiten), payload
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=10000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_url = f"sqlite:///{tmp}/bench.db"
+        for url in ("memory://", db_url):
+            storage = open_storage(url)
+            schreiben = fuellen(storage, args.tasks)
+            print(f"{url.split(':')[0]:>7}: {args.tasks} inserts {schreiben:.2f}s, counts + 4 quadrant pages {lesen(storage) * 1000:.2f} ms")
+
+        dauer, payload = rerun(db_url)
+        legacy = sum(len(f"• Aufgabe {i}<br>") for i in range(args.tasks))
+        print(f"page rerun with {args.tasks} tasks: {dauer * 1000:.0f} ms, matrix HTML {payload / 1024:.1f} KiB "
+              f"(all tasks in one HTML block: ~{legacy / 1024:.0f} KiB)")
+
+
+if __name__ == "__main__":
+    main()
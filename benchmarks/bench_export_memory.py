@@ -0,0 +1,71 @@
+"""Peak RSS per export size: legacy base64 data-URL links vs. byte downloads.
+
+    python benchmarks/bench_export_memory.py [--sizes 1000 10000 50000]
+
+Every measurement runs in a fresh interpreter so ru_maxrss reflects a single export.
+"""
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = str(Path(__file__).resolve().parent.parent)
+
+PROBE = """
+import base64, json, resource, sys, time
+sys.path.insert(0, {root!r})
+import pandas as pd
+from decision_compass.export import export_to_pdf, dataframe_to_xlsx
+
+n, fmt, pfad = {n}, {fmt!r}, {pfad!r}
+records = [{{"beschreibung": f"Aufgabe {{i}}", "wichtigkeit": "Wichtig", "dringlichkeit": "Dringend", "quadrant": f"Q{{i % 4 + 1}}"}} for i in range(n)]
+if fmt == "pdf":
+    import reportlab.platypus
+else:
+    import xlsxwriter
+
+def bauen():
+    if fmt == "pdf":
+        return export_to_pdf({{r["beschreibung"]: r["quadrant"] for r in records}}, "Benchmark").getvalue()
+    if fmt == "xlsx":
+        return dataframe_to_xlsx(pd.DataFrame(records))
+    return pd.DataFrame(records).to_csv(index=False).encode("utf-8")
+
+vorher = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+data = bauen()
+if pfad == "data-url":
+    b64 = base64.b64encode(data).decode()
+    html = f'<a href="data:application/octet-stream;base64,{{b64}}" download="x">x</a>'
+    payload = len(html)
+else:
+    payload = len(data)
+dauer = time.perf_counter() - start
+nachher = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{"peak_rss_delta_mb": (nachher - vorher) / 1024, "payload_mb": payload / 1e6, "seconds": dauer}}))
+"""
+
+
+def messen(n, fmt, pfad):
+    probe = PROBE.format(root=ROOT, n=n, fmt=fmt, pfad=pfad)
+    out = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--formats", nargs="+", default=["csv", "xlsx", "pdf"])
+    args = parser.parse_args()
+
+    print(f"{'format':>6} {'rows':>7} {'path':>9} {'peak RSS Δ MB':>14} {'payload MB':>11} {'s':>6}")
+    for fmt in args.formats:
+        for n in args.sizes:
+            for pfad in ("data-url", "bytes"):
+                r = messen(n, fmt, pfad)
+                print(f"{fmt:>6} {n:>7} {pfad:>9} {r['peak_rss_delta_mb']:>14.1f} {r['payload_mb']:>11.2f} {r['seconds']:>6.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+"""Server CPU per interaction against a running ``streamlit run app.py`` (Linux only).
+
+    python benchmarks/bench_fragments.py [--items 1000] [--repeat 10] [--app-dir PATH]
+
+AppTest always reruns the whole script, so partial reruns can only be seen on a real
+server: the app runs headless on a temporary SQLite store (filled like the suite) and is
+driven over the websocket the browser uses. Widgets are looked up by label in the deltas;
+a click carries the fragment id of the widget's element, as the frontend sends it. Per
+interaction the server's CPU time (/proc/<pid>/stat) and the wall time until the last
+script run finished are averaged over ``--repeat`` clicks. ``--app-dir`` runs another
+checkout (e.g. a git worktree of an older release) for comparison.
+"""
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from contextlib import contextmanager
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from streamlit.proto.BackMsg_pb2 import BackMsg  # noqa: E402
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg  # noqa: E402
+from streamlit.proto.WidgetStates_pb2 import WidgetState  # noqa: E402
+from websockets.sync.client import connect  # noqa: E402
+
+from decision_compass.i18n import get_text  # noqa: E402
+from decision_compass.storage import open_storage  # noqa: E402
+from suite import LANG, WORKSPACE, fuellen  # noqa: E402
+
+FERTIG = (ForwardMsg.FINISHED_SUCCESSFULLY, ForwardMsg.FINISHED_FRAGMENT_RUN_SUCCESSFULLY)
+TICK = os.sysconf("SC_CLK_TCK")
+
+# (name, page, widget label key, kind, {input label key: value}); {i} is the click number
+INTERAKTIONEN = (
+    ("add task", "eisenhower_matrix", "add_task", "trigger", {"task_description": "Benchmark {i}"}),
+    ("turn Q1 page", "eisenhower_matrix", None, "page", {}),
+    ("export CSV", "eisenhower_matrix", "export_csv", "trigger", {}),
+    ("add role", "raci_matrix", "add_role", "trigger", {"new_role": "Rolle B{i}"}),
+    ("add RACI row", "raci_matrix", "add_task", "trigger", {"task_description": "Paket B{i}"}),
+    ("add objective", "balanced_scorecard", "add_objective", "trigger", {"strategic_objective": "Ziel B{i}", "kpi": "Umsatz"}),
+    ("export CSV", "balanced_scorecard", "export_csv", "trigger", {}),
+)
+
+
+def cpu_s(pid):
+    felder = Path(f"/proc/{pid}/stat").read_text().rsplit(")", 1)[1].split()
+    return (int(felder[11]) + int(felder[12])) / TICK  # utime + stime
+
+
+def freier_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@contextmanager
+def app_server(app_dir, storage_url):
+    """Serve ``app_dir``/app.py headless; yields (websocket of a new session, server pid)"""
+    port = freier_port()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", "app.py", "--server.headless", "true", "--server.port", str(port),
+         "--server.enableXsrfProtection", "false", "--server.fileWatcherType", "none", "--browser.gatherUsageStats", "false"],
+        cwd=app_dir, env=dict(os.environ, DECISION_COMPASS_STORAGE=storage_url),
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        for _ in range(300):
+            try:
+                urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1)
+                break
+            except OSError:
+                time.sleep(0.1)
+        with connect(f"ws://127.0.0.1:{port}/_stcore/stream", subprotocols=["streamlit"], max_size=None) as ws:
+            yield ws, server.pid
+    finally:
+        server.terminate()
+        server.wait()
+
+
+class Sitzung:
+    """One browser session: widgets of the last run by label -> (element, fragment id)
+
+    Like the browser it keeps cacheable messages and reports their hashes with every rerun,
+    so the server may send a reference instead of a repeated message. ``bytes``
+    counts what was received.
+    """
+
+    def __init__(self, ws):
+        self.ws = ws
+        self.seiten = {}
+        self.widgets = {}
+        self.seite = None
+        self.cache = {}
+        self.bytes = 0
+
+    def senden(self, widget_states=(), fragment_id=""):
+        msg = BackMsg()
+        cs = msg.rerun_script
+        cs.query_string = f"ws={WORKSPACE}"
+        cs.page_name = self.seite
+        cs.page_script_hash = self.seiten.get(self.seite, "")
+        cs.fragment_id = fragment_id
+        cs.widget_states.widgets.extend(widget_states)
+        cs.cached_message_hashes.extend(self.cache)
+        self.ws.send(msg.SerializeToString())
+
+    def warten(self):
+        """Read until a run finished successfully (a rerun started with st.rerun() finishes twice)"""
+        while True:
+            daten = self.ws.recv(timeout=600)
+            self.bytes += len(daten)
+            fm = ForwardMsg.FromString(daten)
+            if fm.WhichOneof("type") == "ref_hash":
+                fm = self.cache[fm.ref_hash]
+            elif fm.metadata.cacheable:
+                self.cache[fm.hash] = fm
+            art = fm.WhichOneof("type")
+            if art == "navigation":
+                self.seiten = {p.url_pathname: p.page_script_hash for p in fm.navigation.app_pages}
+            elif art == "new_session":
+                self.widgets = {}
+            elif art == "delta" and fm.delta.WhichOneof("type") == "new_element":
+                element = fm.delta.new_element
+                typ = element.WhichOneof("type")
+                inhalt = getattr(element, typ)
+                if hasattr(inhalt, "id") and hasattr(inhalt, "label") and inhalt.id:
+                    self.widgets[inhalt.label] = (typ, inhalt, fm.delta.fragment_id)
+            elif art == "script_finished" and fm.script_finished in FERTIG:
+                return
+
+    def leeren(self, sekunden):
+        """Drain messages (e.g. job polling) for a while"""
+        ende = time.monotonic() + sekunden
+        while (rest := ende - time.monotonic()) > 0:
+            try:
+                self.ws.recv(timeout=rest)
+            except TimeoutError:
+                break
+
+    def oeffne(self, seite):
+        self.seite = seite
+        self.senden()
+        self.warten()
+        if not self.seiten.get(seite):
+            self.senden()  # the first run only told us the page hashes
+            self.warten()
+
+    def widget(self, label):
+        return self.widgets[label]
+
+
+def zustand(widget, wert):
+    typ, inhalt, _ = widget
+    ws = WidgetState(id=inhalt.id)
+    if typ == "number_input":
+        ws.int_value = wert
+    elif typ == "button":
+        ws.trigger_value = True
+    else:
+        ws.string_value = wert
+    return ws
+
+
+def klick(sitzung, label_key, art, eingaben, i):
+    if art == "page":
+        widget = next(w for w in sitzung.widgets.values() if w[0] == "number_input")
+        zustaende = [zustand(widget, 2 - i % 2)]
+    else:
+        widget = sitzung.widget(get_text(label_key, LANG))
+        zustaende = [zustand(sitzung.widget(get_text(k, LANG)), v.format(i=i)) for k, v in eingaben.items()]
+        zustaende.append(zustand(widget, True))
+    sitzung.senden(zustaende, fragment_id=widget[2])
+    sitzung.warten()
+    return widget[2]
+
+
+def messen(ws, pid, repeat):
+    sitzung = Sitzung(ws)
+    ergebnisse = []
+    for name, seite, label_key, art, eingaben in INTERAKTIONEN:
+        sitzung.oeffne(seite)
+        klick(sitzung, label_key, art, eingaben, 0)  # warm-up
+        sitzung.leeren(2)
+        cpu = wand = 0.0
+        for i in range(1, repeat + 1):
+            sitzung.oeffne(seite)
+            sitzung.leeren(0.5)
+            vorher, start = cpu_s(pid), time.perf_counter()
+            fragment = klick(sitzung, label_key, art, eingaben, i)
+            wand += time.perf_counter() - start
+            cpu += cpu_s(pid) - vorher
+            if label_key == "export_csv":
+                sitzung.leeren(2)  # let the job and the sidebar polling finish outside the window
+        ergebnisse.append((f"{seite}: {name}", cpu / repeat * 1000, wand / repeat * 1000, "fragment" if fragment else "app"))
+    return ergebnisse
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=1000, help="Items per stored module")
+    parser.add_argument("--repeat", type=int, default=10, help="Clicks per interaction")
+    parser.add_argument("--app-dir", default=str(ROOT), help="Checkout whose app.py is served")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{tmp}/fragments.db"
+        fuellen(open_storage(url), args.items)
+        with app_server(args.app_dir, url) as (ws, pid):
+            ergebnisse = messen(ws, pid, args.repeat)
+
+    print(f"{'interaction':<38} {'scope':<9} {'server CPU ms':>13} {'wall ms':>8}")
+    for name, cpu, wand, scope in ergebnisse:
+        print(f"{name:<38} {scope:<9} {cpu:>13.0f} {wand:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
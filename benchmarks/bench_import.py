@@ -0,0 +1,77 @@
+"""Bulk import: export a workspace as CSV/XLSX, import it into an empty SQLite store and compare.
+
+    python benchmarks/bench_import.py [--rows 50000] [--roles 12]
+
+The round trip counts as exact when the re-exported CSV equals the original byte for byte.
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from decision_compass.bundle import bsc_export, eisenhower_export, raci_export, render_modul, store_tabelle  # noqa: E402
+from decision_compass.export import csv_datei  # noqa: E402
+from decision_compass.i18n import get_text  # noqa: E402
+from decision_compass.importer import importiere  # noqa: E402
+from decision_compass.raci import CODES, RaciMatrix  # noqa: E402
+from decision_compass.storage import PERSPEKTIVEN, open_storage  # noqa: E402
+
+WORKSPACE = "benchmark"
+LANG = "DE"
+
+
+def fuellen(storage, n, roles, seed=0):
+    rng = np.random.default_rng(seed)
+    wichtig, dringend = get_text("importance_options", LANG), get_text("urgency_options", LANG)
+    q = rng.integers(0, 4, n)
+    storage.add_tasks(WORKSPACE, [
+        (f"Aufgabe {i}: Angebot prüfen", wichtig[q[i] // 2], dringend[q[i] % 2], f"Q{q[i] + 1}") for i in range(n)
+    ])
+    rollen = [f"Rolle {j}" for j in range(roles)]
+    for rolle in rollen:
+        storage.add_role(WORKSPACE, rolle)
+    codes = np.where(rng.random((n, roles)) < 0.2, rng.integers(1, 5, (n, roles)), 0)
+    storage.add_raci_tasks(WORKSPACE, [
+        (f"Arbeitspaket {i}", {rollen[j]: CODES[c] for j, c in enumerate(zeile) if c}) for i, zeile in enumerate(codes.tolist())
+    ])
+    storage.add_objectives(WORKSPACE, [
+        {"perspektive": PERSPEKTIVEN[i % 4], "bereich": f"Bereich {i % 7}", "ziel": f"Ziel {i}", "kennzahl": "Umsatz",
+         "zielwert": round(float(rng.random() * 1e5), 2), "istwert": None if i % 5 == 0 else round(float(rng.random() * 1e5), 2),
+         "gewicht": float(i % 3 + 1), "massnahmen": "Kampagne"}
+        for i in range(n)
+    ])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--roles", type=int, default=12)
+    args = parser.parse_args()
+
+    quelle = open_storage("memory://")
+    fuellen(quelle, args.rows, args.roles)
+    inhalte = {
+        "eisenhower_matrix": eisenhower_export(quelle.list_tasks(WORKSPACE), LANG),
+        "raci_matrix": raci_export(RaciMatrix.from_snapshot(quelle.raci_snapshot(WORKSPACE)), LANG),
+        "balanced_scorecard": bsc_export(quelle.list_objectives(WORKSPACE), LANG),
+    }
+    print(f"{'module':<20} {'fmt':<5} {'rows':>7} {'import s':>9} {'errors':>7}  round trip")
+    with tempfile.TemporaryDirectory() as tmp:
+        for fmt in ("csv", "xlsx"):
+            for name, inhalt in inhalte.items():
+                daten = render_modul(inhalt, fmt, LANG)
+                ziel = open_storage(f"sqlite:///{tmp}/{name}_{fmt}.db")
+                start = time.perf_counter()
+                ergebnis = importiere(ziel, WORKSPACE, name, daten, f"{name}.{fmt}", LANG)
+                dauer = time.perf_counter() - start
+                gleich = csv_datei(*store_tabelle(quelle, WORKSPACE, name, LANG), LANG) == csv_datei(*store_tabelle(ziel, WORKSPACE, name, LANG), LANG)
+                print(f"{name:<20} {fmt:<5} {ergebnis.anzahl:>7} {dauer:>9.2f} {len(ergebnis.fehler):>7}  {'exact' if gleich else 'DIFFERS'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Background export jobs: click latency, rerun latency while a job renders, and total job time.
+
+    python benchmarks/bench_jobs.py [--tasks 5000]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from decision_compass.bundle import eisenhower_export, render_modul  # noqa: E402
+from decision_compass.jobs import job_queue  # noqa: E402
+from decision_compass.storage import QUADRANTEN, open_storage  # noqa: E402
+from seiten import oeffne  # noqa: E402
+
+WORKSPACE = "benchmark"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=5000)
+    args = parser.parse_args()
+
+    from streamlit.testing.v1 import AppTest
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_url = f"sqlite:///{tmp}/bench.db"
+        storage = open_storage(db_url)
+        for i in range(args.tasks):
+            storage.add_task(WORKSPACE, f"Aufgabe {i}", "Wichtig", "Dringend", QUADRANTEN[i % 4])
+
+        start = time.perf_counter()
+        render_modul(eisenhower_export(storage.list_tasks(WORKSPACE), "DE"), "pdf", "DE")
+        synchron = time.perf_counter() - start
+
+        os.environ["DECISION_COMPASS_STORAGE"] = db_url
+        at = AppTest.from_file(str(ROOT / "app.py"), default_timeout=300)
+        at.query_params["ws"] = WORKSPACE
+        at.run()
+        oeffne(at, "eisenhower_matrix").run()
+        leerlauf = min(_dauer(at.run) for _ in range(3))
+
+        knopf = next(b for b in at.button if b.label.startswith("📄"))
+        klick = _dauer(knopf.click().run)
+        start = time.perf_counter()
+        waehrend = []
+        while any(job.aktiv for job in job_queue().jobs(WORKSPACE)):
+            waehrend.append(_dauer(at.run))
+        gesamt = time.perf_counter() - start + klick
+        assert not at.exception, at.exception
+
+    print(f"PDF of {args.tasks} tasks built in the click handler: {synchron * 1000:.0f} ms")
+    print(f"as background job: click rerun {klick * 1000:.0f} ms, job done after {gesamt * 1000:.0f} ms")
+    print(f"page rerun idle {leerlauf * 1000:.0f} ms, while the job renders "
+          f"median {sorted(waehrend)[len(waehrend) // 2] * 1000 if waehrend else 0:.0f} ms ({len(waehrend)} reruns)")
+
+
+def _dauer(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    main()
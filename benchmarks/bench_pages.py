@@ -0,0 +1,81 @@
+"""Per-page rerun times of app.py: first run of a fresh process, first visit of each page and warm reruns.
+
+    python benchmarks/bench_pages.py [--items 1000] [--repeat 7] [--rounds 3]
+
+Every page is measured in its own interpreter, so module imports count where a
+real server pays them: "startup" is the first run of the session (start page),
+"first" the switch to the page (imports its module and what it needs), "warm" the
+median of the following reruns. Reported values are medians over ``--rounds``.
+"""
+import argparse
+import json
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SEITEN = ("start", "task_analysis", "swot_analysis", "eisenhower_matrix", "raci_matrix", "balanced_scorecard")
+
+
+def ms(fn):
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def probe(seite, zustand, repeat):
+    """Runs in the child: only streamlit is imported before the first run"""
+    from streamlit.testing.v1 import AppTest
+
+    from seiten import oeffne
+
+    logging.disable(logging.WARNING)
+    at = AppTest.from_file(str(ROOT / "app.py"), default_timeout=600)
+    at.query_params["ws"] = "benchmark"
+    for key, wert in json.loads(zustand).items():
+        at.session_state[key] = wert
+    ergebnis = {"startup": ms(at.run)}
+    oeffne(at, seite)
+    ergebnis["first"] = ms(at.run)
+    ergebnis["warm"] = statistics.median(ms(at.run) for _ in range(repeat))
+    assert not at.exception, [e.value for e in at.exception]
+    print(json.dumps(ergebnis))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=1000, help="Items per stored module")
+    parser.add_argument("--repeat", type=int, default=7, help="Warm reruns per page")
+    parser.add_argument("--rounds", type=int, default=3, help="Fresh processes per page")
+    parser.add_argument("--probe", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.probe:
+        return probe(*args.probe, args.repeat)
+
+    sys.path.insert(0, str(ROOT))
+    import suite
+    from decision_compass.storage import open_storage
+
+    zustand = json.dumps({"analyse_antworten": suite.antworten(), "swot_felder": suite.swot_felder(args.items), "swot_erstellt": True})
+    print(f"{'page':<20} {'startup ms':>10} {'first ms':>9} {'warm ms':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{tmp}/pages.db"
+        suite.fuellen(open_storage(url), args.items)
+        env = dict(os.environ, DECISION_COMPASS_STORAGE=url)
+        for seite in SEITEN:
+            laeufe = []
+            for _ in range(args.rounds):
+                out = subprocess.run([sys.executable, __file__, "--repeat", str(args.repeat), "--probe", seite, zustand],
+                                     env=env, capture_output=True, text=True, check=True)
+                laeufe.append(json.loads(out.stdout.strip().splitlines()[-1]))
+            werte = {k: statistics.median(lauf[k] for lauf in laeufe) for k in ("startup", "first", "warm")}
+            print(f"{seite:<20} {werte['startup']:>10.0f} {werte['first']:>9.0f} {werte['warm']:>8.0f}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+"""PDF report engine: build time and peak memory per row count, table flowables vs. one heading per row.
+
+    python benchmarks/bench_pdf_report.py [--sizes 1000 5000 10000] [--roles 12]
+
+Linear scaling shows as a constant time and memory per row across the sizes.
+"""
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from decision_compass.bundle import eisenhower_export, raci_export, render_modul  # noqa: E402
+from decision_compass.export import export_to_pdf  # noqa: E402
+from decision_compass.raci import RaciMatrix  # noqa: E402
+
+
+def eisenhower(n):
+    return [
+        {"beschreibung": f"Aufgabe {i}: Angebot für Kunde {i % 97} prüfen und abstimmen", "wichtigkeit": "Wichtig",
+         "dringlichkeit": "Dringend" if i % 3 else "Nicht Dringend", "quadrant": f"Q{i % 4 + 1}"}
+        for i in range(n)
+    ]
+
+
+def raci(n, roles, seed=0):
+    rng = np.random.default_rng(seed)
+    codes = np.where(rng.random((n, roles)) < 0.3, rng.integers(1, 5, (n, roles)), 0).astype(np.int8)
+    return RaciMatrix([f"Arbeitspaket {i}" for i in range(n)], [f"Rolle {j}" for j in range(roles)], codes)
+
+
+def messen(fn):
+    """Build time of a plain run, peak Python allocations of a second, traced run (tracemalloc slows it down)"""
+    start = time.perf_counter()
+    data = fn()
+    dauer = time.perf_counter() - start
+    tracemalloc.start()
+    fn()
+    _, spitze = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return dauer, spitze, len(data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 10000])
+    parser.add_argument("--roles", type=int, default=12)
+    args = parser.parse_args()
+
+    faelle = {
+        "eisenhower tables": lambda n: lambda: render_modul(eisenhower_export(eisenhower(n), "DE"), "pdf", "DE"),
+        "eisenhower legacy": lambda n: lambda: export_to_pdf(
+            {t["beschreibung"]: f"Quadrant: {t['quadrant']}, Wichtigkeit: {t['wichtigkeit']}, Dringlichkeit: {t['dringlichkeit']}"
+             for t in eisenhower(n)}, "Eisenhower Matrix").getvalue(),
+        f"raci {args.roles} roles": lambda n: lambda: render_modul(raci_export(raci(n, args.roles), "DE"), "pdf", "DE"),
+    }
+    print(f"{'case':<20} {'rows':>6} {'seconds':>8} {'ms/row':>7} {'peak MiB':>9} {'KiB/row':>8} {'pdf KiB':>8}")
+    for name, fall in faelle.items():
+        for n in args.sizes:
+            dauer, spitze, groesse = messen(fall(n))
+            print(f"{name:<20} {n:>6} {dauer:>8.2f} {dauer * 1000 / n:>7.3f} {spitze / 2**20:>9.1f} "
+                  f"{spitze / 1024 / n:>8.2f} {groesse / 1024:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""RACI matrix at scale: snapshot load, array build, vectorized validation, cell edits and page rerun.
+
+    python benchmarks/bench_raci.py [--tasks 5000] [--roles 200]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from decision_compass.raci import CODES, RaciMatrix  # noqa: E402
+from decision_compass.storage import open_storage  # noqa: E402
+from seiten import oeffne  # noqa: E402
+
+WORKSPACE = "benchmark"
+
+
+def fuellen(storage, n_tasks, n_roles, seed=0):
+    """Sparse random assignments: about 10% of the cells carry a code"""
+    rng = np.random.default_rng(seed)
+    rollen = [f"Rolle {j}" for j in range(n_roles)]
+    for rolle in rollen:
+        storage.add_role(WORKSPACE, rolle)
+    codes = np.where(rng.random((n_tasks, n_roles)) < 0.1, rng.integers(1, len(CODES), (n_tasks, n_roles)), 0)
+    start = time.perf_counter()
+    for i, zeile in enumerate(codes):
+        spalten = np.flatnonzero(zeile)
+        storage.add_raci_task(WORKSPACE, f"Aufgabe {i}", {rollen[j]: CODES[zeile[j]] for j in spalten})
+    return time.perf_counter() - start
+
+
+def validieren_dicts(aufgaben, rollen):
+    """Per-task dict walk, as the checks would look without the array"""
+    verstoesse = {"mehrere_a": [], "kein_a": [], "kein_r": [], "rolle_ohne_zuweisung": []}
+    belegt = set()
+    for i, aufgabe in enumerate(aufgaben):
+        codes = list(aufgabe["zuweisungen"].values())
+        belegt.update(aufgabe["zuweisungen"])
+        if codes.count("A") > 1:
+            verstoesse["mehrere_a"].append(i)
+        if "A" not in codes:
+            verstoesse["kein_a"].append(i)
+        if "R" not in codes:
+            verstoesse["kein_r"].append(i)
+    verstoesse["rolle_ohne_zuweisung"] = [j for j, rolle in enumerate(rollen) if rolle not in belegt]
+    return verstoesse
+
+
+def best_of(fn, repeat=5):
+    zeiten = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        ergebnis = fn()
+        zeiten.append(time.perf_counter() - start)
+    return min(zeiten), ergebnis
+
+
+def rerun(db_url, repeat=3):
+    from streamlit.testing.v1 import AppTest
+
+    os.environ["DECISION_COMPASS_STORAGE"] = db_url
+    at = AppTest.from_file(str(ROOT / "app.py"), default_timeout=300)
+    at.query_params["ws"] = WORKSPACE
+    at.run()
+    oeffne(at, "raci_matrix").run()
+    dauer, _ = best_of(at.run, repeat)
+    assert not at.exception, at.exception
+    grid = at.get("dataframe")[0].proto
+    return dauer, len(grid.arrow_data.data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=5000)
+    parser.add_argument("--roles", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_url = f"sqlite:///{tmp}/bench.db"
+        for url in ("memory://", db_url):
+            storage = open_storage(url)
+            schreiben = fuellen(storage, args.tasks, args.roles)
+            laden, matrix = best_of(lambda: RaciMatrix.from_snapshot(storage.raci_snapshot(WORKSPACE)))
+            pruefen, verstoesse = best_of(matrix.validate)
+            liste, aufgaben = best_of(lambda: storage.list_raci_tasks(WORKSPACE))
+            legacy, erwartet = best_of(lambda: validieren_dicts(aufgaben, matrix.rollen))
+            assert {k: v.tolist() for k, v in verstoesse.items()} == erwartet
+            edit, _ = best_of(lambda: storage.set_raci_assignments(WORKSPACE, [(int(matrix.task_ids[7]), matrix.rollen[3], "A")]))
+            print(f"{url.split(':')[0]:>7}: {args.tasks}x{args.roles} inserts {schreiben:.2f}s, "
+                  f"snapshot + array {laden * 1000:.1f} ms, validate {pruefen * 1000:.2f} ms "
+                  f"(list_raci_tasks {liste * 1000:.1f} ms + dict checks {legacy * 1000:.1f} ms), cell edit {edit * 1000:.2f} ms")
+
+        dauer, payload = rerun(db_url)
+        legacy = sum(len(f"| Aufgabe {i} | " + " | ".join("-" * args.roles) + " |\n") for i in range(args.tasks))
+        print(f"page rerun with {args.tasks}x{args.roles}: {dauer * 1000:.0f} ms, grid payload {payload / 1024:.0f} KiB "
+              f"(markdown table ~{legacy / 1024:.0f} KiB)")
+
+
+if __name__ == "__main__":
+    main()
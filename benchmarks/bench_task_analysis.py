@@ -0,0 +1,41 @@
+"""Measure the task-analysis submit rerun for each progress mode.
+
+    python benchmarks/bench_task_analysis.py [--repeat 5]
+"""
+import argparse
+import os
+import statistics
+import time
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+from seiten import oeffne
+
+APP = str(Path(__file__).resolve().parent.parent / "app.py")
+
+
+def messe_submit(mode, repeat):
+    os.environ["DECISION_COMPASS_PROGRESS"] = mode
+    zeiten = []
+    for _ in range(repeat):
+        at = AppTest.from_file(APP, default_timeout=120).run()
+        oeffne(at, "task_analysis").run()
+        start = time.perf_counter()
+        at.button[0].click().run()
+        zeiten.append(time.perf_counter() - start)
+        assert not at.exception, at.exception
+    return zeiten
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    for mode in ("sleep", "static", "css"):
+        zeiten = messe_submit(mode, args.repeat)
+        print(f"{mode:>6}: median {statistics.median(zeiten) * 1000:7.1f} ms  min {min(zeiten) * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Team aggregate: cost of one new response as the team grows, online update vs. re-scanning.
+
+    python benchmarks/bench_team.py [--responses 100000] [--checkpoints 1000 10000 100000]
+
+"online" is ``team.erfasse_antwort`` against a SQLite store (read, update and write the
+aggregate row in one transaction). "rescan" is what a dashboard without running statistics
+pays: scoring all responses so far with ``scoring.bewerte_batch`` plus per-question variances.
+Both are timed as the median of 50 responses at each checkpoint; at the end the online
+aggregate is compared with the batch result.
+"""
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from decision_compass.scoring import bewerte_batch  # noqa: E402
+from decision_compass.sensitivity import ziehe_antworten  # noqa: E402
+from decision_compass.storage import open_storage  # noqa: E402
+from decision_compass.team import TeamStatistik, erfasse_antwort  # noqa: E402
+
+WORKSPACE, TEAM = "benchmark", "Team"
+PROBEN = 50
+
+
+def rescan(antworten):
+    ergebnis = bewerte_batch(antworten)
+    return ergebnis["punkte"][~ergebnis["keine_aufgabe"]].var(axis=0, ddof=1), antworten.var(axis=0, ddof=1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--responses", type=int, default=100_000)
+    parser.add_argument("--checkpoints", type=int, nargs="+", default=[1000, 10_000, 100_000])
+    args = parser.parse_args()
+
+    antworten = ziehe_antworten("latent", args.responses + PROBEN, np.random.default_rng(0)).astype(np.int64)
+    print(f"{'responses':>10} {'online ms':>10} {'rescan ms':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = open_storage(f"sqlite:///{tmp}/team.db")
+        # Fill up to each checkpoint in bulk, then time single responses there
+        statistik, n = TeamStatistik(), 0
+        for ziel in sorted(c for c in args.checkpoints if c <= args.responses):
+            for zeile in antworten[n:ziel]:
+                statistik.erfasse(zeile)
+            storage.update_team_stats(WORKSPACE, TEAM, lambda _: statistik.als_dict())
+            n = ziel
+            online, neu = [], []
+            for zeile in antworten[n:n + PROBEN]:
+                start = time.perf_counter()
+                erfasse_antwort(storage, WORKSPACE, TEAM, zeile)
+                online.append((time.perf_counter() - start) * 1000)
+            for i in range(1, 6):
+                start = time.perf_counter()
+                rescan(antworten[:n + i])
+                neu.append((time.perf_counter() - start) * 1000)
+            print(f"{n:>10} {statistics.median(online):>10.3f} {statistics.median(neu):>10.3f}")
+
+        gespeichert = TeamStatistik.aus_dict(storage.team_stats(WORKSPACE, TEAM))
+        typ_varianz, frage_varianz = rescan(antworten[:n + PROBEN])
+        gleich = (np.allclose(gespeichert.typ_m2 / (gespeichert.bewertet - 1), typ_varianz)
+                  and np.allclose(gespeichert.frage_m2 / (gespeichert.n - 1), frage_varianz))
+        print(f"online aggregate {'matches' if gleich else 'DIFFERS FROM'} the batch result ({gespeichert.n} responses)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Bytes sent and server CPU per rerun of the SWOT and Eisenhower views on a real server (Linux only).
+
+    python benchmarks/bench_templates.py [--lines 2000] [--items 1000] [--repeat 10] [--app-dir PATH]
+
+Uses the server and browser-session emulation of bench_fragments.py, including the
+browser's message cache, so repeated large messages arrive as references. Measured per
+step (mean of ``--repeat``): websocket bytes received, server CPU and wall time.
+
+- ``swot: rerun``: page rerun with ``--lines`` SWOT entries spread over the quadrants
+- ``swot: edit strengths``: one quadrant's text changes, the others stay the same
+- ``eisenhower: rerun`` / ``eisenhower: turn Q1 page``: board with ``--items`` tasks
+"""
+import argparse
+import sys
+import tempfile
+import time
+
+from bench_fragments import ROOT, Sitzung, app_server, cpu_s, zustand
+from decision_compass.i18n import get_text
+from decision_compass.storage import open_storage
+from suite import LANG, WORKSPACE, fuellen, swot_felder
+
+SWOT_LABELS = ("strengths_label", "weaknesses_label", "opportunities_label", "threats_label")
+
+
+def swot_zustaende(sitzung, felder):
+    return [zustand(sitzung.widget(get_text(label, LANG)), text) for label, text in zip(SWOT_LABELS, felder)]
+
+
+def schritt(sitzung, pid, repeat, aktion):
+    """Mean (bytes, CPU ms, wall ms) of ``aktion(i)``, which sends one rerun request"""
+    bytes_ = cpu = wand = 0
+    for i in range(1, repeat + 1):
+        sitzung.leeren(0.3)
+        vorher_bytes, vorher_cpu, start = sitzung.bytes, cpu_s(pid), time.perf_counter()
+        aktion(i)
+        sitzung.warten()
+        wand += time.perf_counter() - start
+        cpu += cpu_s(pid) - vorher_cpu
+        bytes_ += sitzung.bytes - vorher_bytes
+    return bytes_ / repeat, cpu / repeat * 1000, wand / repeat * 1000
+
+
+def messen(ws, pid, lines, repeat):
+    sitzung = Sitzung(ws)
+    felder = swot_felder(lines)
+    ergebnisse = {}
+
+    sitzung.oeffne("swot_analysis")
+    sitzung.senden(swot_zustaende(sitzung, felder) + [zustand(sitzung.widget(get_text("swot_create", LANG)), True)])
+    sitzung.warten()
+    ergebnisse["swot: rerun"] = schritt(sitzung, pid, repeat, lambda i: sitzung.senden(swot_zustaende(sitzung, felder)))
+
+    def bearbeiten(i):
+        geaendert = [felder[0] + f"\nNeuer Punkt {i}"] + felder[1:]
+        widget = sitzung.widget(get_text(SWOT_LABELS[0], LANG))
+        sitzung.senden(swot_zustaende(sitzung, geaendert), fragment_id=widget[2])
+
+    ergebnisse["swot: edit strengths"] = schritt(sitzung, pid, repeat, bearbeiten)
+
+    sitzung.oeffne("eisenhower_matrix")
+    ergebnisse["eisenhower: rerun"] = schritt(sitzung, pid, repeat, lambda i: sitzung.senden())
+
+    def blaettern(i):
+        widget = next(w for w in sitzung.widgets.values() if w[0] == "number_input")
+        sitzung.senden([zustand(widget, 2 - i % 2)], fragment_id=widget[2])
+
+    ergebnisse["eisenhower: turn Q1 page"] = schritt(sitzung, pid, repeat, blaettern)
+    return ergebnisse
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=2000, help="SWOT entries over all quadrants")
+    parser.add_argument("--items", type=int, default=1000, help="Stored Eisenhower tasks (and other modules)")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--app-dir", default=str(ROOT), help="Checkout whose app.py is served")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{tmp}/templates.db"
+        fuellen(open_storage(url), args.items)
+        with app_server(args.app_dir, url) as (ws, pid):
+            ergebnisse = messen(ws, pid, args.lines, args.repeat)
+
+    print(f"{'step':<28} {'KiB sent':>9} {'server CPU ms':>13} {'wall ms':>8}")
+    for name, (bytes_, cpu, wand) in ergebnisse.items():
+        print(f"{name:<28} {bytes_ / 1024:>9.1f} {cpu:>13.0f} {wand:>8.0f}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
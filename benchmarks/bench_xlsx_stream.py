@@ -0,0 +1,76 @@
+"""XLSX export at scale: peak RSS and time, pandas ExcelWriter defaults vs. the constant_memory writer.
+
+    python benchmarks/bench_xlsx_stream.py [--sizes 10000 100000] [--roles 12]
+
+Every measurement runs in a fresh interpreter; the peak is measured after the input
+DataFrame exists, so it covers the writer alone.
+"""
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = str(Path(__file__).resolve().parent.parent)
+
+PROBE = """
+import io, json, resource, sys, time
+sys.path.insert(0, {root!r})
+import numpy as np
+import pandas as pd
+from decision_compass.export import dataframes_to_xlsx
+
+n, roles, art, writer = {n}, {roles}, {art!r}, {writer!r}
+rng = np.random.default_rng(0)
+if art == "raci":
+    codes = np.array(list("-RACI"))[np.where(rng.random((n, roles)) < 0.3, rng.integers(1, 5, (n, roles)), 0)]
+    data = pd.DataFrame(codes, columns=[f"Rolle {{j}}" for j in range(roles)])
+    data.insert(0, "Aufgabe", [f"Arbeitspaket {{i}}" for i in range(n)])
+else:
+    data = pd.DataFrame({{
+        "perspektive": rng.choice(["Finanzen", "Kunden", "Prozesse", "Lernen"], n),
+        "bereich": [f"Bereich {{i % 40}}" for i in range(n)],
+        "ziel": [f"Ziel {{i}}: Marktanteil im Segment {{i % 97}} ausbauen" for i in range(n)],
+        "kennzahl": "Umsatz EUR", "zielwert": rng.random(n) * 1e6,
+        "istwert": np.where(rng.random(n) < 0.2, np.nan, rng.random(n) * 1e6),
+        "gewicht": rng.integers(1, 5, n), "massnahmen": "Vertrieb schulen, Kampagne starten",
+    }})
+import xlsxwriter
+
+def legacy():
+    output = io.BytesIO()
+    with pd.ExcelWriter(output, engine="xlsxwriter") as w:
+        data.to_excel(w, index=False, sheet_name="Results")
+    return output.getvalue()
+
+vorher = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+daten = legacy() if writer == "legacy" else dataframes_to_xlsx({{"Results": data}})
+dauer = time.perf_counter() - start
+nachher = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{"peak_rss_delta_mb": (nachher - vorher) / 1024, "xlsx_mb": len(daten) / 1e6, "seconds": dauer}}))
+"""
+
+
+def messen(n, roles, art, writer):
+    probe = PROBE.format(root=ROOT, n=n, roles=roles, art=art, writer=writer)
+    out = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--roles", type=int, default=12)
+    args = parser.parse_args()
+
+    print(f"{'table':<6} {'rows':>7} {'writer':<10} {'seconds':>8} {'peak MB':>8} {'xlsx MB':>8}")
+    for art in ("raci", "bsc"):
+        for n in args.sizes:
+            for writer in ("legacy", "streaming"):
+                r = messen(n, args.roles, art, writer)
+                print(f"{art:<6} {n:>7} {writer:<10} {r['seconds']:>8.2f} {r['peak_rss_delta_mb']:>8.1f} {r['xlsx_mb']:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Markup check for PDF reports: user text with ``<``, ``>`` and ``&`` must render verbatim.
+
+    python benchmarks/check_report_markup.py
+
+Builds a report whose title, chapter, section title, section text and table cells
+contain reportlab markup characters, and checks that the paragraphs keep the text
+as typed. Exits with status 1 when building fails or a text was altered.
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from decision_compass.report import ReportTabelle, Spalte, _abschnitte_story, _Stile, baue_report  # noqa: E402
+
+TEXT = "<x> & y"
+ABSCHNITTE = {f"Stärken {TEXT}": f"{TEXT}\nzweite Zeile a<b", "Zahl <1>": 3}
+
+
+def main():
+    fehler = []
+    try:
+        tabelle = ReportTabelle(TEXT, [Spalte(TEXT, "kurz"), Spalte("Text", "text")], [(TEXT, f"{TEXT} " * 40)])
+        pdf = baue_report(f"Titel {TEXT}", [(f"Kapitel {TEXT}", ABSCHNITTE, [tabelle])]).getvalue()
+        if not pdf.startswith(b"%PDF"):
+            fehler.append("the report is not a PDF")
+    except Exception as exc:
+        fehler.append(f"building the report failed: {exc!r}")
+
+    erwartet = [f"Stärken {TEXT}", f"{TEXT}zweite Zeile a<b", "Zahl <1>", "3"]
+    try:
+        texte = [p.getPlainText() for p in _abschnitte_story(ABSCHNITTE, _Stile().styles) if hasattr(p, "getPlainText")]
+        if texte != erwartet:
+            fehler.append(f"section paragraphs read {texte!r}, expected {erwartet!r}")
+    except Exception as exc:
+        fehler.append(f"building the sections failed: {exc!r}")
+
+    for meldung in fehler:
+        print(f"FAIL: {meldung}")
+    if fehler:
+        return 1
+    print(f"OK: {TEXT!r} rendered verbatim")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+"""Startup budget check: a cold first run of app.py must stay fast and must not load export backends.
+
+    python benchmarks/import_budget.py [--budget-ms 1500]
+
+Exits with status 1 when the budget is exceeded or reportlab/xlsxwriter/openpyxl
+got imported without an export being requested.
+"""
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+APP = str(Path(__file__).resolve().parent.parent / "app.py")
+EXPORT_BACKENDS = ("reportlab", "xlsxwriter", "openpyxl")
+SEITEN = ("task_analysis", "swot_analysis", "eisenhower_matrix", "raci_matrix", "balanced_scorecard")
+
+# Runs in a fresh interpreter so nothing is cached from a previous import
+PROBE = """
+import json, sys, time
+from streamlit.testing.v1 import AppTest
+from streamlit.util import calc_hash
+start = time.perf_counter()
+at = AppTest.from_file({app!r}, default_timeout=60)
+at.run()
+for seite in {seiten!r}:
+    at._page_hash = calc_hash(seite)  # st.navigation page by url path
+    at.run()
+elapsed = time.perf_counter() - start
+loaded = sorted({{name.split(".")[0] for name in sys.modules}} & set({backends!r}))
+print(json.dumps({{"first_run_ms": elapsed * 1000, "loaded_backends": loaded, "exception": bool(at.exception)}}))
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=1500.0, help="Budget for the first run through all pages")
+    args = parser.parse_args()
+
+    probe = PROBE.format(app=APP, backends=EXPORT_BACKENDS, seiten=SEITEN)
+    out = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+    result = json.loads(out.stdout.strip().splitlines()[-1])
+    print(json.dumps(result))
+
+    fehler = []
+    if result["exception"]:
+        fehler.append("app raised an exception")
+    if result["loaded_backends"]:
+        fehler.append(f"export backends imported at startup: {', '.join(result['loaded_backends'])}")
+    if result["first_run_ms"] > args.budget_ms:
+        fehler.append(f"first run took {result['first_run_ms']:.0f} ms (budget {args.budget_ms:.0f} ms)")
+    for meldung in fehler:
+        print(f"FAIL: {meldung}", file=sys.stderr)
+    return 1 if fehler else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
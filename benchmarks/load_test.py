@@ -0,0 +1,164 @@
+"""Load test of the HTTP API: latency percentiles and throughput under concurrent clients.
+
+    python benchmarks/load_test.py [--concurrency 16] [--duration 10] [--items 1000] [--export-workers 2]
+    python benchmarks/load_test.py --url http://127.0.0.1:8765 --scenarios score raci
+
+Starts ``python -m decision_compass.api`` on a free port against a temporary SQLite store
+filled with ``--items`` rows per module (or uses a running server with ``--url``; the
+stored-export scenario then needs workspace ``benchmark``). Each scenario keeps
+``--concurrency`` keep-alive connections busy for ``--duration`` seconds:
+
+- ``score``: one questionnaire; ``score_batch``: 100 questionnaires per request
+- ``raci``: validation of a 50 x 8 RACI table
+- ``export_cached``: stored RACI matrix as XLSX (served from the artifact cache after the first request)
+- ``export_render``: Eisenhower PDF of 200 posted tasks, different in every request (rendered in the pool)
+- ``mixed``: half the clients score, the other half render PDFs; the score latency shows whether exports stall the loop
+
+Compare ``--export-workers 0`` (exports rendered in threads of the server process) with the default.
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from urllib.parse import urlsplit
+
+import numpy as np
+
+from suite import ROOT, WORKSPACE, fuellen
+from decision_compass.storage import open_storage
+
+SZENARIEN = ("score", "score_batch", "raci", "export_cached", "export_render", "mixed")
+
+
+# --- Requests ---
+def anfragen(art, rng):
+    """Endless generator of (kind, method, path, JSON body or None) for one client"""
+    while True:
+        if art == "score":
+            yield art, "POST", "/score", {"antworten": rng.integers(1, 8, 12).tolist()}
+        elif art == "score_batch":
+            yield art, "POST", "/score", {"antworten": rng.integers(1, 8, (100, 12)).tolist()}
+        elif art == "raci":
+            codes = np.array(["R", "A", "C", "I", "-", "-", "-"])[rng.integers(0, 7, (50, 8))]
+            yield art, "POST", "/raci", {"aufgaben": [{"Aufgabe": f"Paket {i}", **{f"Rolle {j}": c for j, c in enumerate(zeile)}}
+                                                      for i, zeile in enumerate(codes.tolist())]}
+        elif art == "export_cached":
+            yield art, "GET", f"/workspaces/{WORKSPACE}/raci_matrix.xlsx", None
+        else:
+            marke = rng.integers(1 << 62)
+            yield art, "POST", "/export/eisenhower_matrix.pdf", {"tasks": [
+                {"beschreibung": f"Aufgabe {i} ({marke})", "wichtigkeit": "Wichtig" if i % 2 else "Nicht wichtig",
+                 "dringlichkeit": "Dringend" if i % 3 else "Nicht dringend"} for i in range(200)
+            ]}
+
+
+async def senden(reader, writer, host, methode, pfad, daten):
+    """One request on a keep-alive connection; returns the status code"""
+    body = json.dumps(daten).encode() if daten is not None else b""
+    writer.write(f"{methode} {pfad} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+    kopf = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1").split("\r\n")
+    laenge = next(int(z.split(":", 1)[1]) for z in kopf if z.lower().startswith("content-length:"))
+    await reader.readexactly(laenge)
+    return int(kopf[0].split(" ")[1])
+
+
+async def client(host, port, szenario, ende, seed, messungen):
+    rng = np.random.default_rng(seed)
+    if szenario == "mixed":
+        szenario = "score" if seed % 2 else "export_render"
+    reader, writer = await asyncio.open_connection(host, port, limit=1 << 20)
+    try:
+        for art, methode, pfad, daten in anfragen(szenario, rng):
+            if time.perf_counter() >= ende:
+                break
+            start = time.perf_counter()
+            status = await senden(reader, writer, host, methode, pfad, daten)
+            messungen.setdefault(art, []).append((time.perf_counter() - start, status))
+    finally:
+        writer.close()
+
+
+async def szenario_laufen(host, port, szenario, concurrency, dauer):
+    messungen = {}
+    start = time.perf_counter()
+    await asyncio.gather(*(client(host, port, szenario, start + dauer, i, messungen) for i in range(concurrency)))
+    return messungen, time.perf_counter() - start
+
+
+def auswerten(messungen, sekunden):
+    """{request kind: (requests, errors, req/s, p50 ms, p99 ms)}"""
+    ergebnis = {}
+    for art, werte in messungen.items():
+        latenz = np.array([dauer for dauer, _ in werte]) * 1000
+        fehler = sum(status >= 400 for _, status in werte)
+        ergebnis[art] = (len(werte), fehler, len(werte) / sekunden, np.percentile(latenz, 50), np.percentile(latenz, 99))
+    return ergebnis
+
+
+# --- Server ---
+def freier_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def warten(host, port, prozess, timeout=60):
+    grenze = time.time() + timeout
+    while time.time() < grenze:
+        if prozess.poll() is not None:
+            raise RuntimeError(f"API server exited with status {prozess.returncode}")
+        try:
+            with socket.create_connection((host, port), timeout=1):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError("API server did not start")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent keep-alive connections")
+    parser.add_argument("--duration", type=float, default=10, help="Seconds per scenario")
+    parser.add_argument("--scenarios", nargs="+", choices=SZENARIEN, default=list(SZENARIEN))
+    parser.add_argument("--items", type=int, default=1000, help="Stored rows per module")
+    parser.add_argument("--export-workers", type=int, default=2, help="DECISION_COMPASS_EXPORT_WORKERS of the started server")
+    parser.add_argument("--url", help="Use a running API server instead of starting one")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        prozess = None
+        if args.url:
+            ziel = urlsplit(args.url)
+            host, port = ziel.hostname, ziel.port or 80
+        else:
+            host, port = "127.0.0.1", freier_port()
+            url = f"sqlite:///{tmp}/load.db"
+            fuellen(open_storage(url), args.items)
+            env = dict(os.environ, DECISION_COMPASS_EXPORT_WORKERS=str(args.export_workers), DECISION_COMPASS_API_MAX_EXPORTS="1000")
+            prozess = subprocess.Popen([sys.executable, "-m", "decision_compass.api", "--host", host, "--port", str(port), "--storage", url],
+                                       cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            if prozess is not None:
+                warten(host, port, prozess)
+            print(f"{'scenario':<14} {'request':<14} {'requests':>8} {'errors':>6} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8}")
+            for szenario in args.scenarios:
+                # Warm-up: first renders, cache fill, pool start-up
+                asyncio.run(szenario_laufen(host, port, szenario, 1, min(1.0, args.duration)))
+                messungen, sekunden = asyncio.run(szenario_laufen(host, port, szenario, args.concurrency, args.duration))
+                for art, (anzahl, fehler, rate, p50, p99) in auswerten(messungen, sekunden).items():
+                    print(f"{szenario:<14} {art:<14} {anzahl:>8} {fehler:>6} {rate:>8.1f} {p50:>8.1f} {p99:>8.1f}")
+        finally:
+            if prozess is not None:
+                prozess.terminate()
+                prozess.wait()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
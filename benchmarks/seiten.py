@@ -0,0 +1,12 @@
+"""Page selection for AppTest runs of app.py, shared by the benchmark scripts."""
+from streamlit.util import calc_hash
+
+
+def oeffne(at, seite):
+    """Select a page of st.navigation by its url path (e.g. ``"raci_matrix"``) for the next ``at.run()``
+
+    AppTest.switch_page only resolves file pages; callable pages are addressed by the
+    hash of their url path, which is what the browser sends as well.
+    """
+    at._page_hash = calc_hash(seite)
+    return at
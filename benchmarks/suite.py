@@ -0,0 +1,249 @@
+"""Benchmark suite: page reruns, task-analysis submit and every module export, written as JSON.
+
+    python benchmarks/suite.py [--sizes 100 1000 5000] [--repeat 5] [-o results.json]
+    python benchmarks/suite.py --baseline release.json [--threshold 0.25] [-o results.json]
+
+The app runs headless through Streamlit's AppTest against a temporary SQLite store
+filled with synthetic data (``--sizes`` items per module). Measured:
+
+- ``rerun/<page>/<n>``: median warm rerun of each navigation target
+- ``submit/task_analysis``: rerun triggered by the questionnaire's submit button
+- ``export/<module>/<fmt>/<n>``: build time and peak Python allocations of each PDF/XLSX/CSV export
+
+With ``--baseline`` every metric present in both files is compared; the exit status is 1
+when one got slower (or bigger) by more than ``--threshold`` and by more than the absolute
+noise floor (``--min-delta-ms`` / ``--min-delta-mib``).
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import streamlit as st
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from decision_compass.bundle import (  # noqa: E402
+    analyse_export, bsc_export, eisenhower_export, raci_export, render_modul, swot_export
+)
+from decision_compass.i18n import get_text  # noqa: E402
+from decision_compass.raci import CODES, RaciMatrix  # noqa: E402
+from decision_compass.scoring import FRAGEN  # noqa: E402
+from decision_compass.storage import PERSPEKTIVEN, open_storage  # noqa: E402
+from seiten import oeffne  # noqa: E402
+
+WORKSPACE = "benchmark"
+LANG = "DE"
+SEITEN = ("start", "task_analysis", "swot_analysis", "eisenhower_matrix", "raci_matrix", "balanced_scorecard")
+FORMATE = ("pdf", "xlsx", "csv")
+
+
+# --- Synthetic data ---
+def antworten(seed=0):
+    rng = np.random.default_rng(seed)
+    return [(frage["typ"], int(wert)) for frage, wert in zip(FRAGEN, rng.integers(1, 8, len(FRAGEN)))]
+
+
+def swot_felder(n, seed=0):
+    """Four text fields with ``n`` lines spread over them"""
+    rng = np.random.default_rng(seed)
+    teil = rng.integers(0, 4, n)
+    return ["\n".join(f"Punkt {i}: Marktposition im Segment {i % 13}" for i in np.flatnonzero(teil == k)) for k in range(4)]
+
+
+def fuellen(storage, n, roles=12, seed=0):
+    """``n`` Eisenhower tasks, RACI rows (``roles`` roles, ~20% assigned) and BSC objectives"""
+    rng = np.random.default_rng(seed)
+    wichtig, dringend = get_text("importance_options", LANG), get_text("urgency_options", LANG)
+    q = rng.integers(0, 4, n)
+    storage.add_tasks(WORKSPACE, [(f"Aufgabe {i}: Angebot prüfen", wichtig[q[i] // 2], dringend[q[i] % 2], f"Q{q[i] + 1}") for i in range(n)])
+    rollen = [f"Rolle {j}" for j in range(roles)]
+    for rolle in rollen:
+        storage.add_role(WORKSPACE, rolle)
+    codes = np.where(rng.random((n, roles)) < 0.2, rng.integers(1, len(CODES), (n, roles)), 0)
+    storage.add_raci_tasks(WORKSPACE, [
+        (f"Arbeitspaket {i}", {rollen[j]: CODES[c] for j, c in enumerate(zeile) if c}) for i, zeile in enumerate(codes.tolist())
+    ])
+    storage.add_objectives(WORKSPACE, [
+        {"perspektive": PERSPEKTIVEN[i % 4], "bereich": f"Bereich {i % 7}", "ziel": f"Ziel {i}", "kennzahl": "Umsatz",
+         "zielwert": round(float(rng.random() * 1e5), 2), "istwert": None if i % 5 == 0 else round(float(rng.random() * 1e5), 2),
+         "gewicht": float(i % 3 + 1), "massnahmen": "Kampagne"}
+        for i in range(n)
+    ])
+
+
+# --- Measurements ---
+def median_ms(fn, repeat):
+    zeiten = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        zeiten.append((time.perf_counter() - start) * 1000)
+    return {"ms": statistics.median(zeiten), "min_ms": min(zeiten)}
+
+
+def app_test(n):
+    from streamlit.testing.v1 import AppTest
+
+    # The questionnaire's label-less sliders warn on every rerun (Streamlit resets logger levels, so disable it)
+    logging.getLogger("streamlit.elements.lib.policies").disabled = True
+    at = AppTest.from_file(str(ROOT / "app.py"), default_timeout=600)
+    at.query_params["ws"] = WORKSPACE
+    at.session_state["analyse_antworten"] = antworten()
+    at.session_state["swot_felder"] = swot_felder(n)
+    at.session_state["swot_erstellt"] = True
+    return at.run()
+
+
+def pruefe(at):
+    assert not at.exception, [e.value for e in at.exception]
+
+
+def reruns(n, repeat):
+    """Warm rerun of every page with ``n`` items per module"""
+    at = app_test(n)
+    ergebnisse = {}
+    for seite in SEITEN:
+        oeffne(at, seite).run()
+        pruefe(at)
+        ergebnisse[f"rerun/{seite}/{n}"] = median_ms(at.run, repeat)
+        pruefe(at)
+    return ergebnisse
+
+
+def submit(repeat):
+    at = app_test(0)
+    oeffne(at, "task_analysis").run()
+    ergebnis = median_ms(lambda: at.button[0].click().run(), repeat)
+    pruefe(at)
+    return {"submit/task_analysis": ergebnis}
+
+
+def exporte(storage, n, repeat):
+    """Time (median of plain runs) and peak allocations (one traced run) per module and format"""
+    inhalte = {
+        "task_analysis": analyse_export(antworten(), LANG),
+        "swot_analysis": swot_export(swot_felder(n), LANG),
+        "eisenhower_matrix": eisenhower_export(storage.list_tasks(WORKSPACE), LANG),
+        "raci_matrix": raci_export(RaciMatrix.from_snapshot(storage.raci_snapshot(WORKSPACE)), LANG),
+        "balanced_scorecard": bsc_export(storage.list_objectives(WORKSPACE), LANG),
+    }
+    ergebnisse = {}
+    for name, inhalt in inhalte.items():
+        for fmt in FORMATE:
+            bauen = lambda: render_modul(inhalt, fmt, LANG)  # noqa: E731
+            messung = median_ms(bauen, repeat)
+            tracemalloc.start()
+            groesse = len(bauen())
+            messung["peak_mib"] = tracemalloc.get_traced_memory()[1] / 2**20
+            tracemalloc.stop()
+            messung["bytes"] = groesse
+            ergebnisse[f"export/{name}/{fmt}/{n}"] = messung
+    return ergebnisse
+
+
+def git_rev():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def frischer_store(url):
+    """Point the app at ``url``; AppTest runs in this process, so the cached storage and BSC index must go too"""
+    os.environ["DECISION_COMPASS_STORAGE"] = url
+    st.cache_resource.clear()
+
+
+def lauf(sizes, repeat, export_repeat):
+    ergebnisse = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            url = f"sqlite:///{tmp}/suite_{n}.db"
+            storage = open_storage(url)
+            fuellen(storage, n)
+            frischer_store(url)
+            print(f"[{n} items] page reruns …", file=sys.stderr)
+            ergebnisse.update(reruns(n, repeat))
+            print(f"[{n} items] exports …", file=sys.stderr)
+            ergebnisse.update(exporte(storage, n, export_repeat))
+        frischer_store(f"sqlite:///{tmp}/suite_submit.db")
+        ergebnisse.update(submit(repeat))
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git": git_rev(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "sizes": sizes,
+            "repeat": repeat,
+        },
+        "results": ergebnisse,
+    }
+
+
+# --- Comparison ---
+def vergleiche(basis, neu, threshold, min_ms, min_mib):
+    """[(metric, field, old, new, change)] for every shared value and the list of regressions among them"""
+    zeilen, regressionen = [], []
+    for name, werte in sorted(neu["results"].items()):
+        alt = basis["results"].get(name)
+        if alt is None:
+            continue
+        for feld, boden in (("ms", min_ms), ("peak_mib", min_mib)):
+            if feld not in werte or feld not in alt:
+                continue
+            aenderung = werte[feld] / alt[feld] - 1 if alt[feld] else 0.0
+            zeile = (name, feld, alt[feld], werte[feld], aenderung)
+            zeilen.append(zeile)
+            if aenderung > threshold and werte[feld] - alt[feld] > boden:
+                regressionen.append(zeile)
+    return zeilen, regressionen
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per rerun measurement (median is reported)")
+    parser.add_argument("--export-repeat", type=int, default=3, help="Runs per export measurement")
+    parser.add_argument("-o", "--output", help="Write the results JSON here (default: stdout)")
+    parser.add_argument("--baseline", help="Results JSON of a previous release to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed relative slowdown/growth (0.25 = +25%%)")
+    parser.add_argument("--min-delta-ms", type=float, default=20.0, help="Ignore slowdowns smaller than this")
+    parser.add_argument("--min-delta-mib", type=float, default=1.0, help="Ignore memory growth smaller than this")
+    args = parser.parse_args()
+
+    ergebnis = lauf(args.sizes, args.repeat, args.export_repeat)
+    text = json.dumps(ergebnis, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+    if args.baseline:
+        basis = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        zeilen, regressionen = vergleiche(basis, ergebnis, args.threshold, args.min_delta_ms, args.min_delta_mib)
+        for name, feld, alt, neu, aenderung in zeilen:
+            markierung = "  REGRESSION" if (name, feld, alt, neu, aenderung) in regressionen else ""
+            print(f"{name:<45} {feld:<8} {alt:>10.1f} -> {neu:>10.1f} {aenderung:>+7.0%}{markierung}", file=sys.stderr)
+        if regressionen:
+            print(f"FAIL: {len(regressionen)} metric(s) regressed by more than {args.threshold:.0%} "
+                  f"(baseline {basis['meta'].get('git')})", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
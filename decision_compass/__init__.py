@@ -0,0 +1 @@
+"""Decision Compass – importable building blocks of the Streamlit app."""
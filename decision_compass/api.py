@@ -0,0 +1,567 @@
+"""Local HTTP API: questionnaire scoring, the matrix modules and their exports without Streamlit.
+
+    python -m decision_compass.api [--host 127.0.0.1] [--port 8765] [--storage sqlite:///decision_compass.db]
+
+A small HTTP/1.1 server on asyncio streams (keep-alive, JSON in and out, no extra
+dependencies). Scoring is answered on the event loop, table validation and storage
+calls run in threads, and PDF/XLSX/CSV files are rendered in the export process pool
+of ``bundle.export_pool``, so a long export never stalls the other requests. Files go
+through the artifact cache; identical exports requested at the same time are rendered once.
+Each file of a ZIP bundle counts as one export against ``DECISION_COMPASS_API_MAX_EXPORTS``.
+
+    GET  /health
+    GET  /metrics                               requests, latencies and the artifact cache (Prometheus text)
+    POST /score                                 {"antworten": [12 answers] | [[12 answers], ...], "schwellenwert", "workspace" + "team"}
+    POST /eisenhower                            {"tasks": [{"beschreibung", "wichtigkeit", "dringlichkeit"}], "workspace"}
+    POST /raci                                  {"aufgaben": [{"Aufgabe", "<role>": "R" | "A" | "C" | "I" | "-"}], "workspace"}
+    POST /bsc                                   {"ziele": [{"perspektive", "ziel", "kennzahl", "zielwert", "istwert", ...}], "workspace"}
+    POST /export/<module>.<pdf|xlsx|csv>        module content in the body ("antworten", "felder", "tasks", "aufgaben" or "ziele")
+    GET  /workspaces/<ws>/<module>.<fmt>        export of a stored module (eisenhower_matrix, raci_matrix, balanced_scorecard)
+    GET  /workspaces/<ws>/bundle.<xlsx|pdf|zip> all stored modules in one file
+
+Table rows take the field names or column titles of the CSV import; with "workspace"
+the valid ones are stored, rejected ones come back in "fehler" like the import report.
+The language is "lang" in the body or the query string (default: first catalog language).
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import logging
+import math
+import re
+import signal
+import sys
+import time
+from collections import Counter, defaultdict, namedtuple
+from http import HTTPStatus
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import numpy as np
+import pandas as pd
+
+from decision_compass.bsc import ROLLUP_SPALTEN, BscIndex
+from decision_compass.bundle import (
+    analyse_export, bsc_export, bundle_schluessel, eisenhower_export, export_pool, modul_schluessel, raci_export, render_bundle,
+    render_modul, sammle_module, store_tabelle, swot_export, zip_archiv, zip_auftraege
+)
+from decision_compass.cache import artifact_cache
+from decision_compass.config import api_settings, export_workers, storage_url
+from decision_compass.export import csv_datei
+from decision_compass.formats import BUNDLE_FORMATE, BUNDLE_MIME, MODUL_MIME
+from decision_compass.i18n import available_languages, get_text
+from decision_compass.importer import pruefe_objectives, pruefe_raci, pruefe_tasks
+from decision_compass.raci import REGELN, RaciMatrix
+from decision_compass.scoring import FRAGEN, SCHWELLENWERT_HYBRID, TYPEN, bewerte_batch, hybrid_bezeichnungen, validiere_antwortmatrix
+from decision_compass.storage import PERSPEKTIVEN, QUADRANTEN, TASK_FIELDS, open_storage
+from decision_compass.team import erfasse_antworten
+
+logger = logging.getLogger(__name__)
+
+MODUL_FELD = {
+    "task_analysis": "antworten", "swot_analysis": "felder", "eisenhower_matrix": "tasks",
+    "raci_matrix": "aufgaben", "balanced_scorecard": "ziele",
+}
+GESPEICHERT = ("eisenhower_matrix", "raci_matrix", "balanced_scorecard")
+INLINE_ZEILEN = 1000  # larger answer matrices are scored in a thread
+INLINE_BYTES = 64 * 1024  # larger bodies are parsed in a thread
+LATENZ_GRENZEN = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+ROUTEN = [
+    ("GET", re.compile(r"/health"), "health"),
+    ("GET", re.compile(r"/metrics"), "metrics"),
+    ("POST", re.compile(r"/score"), "score"),
+    ("POST", re.compile(r"/eisenhower"), "eisenhower"),
+    ("POST", re.compile(r"/raci"), "raci"),
+    ("POST", re.compile(r"/bsc"), "bsc"),
+    ("POST", re.compile(r"/export/(?P<modul>\w+)\.(?P<fmt>\w+)"), "export"),
+    ("GET", re.compile(r"/workspaces/(?P<ws>[^/]+)/(?P<modul>\w+)\.(?P<fmt>\w+)"), "workspace_export"),
+]
+
+# status: HTTPStatus, body: bytes, typ: Content-Type, kopf: extra (name, value) headers
+Antwort = namedtuple("Antwort", ["status", "body", "typ", "kopf"], defaults=("application/json", ()))
+
+
+class HttpFehler(Exception):
+    """Ends a request with ``status`` and the JSON body {"fehler": text, **details}"""
+
+    def __init__(self, status, text, **details):
+        super().__init__(text)
+        self.status = status
+        self.details = details
+
+
+# --- Request and response bodies ---
+def _sauber(wert):
+    """JSON-ready copy: NumPy values as Python values, NaN and infinity as null"""
+    if isinstance(wert, dict):
+        return {str(k): _sauber(v) for k, v in wert.items()}
+    if isinstance(wert, (list, tuple)):
+        return [_sauber(v) for v in wert]
+    if isinstance(wert, np.ndarray):
+        return _sauber(wert.tolist())
+    if isinstance(wert, np.generic):
+        wert = wert.item()
+    if isinstance(wert, float) and not math.isfinite(wert):
+        return None
+    return wert
+
+
+def json_antwort(daten, status=HTTPStatus.OK, kopf=()):
+    return Antwort(status, json.dumps(_sauber(daten), ensure_ascii=False).encode("utf-8"), "application/json", kopf)
+
+
+def _json(body):
+    try:
+        daten = json.loads(body) if body else {}
+    except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+        raise HttpFehler(HTTPStatus.BAD_REQUEST, f"Body is not valid JSON: {exc}")
+    if not isinstance(daten, dict):
+        raise HttpFehler(HTTPStatus.BAD_REQUEST, "Body must be a JSON object")
+    return daten
+
+
+def sprache(daten, query):
+    lang = str(daten.get("lang") or query.get("lang", [""])[0] or available_languages()[0]).upper()
+    if lang not in available_languages():
+        raise HttpFehler(HTTPStatus.BAD_REQUEST, f"Unknown language {lang!r}, expected one of {', '.join(available_languages())}")
+    return lang
+
+
+def workspace(wert):
+    """Workspace id as accepted in the app's URL (alphanumeric, at most 64 characters)"""
+    if not isinstance(wert, str) or not wert.isalnum() or len(wert) > 64:
+        raise HttpFehler(HTTPStatus.BAD_REQUEST, "Workspace ids are alphanumeric with at most 64 characters")
+    return wert
+
+
+def antwortmatrix(daten):
+    """(answer matrix, single response?) from "antworten": one list of 12 answers or a list of them"""
+    antworten = daten.get("antworten")
+    if not isinstance(antworten, list) or not antworten:
+        raise HttpFehler(HTTPStatus.BAD_REQUEST, f'"antworten" must be a list of {len(FRAGEN)} answers or a list of such lists')
+    einzeln = not isinstance(antworten[0], list)
+    try:
+        return validiere_antwortmatrix(np.asarray([antworten] if einzeln else antworten)), einzeln
+    except ValueError as exc:
+        raise HttpFehler(HTTPStatus.BAD_REQUEST, str(exc))
+
+
+def tabelle(daten, feld):
+    """Rows of ``feld`` as a DataFrame of strings, the shape ``importer.pruefe_*`` reads from a file"""
+    zeilen = daten.get(feld)
+    if not isinstance(zeilen, list) or not all(isinstance(zeile, dict) for zeile in zeilen):
+        raise HttpFehler(HTTPStatus.BAD_REQUEST, f'"{feld}" must be a list of objects')
+    df = pd.DataFrame(zeilen, dtype=object)
+    df.columns = [str(spalte).strip() for spalte in df.columns]
+    return df.where(df.notna(), "").astype(str)
+
+
+def fehler_zeilen(bericht):
+    """Rejected rows of an import report; ``zeile`` counts like a file with a header line"""
+    fehler = bericht.fehler() if callable(bericht.fehler) else bericht.fehler
+    return fehler.astype(object).where(fehler.notna(), None).to_dict("records")
+
+
+def pruefe(modul, daten, lang, streng=False):
+    """Validated rows of a module table: (rows, roles or None, rejected rows); ``streng`` rejects the request instead"""
+    df = tabelle(daten, MODUL_FELD[modul])
+    rollen = None
+    if modul == "eisenhower_matrix":
+        zeilen, bericht = pruefe_tasks(df, lang)
+    elif modul == "raci_matrix":
+        zeilen, rollen, bericht = pruefe_raci(df, lang)
+    else:
+        zeilen, bericht = pruefe_objectives(df, lang)
+    fehler = fehler_zeilen(bericht)
+    if streng and fehler:
+        raise HttpFehler(HTTPStatus.BAD_REQUEST, f"{len({f['zeile'] for f in fehler})} rows were rejected", zeilen=fehler)
+    return zeilen or [], rollen or [], fehler
+
+
+def raci_matrix(zeilen, rollen):
+    return RaciMatrix.from_records([{"beschreibung": text, "zuweisungen": zuweisungen} for text, zuweisungen in zeilen], rollen)
+
+
+def modul_inhalt(modul, daten, lang):
+    """ModulExport of module content posted in a request body, None without content"""
+    if modul == "task_analysis":
+        matrix, einzeln = antwortmatrix(daten)
+        if not einzeln:
+            raise HttpFehler(HTTPStatus.BAD_REQUEST, f'"antworten" must be one list of {len(FRAGEN)} answers')
+        return analyse_export([(frage["typ"], int(wert)) for frage, wert in zip(FRAGEN, matrix[0])], lang)
+    if modul == "swot_analysis":
+        felder = daten.get("felder")
+        if not isinstance(felder, list) or len(felder) != 4 or not all(isinstance(feld, str) for feld in felder):
+            raise HttpFehler(HTTPStatus.BAD_REQUEST, '"felder" must be four texts: strengths, weaknesses, opportunities, threats')
+        return swot_export(felder, lang)
+    zeilen, rollen, _ = pruefe(modul, daten, lang, streng=True)
+    if modul == "eisenhower_matrix":
+        return eisenhower_export([dict(zip(TASK_FIELDS, zeile)) for zeile in zeilen], lang)
+    if modul == "raci_matrix":
+        return raci_export(raci_matrix(zeilen, rollen), lang)
+    return bsc_export(zeilen, lang)
+
+
+def gespeicherter_inhalt(storage, ws, modul, lang):
+    """ModulExport of a stored module, read like the module pages do"""
+    if modul == "eisenhower_matrix":
+        return eisenhower_export(storage.list_tasks(ws), lang)
+    if modul == "raci_matrix":
+        return raci_export(RaciMatrix.from_snapshot(storage.raci_snapshot(ws)), lang)
+    return bsc_export(storage.list_objectives(ws), lang)
+
+
+def aufwaermen():
+    """Import the rendering libraries in a pool worker before the first export needs them"""
+    import reportlab.platypus  # noqa: F401
+    import xlsxwriter  # noqa: F401
+
+
+# --- Server ---
+class ApiServer:
+    """Request handlers plus the shared state: storage, artifact cache, running exports and metrics"""
+
+    def __init__(self, storage, max_body, max_exports):
+        self.storage = storage
+        self.max_body = max_body
+        self.max_exports = max_exports
+        self.cache = artifact_cache()
+        self._laufend = {}  # cache key -> future of the render in progress
+        self.exporte = 0
+        self.offen = 0
+        self.anfragen = Counter()  # (route, status) -> requests
+        self.latenz = defaultdict(lambda: [0] * (len(LATENZ_GRENZEN) + 1))  # route -> cumulative bucket counts
+        self.latenz_summe = Counter()
+
+    # --- HTTP ---
+    async def verbindung(self, reader, writer):
+        """One client connection; requests are answered in order until either side closes it"""
+        try:
+            while True:
+                try:
+                    kopf = await reader.readuntil(b"\r\n\r\n")
+                except asyncio.IncompleteReadError:
+                    break
+                except asyncio.LimitOverrunError:
+                    await self._senden(writer, json_antwort({"fehler": "Request header too large"}, HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE), True)
+                    break
+                start = time.perf_counter()
+                self.offen += 1
+                try:
+                    route, antwort, schliessen = await self._anfrage(reader, kopf)
+                finally:
+                    self.offen -= 1
+                await self._senden(writer, antwort, schliessen)
+                self._messen(route, antwort.status, time.perf_counter() - start)
+                if schliessen:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _anfrage(self, reader, kopf):
+        """(route name, Antwort, close connection?) for one request whose header block was read"""
+        zeilen = kopf.decode("latin-1").split("\r\n")
+        try:
+            methode, ziel, version = zeilen[0].split(" ")
+        except ValueError:
+            return "-", json_antwort({"fehler": "Malformed request line"}, HTTPStatus.BAD_REQUEST), True
+        headers = {}
+        for zeile in zeilen[1:]:
+            name, _, wert = zeile.partition(":")
+            if name:
+                headers[name.strip().lower()] = wert.strip()
+        schliessen = headers.get("connection", "").lower() == "close" or version == "HTTP/1.0"
+        if "transfer-encoding" in headers:
+            return "-", json_antwort({"fehler": "Chunked request bodies are not supported"}, HTTPStatus.LENGTH_REQUIRED), True
+        try:
+            laenge = int(headers.get("content-length", 0))
+        except ValueError:
+            return "-", json_antwort({"fehler": "Invalid Content-Length"}, HTTPStatus.BAD_REQUEST), True
+        if laenge > self.max_body:
+            return "-", json_antwort({"fehler": f"Body larger than {self.max_body} bytes"}, HTTPStatus.REQUEST_ENTITY_TOO_LARGE), True
+        body = await reader.readexactly(laenge) if laenge > 0 else b""
+
+        teile = urlsplit(ziel)
+        pfad, query = unquote(teile.path), parse_qs(teile.query)
+        erlaubt = [m for m, muster, _ in ROUTEN if muster.fullmatch(pfad)]
+        route = next((name for m, muster, name in ROUTEN if m == methode and muster.fullmatch(pfad)), None)
+        if route is None:
+            status = HTTPStatus.METHOD_NOT_ALLOWED if erlaubt else HTTPStatus.NOT_FOUND
+            kopf = (("Allow", ", ".join(erlaubt)),) if erlaubt else ()
+            return "-", json_antwort({"fehler": f"{status.phrase}: {methode} {pfad}"}, status, kopf), schliessen
+        treffer = next(muster.fullmatch(pfad) for m, muster, name in ROUTEN if name == route)
+        try:
+            antwort = await getattr(self, route)(treffer, query, body)
+        except HttpFehler as exc:
+            kopf = (("Retry-After", "1"),) if exc.status == HTTPStatus.SERVICE_UNAVAILABLE else ()
+            antwort = json_antwort({"fehler": str(exc), **exc.details}, exc.status, kopf)
+        except Exception as exc:
+            logger.exception("%s %s failed", methode, pfad)
+            antwort = json_antwort({"fehler": str(exc)}, HTTPStatus.INTERNAL_SERVER_ERROR)
+        return route, antwort, schliessen
+
+    @staticmethod
+    async def _senden(writer, antwort, schliessen):
+        kopf = [
+            f"HTTP/1.1 {antwort.status.value} {antwort.status.phrase}",
+            f"Content-Type: {antwort.typ}",
+            f"Content-Length: {len(antwort.body)}",
+            f"Connection: {'close' if schliessen else 'keep-alive'}",
+            *(f"{name}: {wert}" for name, wert in antwort.kopf),
+        ]
+        writer.write(("\r\n".join(kopf) + "\r\n\r\n").encode("latin-1") + antwort.body)
+        await writer.drain()
+
+    def _messen(self, route, status, sekunden):
+        self.anfragen[route, status.value] += 1
+        self.latenz_summe[route] += sekunden
+        eimer = self.latenz[route]
+        for i, grenze in enumerate(LATENZ_GRENZEN):
+            if sekunden <= grenze:
+                eimer[i] += 1
+        eimer[-1] += 1
+
+    async def _daten(self, body, query):
+        """(JSON body, language); large bodies are parsed in a thread"""
+        daten = await asyncio.to_thread(_json, body) if len(body) > INLINE_BYTES else _json(body)
+        return daten, sprache(daten, query)
+
+    # --- Exports ---
+    async def _rendern(self, key, funktion, *args):
+        """Cached bytes for ``key``, else ``funktion(*args)`` in the export pool; concurrent requests for one key share the render"""
+        daten = self.cache.get(key)
+        if daten is not None:
+            return daten
+        future = self._laufend.get(key)
+        if future is None:
+            if self.exporte >= self.max_exports:
+                raise HttpFehler(HTTPStatus.SERVICE_UNAVAILABLE, f"{self.max_exports} exports are already rendering")
+            # Counted here, not when the task starts, so renders requested in one loop pass see each other
+            self.exporte += 1
+            future = self._laufend[key] = asyncio.ensure_future(self._im_pool(key, funktion, *args))
+            future.add_done_callback(lambda _: self._laufend.pop(key, None))
+        # A client that disconnects must not cancel the render other requests wait for
+        return await asyncio.shield(future)
+
+    async def _im_pool(self, key, funktion, *args):
+        try:
+            daten = await asyncio.get_running_loop().run_in_executor(export_pool(), funktion, *args)
+        finally:
+            self.exporte -= 1
+        self.cache.put(key, daten)
+        return daten
+
+    @staticmethod
+    def _datei(daten, name, mime):
+        return Antwort(HTTPStatus.OK, daten, mime, (("Content-Disposition", f'attachment; filename="{name}"'),))
+
+    # --- Handlers ---
+    async def health(self, treffer, query, body):
+        return json_antwort({"status": "ok"})
+
+    async def metrics(self, treffer, query, body):
+        zeilen = ["# TYPE decision_compass_api_requests_total counter"]
+        zeilen += [f'decision_compass_api_requests_total{{route="{route}",status="{status}"}} {anzahl}'
+                   for (route, status), anzahl in sorted(self.anfragen.items())]
+        zeilen.append("# TYPE decision_compass_api_request_seconds histogram")
+        for route, eimer in sorted(self.latenz.items()):
+            zeilen += [f'decision_compass_api_request_seconds_bucket{{route="{route}",le="{grenze}"}} {anzahl}'
+                       for grenze, anzahl in zip((*LATENZ_GRENZEN, "+Inf"), eimer)]
+            zeilen.append(f'decision_compass_api_request_seconds_sum{{route="{route}"}} {self.latenz_summe[route]:.6f}')
+            zeilen.append(f'decision_compass_api_request_seconds_count{{route="{route}"}} {eimer[-1]}')
+        zeilen.append(f"decision_compass_api_in_flight {self.offen}")
+        zeilen.append(f"decision_compass_api_exports_rendering {self.exporte}")
+        text = "\n".join(zeilen) + "\n" + self.cache.prometheus()
+        return Antwort(HTTPStatus.OK, text.encode("utf-8"), "text/plain; version=0.0.4; charset=utf-8")
+
+    async def score(self, treffer, query, body):
+        daten, _ = await self._daten(body, query)
+        matrix, einzeln = antwortmatrix(daten)
+        schwellenwert = daten.get("schwellenwert", SCHWELLENWERT_HYBRID)
+        if not isinstance(schwellenwert, (int, float)) or isinstance(schwellenwert, bool):
+            raise HttpFehler(HTTPStatus.BAD_REQUEST, '"schwellenwert" must be a number')
+        if len(matrix) > INLINE_ZEILEN:
+            ergebnis = await asyncio.to_thread(bewerte_batch, matrix, schwellenwert)
+        else:
+            ergebnis = bewerte_batch(matrix, schwellenwert)
+        hybrid = hybrid_bezeichnungen(ergebnis["hybrid"])
+        if einzeln:
+            antwort = {
+                "punkte": dict(zip(TYPEN, ergebnis["punkte"][0])),
+                "prozent": dict(zip(TYPEN, ergebnis["prozent"][0])),
+                "hybrid_typen": [typ for typ in hybrid[0].split("+") if typ],
+                "keine_aufgabe": ergebnis["keine_aufgabe"][0],
+            }
+        else:
+            antwort = {"typen": TYPEN, **{feld: ergebnis[feld] for feld in ("punkte", "prozent", "keine_aufgabe")}, "hybrid_typen": hybrid}
+
+        if "team" in daten:
+            team = daten["team"].strip() if isinstance(daten["team"], str) else ""
+            if not team:
+                raise HttpFehler(HTTPStatus.BAD_REQUEST, '"team" must be a non-empty text')
+            statistik = await asyncio.to_thread(erfasse_antworten, self.storage, workspace(daten.get("workspace")), team, matrix)
+            antwort["team"] = {"name": team, "antworten": statistik.n, "mit_aufgabe": statistik.bewertet, "hybrid_anteil": statistik.hybrid_anteil()}
+        return json_antwort(antwort)
+
+    async def _tabelle_pruefen(self, body, query, modul, speichern):
+        """(rows, roles, rejected rows, stored rows, language); ``speichern(ws, rows, roles)`` runs when the body names a workspace"""
+        daten, lang = await self._daten(body, query)
+        zeilen, rollen, fehler = await asyncio.to_thread(pruefe, modul, daten, lang)
+        gespeichert = 0
+        if daten.get("workspace") is not None and zeilen:
+            await asyncio.to_thread(speichern, workspace(daten["workspace"]), zeilen, rollen)
+            gespeichert = len(zeilen)
+        return zeilen, rollen, fehler, gespeichert, lang
+
+    async def eisenhower(self, treffer, query, body):
+        zeilen, _, fehler, gespeichert, _ = await self._tabelle_pruefen(
+            body, query, "eisenhower_matrix", lambda ws, zeilen, rollen: self.storage.add_tasks(ws, zeilen))
+        anzahl = Counter(zeile[3] for zeile in zeilen)
+        return json_antwort({
+            "tasks": [dict(zip(TASK_FIELDS, zeile)) for zeile in zeilen],
+            "anzahl": {q: anzahl[q] for q in QUADRANTEN},
+            "gespeichert": gespeichert,
+            "fehler": fehler,
+        })
+
+    async def raci(self, treffer, query, body):
+        def speichern(ws, zeilen, rollen):
+            for rolle in rollen:
+                self.storage.add_role(ws, rolle)
+            self.storage.add_raci_tasks(ws, zeilen)
+
+        zeilen, rollen, fehler, gespeichert, _ = await self._tabelle_pruefen(body, query, "raci_matrix", speichern)
+        matrix = raci_matrix(zeilen, rollen)
+        verstoesse = matrix.validate()
+        return json_antwort({
+            "rollen": rollen,
+            "verstoesse": {
+                regel: [(matrix.rollen if regel == "rolle_ohne_zuweisung" else matrix.aufgaben)[i] for i in verstoesse[regel]]
+                for regel in REGELN
+            },
+            "gespeichert": gespeichert,
+            "fehler": fehler,
+        })
+
+    async def bsc(self, treffer, query, body):
+        zeilen, _, fehler, gespeichert, _ = await self._tabelle_pruefen(
+            body, query, "balanced_scorecard", lambda ws, zeilen, rollen: self.storage.add_objectives(ws, zeilen))
+        rollup = BscIndex(zeilen).rollup()
+        return json_antwort({
+            "rollup": {p: {spalte: rollup[spalte][i] for spalte in ROLLUP_SPALTEN} for i, p in enumerate(PERSPEKTIVEN)},
+            "anzahl": len(zeilen),
+            "gespeichert": gespeichert,
+            "fehler": fehler,
+        })
+
+    async def export(self, treffer, query, body):
+        modul, fmt = treffer["modul"], treffer["fmt"]
+        if modul not in MODUL_FELD or fmt not in MODUL_MIME:
+            raise HttpFehler(HTTPStatus.NOT_FOUND, f"Unknown export {modul}.{fmt}")
+        daten, lang = await self._daten(body, query)
+
+        def laden():
+            inhalt = modul_inhalt(modul, daten, lang)
+            return inhalt, inhalt and modul_schluessel(inhalt, fmt, lang)
+
+        inhalt, key = await asyncio.to_thread(laden)
+        if inhalt is None:
+            raise HttpFehler(HTTPStatus.UNPROCESSABLE_ENTITY, "Nothing to export")
+        return self._datei(await self._rendern(key, render_modul, inhalt, fmt, lang), f"{modul}.{fmt}", MODUL_MIME[fmt])
+
+    async def workspace_export(self, treffer, query, body):
+        ws, modul, fmt = workspace(treffer["ws"]), treffer["modul"], treffer["fmt"]
+        lang = sprache({}, query)
+        if modul == "bundle":
+            if fmt not in BUNDLE_FORMATE:
+                raise HttpFehler(HTTPStatus.NOT_FOUND, f"Unknown export {modul}.{fmt}")
+            return await self._bundle(ws, fmt, lang)
+        if modul not in GESPEICHERT or fmt not in MODUL_MIME:
+            raise HttpFehler(HTTPStatus.NOT_FOUND, f"Unknown export {modul}.{fmt}")
+        if fmt == "csv":
+            # Streamed from the store in batches, as on the module pages
+            daten = await asyncio.to_thread(lambda: csv_datei(*store_tabelle(self.storage, ws, modul, lang), lang))
+            return self._datei(daten, f"{modul}.{fmt}", MODUL_MIME[fmt])
+
+        def laden():
+            inhalt = gespeicherter_inhalt(self.storage, ws, modul, lang)
+            return inhalt, inhalt and modul_schluessel(inhalt, fmt, lang)
+
+        inhalt, key = await asyncio.to_thread(laden)
+        if inhalt is None:
+            raise HttpFehler(HTTPStatus.NOT_FOUND, f"Workspace {ws} has no {modul}")
+        return self._datei(await self._rendern(key, render_modul, inhalt, fmt, lang), f"{modul}.{fmt}", MODUL_MIME[fmt])
+
+    async def _bundle(self, ws, fmt, lang):
+        titel = get_text("title", lang)
+
+        def laden():
+            inhalte = sammle_module([lambda modul=modul: gespeicherter_inhalt(self.storage, ws, modul, lang) for modul in GESPEICHERT])
+            if fmt == "zip":
+                return inhalte, [modul_schluessel(inhalt, ext, lang) for inhalt, ext in zip_auftraege(inhalte)]
+            return inhalte, bundle_schluessel(inhalte, fmt, lang, titel)
+
+        inhalte, key = await asyncio.to_thread(laden)
+        if not inhalte:
+            raise HttpFehler(HTTPStatus.NOT_FOUND, f"Workspace {ws} has no stored modules")
+        if fmt == "zip":
+            # Every file of the archive is one export: counted against max_exports, shared and cached like single files
+            auftraege = zip_auftraege(inhalte)
+            dateien = await asyncio.gather(*(self._rendern(k, render_modul, inhalt, ext, lang) for k, (inhalt, ext) in zip(key, auftraege)),
+                                           return_exceptions=True)
+            fehler = next((d for d in dateien if isinstance(d, BaseException)), None)
+            if fehler is not None:
+                raise fehler
+            daten = await asyncio.to_thread(zip_archiv, auftraege, dateien)
+        else:
+            daten = await self._rendern(key, render_bundle, inhalte, fmt, titel)
+        return self._datei(daten, f"decision_compass.{fmt}", BUNDLE_MIME[fmt])
+
+
+async def serve(server, host, port):
+    """Serve until SIGTERM or SIGINT, then stop the export workers with the server"""
+    loop = asyncio.get_running_loop()
+    stopp = asyncio.Event()
+    for signal_ in (signal.SIGTERM, signal.SIGINT):
+        with contextlib.suppress(NotImplementedError):  # no signal handlers on Windows event loops
+            loop.add_signal_handler(signal_, stopp.set)
+    pool = export_pool()
+    if pool is not None:
+        # Spawned workers import pandas and the rendering libraries once, before the first request waits for them
+        await asyncio.gather(*(loop.run_in_executor(pool, aufwaermen) for _ in range(export_workers())))
+    tcp = await asyncio.start_server(server.verbindung, host, port)
+    logger.info("Decision Compass API on %s", ", ".join(f"http://{s.getsockname()[0]}:{s.getsockname()[1]}" for s in tcp.sockets))
+    try:
+        async with tcp:
+            await stopp.wait()
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+def main(argv=None):
+    host, port, max_body, max_exports = api_settings()
+    parser = argparse.ArgumentParser(description="Local HTTP API for scoring, the matrix modules and exports.")
+    parser.add_argument("--host", default=host)
+    parser.add_argument("--port", type=int, default=port)
+    parser.add_argument("--storage", default=storage_url(), help="Storage URL (sqlite:///path.db or memory://)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    server = ApiServer(open_storage(args.storage), max_body, max_exports)
+    try:
+        asyncio.run(serve(server, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""Balanced Scorecard index: objectives grouped by perspective, numeric KPI rollups in one pass.
+
+Achievement per objective is ``istwert / zielwert`` for KPIs where higher is
+better (``richtung`` "hoch") and ``zielwert / istwert`` where lower is better
+("niedrig": costs, defect rates, lead times), capped to [0, 1] so one
+over-fulfilled KPI cannot hide missed ones; an actual at or below a "niedrig"
+target is fully achieved. Objectives without a numeric target or actual count as
+objectives but not towards achievement.
+"""
+import numpy as np
+
+from decision_compass.storage import PERSPEKTIVEN
+
+ROLLUP_SPALTEN = ("anzahl", "gemessen", "erreicht", "zielerreichung", "score")
+
+
+class BscIndex:
+    """Column arrays of a workspace's objectives plus a per-perspective row index"""
+
+    def __init__(self, ziele):
+        self.ziele = list(ziele)
+        n = len(self.ziele)
+        self.perspektive = np.fromiter((PERSPEKTIVEN.index(z["perspektive"]) for z in self.ziele), dtype=np.int8, count=n)
+        self.bereiche = sorted({z.get("bereich", "") for z in self.ziele})
+        bereich_index = {b: i for i, b in enumerate(self.bereiche)}
+        self.bereich = np.fromiter((bereich_index[z.get("bereich", "")] for z in self.ziele), dtype=np.int32, count=n)
+        self.zielwert = np.array([z["zielwert"] for z in self.ziele], dtype=float).reshape(n)
+        self.istwert = np.array([z.get("istwert") for z in self.ziele], dtype=float).reshape(n)
+        self.niedrig = np.fromiter((z.get("richtung") == "niedrig" for z in self.ziele), dtype=bool, count=n)
+        self.gewicht = np.array([z.get("gewicht", 1.0) for z in self.ziele], dtype=float).reshape(n)
+
+        # Rows grouped by perspective (stable, so insertion order is kept inside a group)
+        self._reihenfolge = np.argsort(self.perspektive, kind="stable")
+        self._grenzen = np.searchsorted(self.perspektive[self._reihenfolge], np.arange(len(PERSPEKTIVEN) + 1))
+
+        # Lower-is-better KPIs divide the other way round; an actual at or below target needs no division
+        endlich = np.isfinite(self.zielwert) & np.isfinite(self.istwert)
+        unterschritten = self.niedrig & endlich & (self.istwert <= self.zielwert)
+        gemessen = endlich & np.where(self.niedrig, unterschritten | (self.istwert != 0), self.zielwert != 0)
+        zaehler = np.where(self.niedrig, self.zielwert, self.istwert)
+        nenner = np.where(self.niedrig, self.istwert, self.zielwert)
+        quote = np.divide(zaehler, nenner, out=np.ones(n), where=gemessen & ~unterschritten)
+        self.gemessen = gemessen
+        self.erreichung = np.where(gemessen, np.clip(quote, 0.0, 1.0), np.nan)
+
+    def __len__(self):
+        return len(self.ziele)
+
+    def zeilen(self, perspektive, bereich=None):
+        """Row positions of one perspective, optionally restricted to one business unit"""
+        p = PERSPEKTIVEN.index(perspektive)
+        zeilen = self._reihenfolge[self._grenzen[p]:self._grenzen[p + 1]]
+        if bereich is not None:
+            zeilen = zeilen[self.bereich[zeilen] == self.bereiche.index(bereich)]
+        return zeilen
+
+    def rollup(self, nach_bereich=False):
+        """Counts and achievement per perspective (or per business unit x perspective)
+
+        Returns {column: array} with columns ``ROLLUP_SPALTEN``; arrays have one entry per
+        perspective, or shape (units, perspectives) with ``nach_bereich``. ``zielerreichung``
+        is the mean and ``score`` the weight-averaged achievement in percent (NaN without data).
+        """
+        gruppen = len(PERSPEKTIVEN)
+        gruppe = self.perspektive.astype(np.int64)
+        if nach_bereich:
+            gruppen *= max(1, len(self.bereiche))
+            gruppe = self.bereich.astype(np.int64) * len(PERSPEKTIVEN) + gruppe
+
+        e = np.nan_to_num(self.erreichung)
+        w = np.where(self.gemessen, self.gewicht, 0.0)
+        gemessen = np.bincount(gruppe, weights=self.gemessen, minlength=gruppen)
+        summe_w = np.bincount(gruppe, weights=w, minlength=gruppen)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            ergebnis = {
+                "anzahl": np.bincount(gruppe, minlength=gruppen),
+                "gemessen": gemessen.astype(np.int64),
+                "erreicht": np.bincount(gruppe, weights=e >= 1.0, minlength=gruppen).astype(np.int64),
+                "zielerreichung": 100 * np.bincount(gruppe, weights=e, minlength=gruppen) / gemessen,
+                "score": 100 * np.bincount(gruppe, weights=w * e, minlength=gruppen) / summe_w,
+            }
+        if nach_bereich:
+            ergebnis = {k: v.reshape(-1, len(PERSPEKTIVEN)) for k, v in ergebnis.items()}
+        return ergebnis
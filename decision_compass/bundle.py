@@ -0,0 +1,232 @@
+"""Export contents per module and the global bundle of all modules.
+
+Each ``*_export`` function turns a module's data into a ``ModulExport`` (section
+dict for the PDF, records for the tables). ``bundle_export`` combines them into one
+workbook, one PDF or a ZIP with PDF/XLSX/CSV per module. Module contents are
+collected concurrently; the per-module files of a ZIP are rendered in a process
+pool, since reportlab and xlsxwriter are pure Python and hold the GIL.
+"""
+import io
+import multiprocessing
+import threading
+import zipfile
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pandas as pd
+
+from decision_compass.cache import artifact_cache, artifact_key
+from decision_compass.config import export_workers
+from decision_compass.export import (
+    csv_datei, csv_export, dataframes_to_xlsx, excel_export, export_chapters_to_pdf, export_to_pdf, pdf_export, tabelle_zeilen
+)
+from decision_compass.formats import BUNDLE_FORMATE
+from decision_compass.i18n import get_text
+from decision_compass.profiling import gemessen
+from decision_compass.report import ReportTabelle, Spalte
+from decision_compass.scoring import bewerte_antworten
+from decision_compass.storage import OBJECTIVE_FIELDS, PERSPEKTIVEN, RICHTUNGEN, TASK_FIELDS
+
+# name: file stem, titel: PDF title / sheet name, abschnitte: {heading: text}, tabelle: records,
+# tabellen: [ReportTabelle] rendered as paginated tables after the sections of the PDF
+ModulExport = namedtuple("ModulExport", ["name", "titel", "abschnitte", "tabelle", "tabellen"], defaults=((),))
+
+
+# --- Module contents ---
+def analyse_export(antworten, lang):
+    """Task analysis result for [(typ, answer)], None without a recognizable task"""
+    ergebnis = bewerte_antworten(antworten) if antworten else None
+    if ergebnis is None:
+        return None
+    punkte, verteilung = ergebnis["punkte"], ergebnis["prozentuale_verteilung"]
+    typ_namen = get_text("type_names", lang)
+    empfehlungen = get_text("recommendations", lang)
+    return ModulExport(
+        "task_analysis",
+        get_text("ta_pdf_title", lang),
+        {
+            get_text("pdf_points", lang): "\n".join(f"{typ_namen[typ]}: {punkte[typ]} {get_text('points_unit', lang)}" for typ in punkte),
+            get_text("pdf_distribution", lang): "\n".join(f"{typ_namen[typ]}: {verteilung[typ]}%" for typ in verteilung),
+            get_text("pdf_recommendation", lang): "".join(empfehlungen[typ] + "\n\n" for typ in ergebnis["hybrid_typen"]),
+        },
+        {"Aufgabentyp": list(punkte.keys()), "Punkte": list(punkte.values()), "Prozent": list(verteilung.values())},
+    )
+
+
+def swot_export(felder, lang):
+    """SWOT for [strengths, weaknesses, opportunities, threats], None if all are empty"""
+    if not felder or not any(felder):
+        return None
+    kategorien = get_text("swot_categories", lang)
+    return ModulExport(
+        "swot_analysis",
+        get_text("swot_pdf_title", lang),
+        {kategorie: inhalt or get_text("no_entries", lang) for kategorie, inhalt in zip(kategorien, felder)},
+        {"Kategorie": kategorien, "Inhalt": list(felder)},
+    )
+
+
+def eisenhower_export(tasks, lang):
+    if not tasks:
+        return None
+    titel = get_text("eis_pdf_title", lang)
+    spalten = [Spalte(get_text(k, lang), art) for k, art in (("task_column", "text"), ("importance", "kurz"), ("urgency", "kurz"), ("quadrant", "kurz"))]
+    zeilen = [(t["beschreibung"], t["wichtigkeit"], t["dringlichkeit"], t["quadrant"]) for t in tasks]
+    return ModulExport("eisenhower_matrix", titel, {}, tasks, (ReportTabelle(titel, spalten, zeilen),))
+
+
+def raci_export(matrix, lang):
+    if not len(matrix):
+        return None
+    titel = get_text("raci_pdf_title", lang)
+    spalten = [Spalte(get_text("task_column", lang), "text")] + [Spalte(rolle, "raci") for rolle in matrix.rollen]
+    zeilen = [(aufgabe, *codes) for aufgabe, codes in zip(matrix.aufgaben, matrix.buchstaben().tolist())]
+    return ModulExport("raci_matrix", titel, {}, matrix.to_records(), (ReportTabelle(titel, spalten, zeilen),))
+
+
+def bsc_export(ziele, lang):
+    if not ziele:
+        return None
+    namen = dict(zip(PERSPEKTIVEN, get_text("perspectives", lang)))
+    richtungen = dict(zip(RICHTUNGEN, get_text("kpi_directions", lang)))
+    tabelle = [{k: v for k, v in dict(z, perspektive=namen[z["perspektive"]], richtung=richtungen[z["richtung"]]).items() if k != "id"}
+               for z in ziele]
+    titel = get_text("bsc_pdf_title", lang)
+    felder = (
+        ("perspektive", "perspective", "kurz"), ("bereich", "business_unit", "kurz"), ("ziel", "strategic_objective", "text"),
+        ("kennzahl", "kpi", "text"), ("zielwert", "target_value", "zahl"), ("istwert", "actual_value", "zahl"),
+        ("richtung", "kpi_direction", "kurz"), ("gewicht", "weight", "zahl"), ("massnahmen", "measures", "text"),
+    )
+    spalten = [Spalte(get_text(k, lang), art) for _, k, art in felder]
+    zeilen = [tuple(z[feld] for feld, _, _ in felder) for z in tabelle]
+    return ModulExport("balanced_scorecard", titel, {}, tabelle, (ReportTabelle(titel, spalten, zeilen, fest=3),))
+
+
+# --- Tables straight from the store ---
+def store_tabelle(storage, workspace, name, lang):
+    """(columns, row iterator) of a stored module, read in batches; same columns as the module's records
+
+    Feeds ``csv_chunks`` without building the records or a DataFrame first.
+    """
+    if name == "eisenhower_matrix":
+        return list(TASK_FIELDS), storage.iter_tasks(workspace)
+    if name == "raci_matrix":
+        return ["Aufgabe", *storage.list_roles(workspace)], ((aufgabe, *codes) for aufgabe, codes in storage.iter_raci_rows(workspace))
+    if name == "balanced_scorecard":
+        namen = dict(zip(PERSPEKTIVEN, get_text("perspectives", lang)))
+        richtungen = dict(zip(RICHTUNGEN, get_text("kpi_directions", lang)))
+        r = OBJECTIVE_FIELDS.index("richtung")
+        return list(OBJECTIVE_FIELDS), ((namen[z[0]], *z[1:r], richtungen[z[r]], *z[r + 1:]) for z in storage.iter_objectives(workspace))
+    raise ValueError(f"Module {name!r} is not stored")
+
+
+# --- Rendering ---
+def modul_schluessel(inhalt, fmt, language):
+    """Artifact cache key of one module file, identical to pdf_export/excel_export/csv_export"""
+    return artifact_key([inhalt.titel, inhalt.abschnitte, list(inhalt.tabellen)] if fmt == "pdf" else inhalt.tabelle, language, fmt)
+
+
+def modul_datei(inhalt, fmt, language, fortschritt=None):
+    """One module file through the artifact cache, as offered on the module pages"""
+    if fmt == "pdf":
+        return pdf_export(inhalt.abschnitte, inhalt.titel, language, fortschritt, inhalt.tabellen)
+    if fmt == "xlsx":
+        return excel_export(inhalt.tabelle, language)
+    return csv_export(inhalt.tabelle, language)
+
+
+def render_modul(inhalt, fmt, language):
+    """PDF, XLSX or CSV bytes of one module (runs in the worker processes)"""
+    if fmt == "pdf":
+        return export_to_pdf(inhalt.abschnitte, inhalt.titel, tables=inhalt.tabellen).getvalue()
+    if fmt == "xlsx":
+        return dataframes_to_xlsx({"Results": pd.DataFrame(inhalt.tabelle)})
+    return csv_datei(*tabelle_zeilen(inhalt.tabelle), language)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def export_pool():
+    """Process pool for rendering, shared by all sessions; None if DECISION_COMPASS_EXPORT_WORKERS is 0
+
+    Workers are spawned rather than forked: the Streamlit server is multi-threaded.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None and export_workers() > 0:
+            _pool = ProcessPoolExecutor(export_workers(), mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+
+def render_module(auftraege, language, fortschritt=None):
+    """Bytes for [(ModulExport, fmt)]; cached files are reused, the rest rendered in parallel
+
+    ``fortschritt(anteil)`` is called after each finished file.
+    """
+    cache = artifact_cache()
+    keys = [modul_schluessel(inhalt, fmt, language) for inhalt, fmt in auftraege]
+    ergebnisse = [cache.get(key) for key in keys]
+    offen = [i for i, daten in enumerate(ergebnisse) if daten is None]
+    if offen:
+        pool = export_pool() or ThreadPoolExecutor(len(offen))
+        futures = {i: pool.submit(render_modul, *auftraege[i], language) for i in offen}
+        try:
+            for fertig, (i, future) in enumerate(futures.items(), start=1):
+                ergebnisse[i] = future.result()
+                cache.put(keys[i], ergebnisse[i])
+                if fortschritt is not None:
+                    fortschritt((len(auftraege) - len(offen) + fertig) / len(auftraege))
+        finally:
+            for future in futures.values():
+                future.cancel()
+            if pool is not _pool:
+                pool.shutdown(wait=False)
+    return ergebnisse
+
+
+def sammle_module(quellen):
+    """Call the content loaders concurrently (storage reads), skipping modules without content"""
+    with ThreadPoolExecutor(max(1, len(quellen))) as pool:
+        return [inhalt for inhalt in pool.map(lambda quelle: quelle(), quellen) if inhalt is not None]
+
+
+def bundle_schluessel(inhalte, fmt, language, titel="Decision Compass"):
+    """Artifact cache key of an XLSX or PDF bundle"""
+    if fmt == "xlsx":
+        return artifact_key([(i.titel, i.tabelle) for i in inhalte], language, "xlsx-bundle")
+    return artifact_key([titel, [(i.titel, i.abschnitte, list(i.tabellen)) for i in inhalte]], language, "pdf-bundle")
+
+
+def render_bundle(inhalte, fmt, titel="Decision Compass", fortschritt=None):
+    """XLSX (sheet per module) or PDF (chapter per module) bytes, uncached (runs in the worker processes)"""
+    if fmt == "xlsx":
+        return dataframes_to_xlsx({i.titel: pd.DataFrame(i.tabelle) for i in inhalte})
+    return export_chapters_to_pdf([(i.titel, i.abschnitte, i.tabellen) for i in inhalte], titel, fortschritt).getvalue()
+
+
+@gemessen
+def bundle_export(inhalte, fmt, language, titel="Decision Compass", fortschritt=None):
+    """All module contents as one XLSX (sheet per module), one PDF (chapter per module) or a ZIP"""
+    if fmt in ("xlsx", "pdf"):
+        return artifact_cache().get_or_build(bundle_schluessel(inhalte, fmt, language, titel),
+                                             lambda: render_bundle(inhalte, fmt, titel, fortschritt))
+    if fmt != "zip":
+        raise ValueError(f"Unknown bundle format {fmt!r}, expected one of {', '.join(BUNDLE_FORMATE)}")
+    auftraege = zip_auftraege(inhalte)
+    return zip_archiv(auftraege, render_module(auftraege, language, fortschritt))
+
+
+def zip_auftraege(inhalte):
+    """[(ModulExport, fmt)] of the files in a ZIP bundle: PDF, XLSX and CSV per module"""
+    return [(inhalt, ext) for inhalt in inhalte for ext in ("pdf", "xlsx", "csv")]
+
+
+def zip_archiv(auftraege, dateien):
+    """ZIP bytes of rendered ``zip_auftraege`` files, in the same order"""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archiv:
+        for (inhalt, ext), daten in zip(auftraege, dateien):
+            archiv.writestr(f"{inhalt.name}.{ext}", daten)
+    return buffer.getvalue()
@@ -0,0 +1,107 @@
+"""Content-addressed, size-bounded LRU cache for generated export artifacts."""
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+from decision_compass.config import cache_limits
+
+
+def artifact_key(content, language, fmt):
+    """Hash of the exported content plus language and format
+
+    Dict keys keep their order: it is the order of the columns and sections in the file.
+    """
+    payload = json.dumps(content, ensure_ascii=False, default=str)
+    digest = hashlib.sha256(payload.encode("utf-8"))
+    digest.update(f"\0{language}\0{fmt}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _groesse(data):
+    return len(data) if isinstance(data, (bytes, bytearray, str)) else 0
+
+
+class ArtifactCache:
+    """Thread-safe LRU cache bounded by entry count and total bytes"""
+
+    def __init__(self, max_entries=128, max_bytes=64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._daten = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._daten:
+                self.misses += 1
+                return None
+            self._daten.move_to_end(key)
+            self.hits += 1
+            return self._daten[key]
+
+    def put(self, key, data):
+        groesse = _groesse(data)
+        with self._lock:
+            if key in self._daten:
+                self._bytes -= _groesse(self._daten.pop(key))
+            if groesse > self.max_bytes or self.max_entries <= 0:
+                return
+            self._daten[key] = data
+            self._bytes += groesse
+            while len(self._daten) > self.max_entries or self._bytes > self.max_bytes:
+                _, alt = self._daten.popitem(last=False)
+                self._bytes -= _groesse(alt)
+                self.evictions += 1
+
+    def get_or_build(self, key, builder):
+        """Return the cached artifact or build, store and return it"""
+        data = self.get(key)
+        if data is None:
+            data = builder()
+            self.put(key, data)
+        return data
+
+    def clear(self):
+        with self._lock:
+            self._daten.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._daten),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+            }
+
+    def prometheus(self, prefix="decision_compass_artifact_cache"):
+        """Counters in Prometheus text exposition format"""
+        return "".join(f"{prefix}_{name} {wert}\n" for name, wert in self.stats().items())
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def artifact_cache():
+    """Process-wide cache shared by all sessions"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            max_entries, max_bytes = cache_limits()
+            _cache = ArtifactCache(max_entries, max_bytes)
+        return _cache
+
+
+def cached_artifact(fmt, content, language, builder):
+    """Serve an export from the cache, building it on the first request"""
+    return artifact_cache().get_or_build(artifact_key(content, language, fmt), builder)
@@ -0,0 +1,92 @@
+"""Deployment settings, read from environment variables."""
+import codecs
+import os
+
+PROGRESS_MODES = ("css", "static", "sleep")
+
+
+def progress_mode():
+    """How result bars are rendered: 'css' (client-side animation), 'static' or 'sleep' (legacy, blocks the script)"""
+    mode = os.environ.get("DECISION_COMPASS_PROGRESS", "css").strip().lower()
+    return mode if mode in PROGRESS_MODES else "css"
+
+
+def _int_env(name, default):
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def cache_limits():
+    """(max entries, max bytes) for the export artifact cache"""
+    return (
+        _int_env("DECISION_COMPASS_CACHE_MAX_ENTRIES", 128),
+        _int_env("DECISION_COMPASS_CACHE_MAX_MB", 64) * 1024 * 1024,
+    )
+
+
+def storage_url():
+    """Storage backend URL: sqlite:///path (default: decision_compass.db in the working directory) or memory://"""
+    return os.environ.get("DECISION_COMPASS_STORAGE", "sqlite:///decision_compass.db")
+
+
+def export_workers():
+    """Worker processes for rendering export bundles (0 renders in threads of the app process)"""
+    return max(0, _int_env("DECISION_COMPASS_EXPORT_WORKERS", min(4, os.cpu_count() or 1)))
+
+
+def job_settings():
+    """(worker threads, max queued+running jobs, seconds finished results are kept, max bytes of kept results,
+    max queued+running jobs per workspace) for background exports"""
+    return (
+        max(1, _int_env("DECISION_COMPASS_JOB_WORKERS", 2)),
+        max(1, _int_env("DECISION_COMPASS_JOB_QUEUE", 8)),
+        max(0, _int_env("DECISION_COMPASS_JOB_TTL", 600)),
+        max(0, _int_env("DECISION_COMPASS_JOB_RESULTS_MB", 256)) * 1024 * 1024,
+        max(1, _int_env("DECISION_COMPASS_JOB_QUEUE_PER_WORKSPACE", 2)),
+    )
+
+
+def api_settings():
+    """(host, port, max request body bytes, max exports rendering at once) for the HTTP API"""
+    return (
+        os.environ.get("DECISION_COMPASS_API_HOST", "127.0.0.1"),
+        _int_env("DECISION_COMPASS_API_PORT", 8765),
+        max(1, _int_env("DECISION_COMPASS_API_MAX_BODY_MB", 32)) * 1024 * 1024,
+        max(1, _int_env("DECISION_COMPASS_API_MAX_EXPORTS", 32)),
+    )
+
+
+def csv_settings(delimiter=",", decimal="."):
+    """(delimiter, encoding, decimal separator) for CSV exports; the arguments are the locale's defaults
+
+    DECISION_COMPASS_CSV_DELIMITER ('tab' for tabs), _CSV_ENCODING (default utf-8-sig, the BOM makes
+    Excel detect UTF-8) and _CSV_DECIMAL override them for all languages.
+    """
+    trenner = os.environ.get("DECISION_COMPASS_CSV_DELIMITER", delimiter)
+    trenner = "\t" if trenner.lower() == "tab" else trenner[:1] or delimiter
+    encoding = os.environ.get("DECISION_COMPASS_CSV_ENCODING", "utf-8-sig")
+    try:
+        codecs.lookup(encoding)
+    except LookupError:
+        encoding = "utf-8-sig"
+    return trenner, encoding, os.environ.get("DECISION_COMPASS_CSV_DECIMAL", decimal)[:1] or decimal
+
+
+PROFILE_MODES = ("off", "spans", "cprofile")
+
+
+def profiling_settings():
+    """(mode, JSONL log path or None, admin token or None) for the opt-in instrumentation
+
+    DECISION_COMPASS_PROFILE: 'off' (default), 'spans' (timed sections and helpers) or 'cprofile'
+    (spans plus a cProfile of every rerun). The timing panel is shown when the page is opened with
+    ?admin=<DECISION_COMPASS_ADMIN_TOKEN>.
+    """
+    mode = os.environ.get("DECISION_COMPASS_PROFILE", "off").strip().lower()
+    return (
+        mode if mode in PROFILE_MODES else "off",
+        os.environ.get("DECISION_COMPASS_PROFILE_LOG") or None,
+        os.environ.get("DECISION_COMPASS_ADMIN_TOKEN") or None,
+    )
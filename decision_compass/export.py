@@ -0,0 +1,171 @@
+"""PDF, Excel and CSV export helpers.
+
+reportlab and xlsxwriter are imported on first use only: Streamlit re-executes
+the script on every interaction and most reruns never export anything.
+Artifacts are returned as plain bytes for ``st.download_button``, which serves
+them as a regular HTTP file response instead of a base64 data URL.
+"""
+import codecs
+import csv
+import io
+import math
+
+import pandas as pd
+
+from decision_compass.cache import cached_artifact
+from decision_compass.config import csv_settings
+from decision_compass.i18n import get_text
+from decision_compass.profiling import gemessen
+from decision_compass.report import RACI_FARBEN
+
+_SHEET_ZEICHEN = str.maketrans({c: " " for c in "[]:*?/\\"})
+
+
+XLSX_BLOCK = 5000  # rows converted to Python values at once
+_XLSX_OPTIONEN = {
+    "constant_memory": True,  # rows go to temp files as written, only the current row stays in memory
+    "strings_to_formulas": False,  # user text starting with '=' stays text
+    "strings_to_urls": False,
+    "remove_timezone": True,
+}
+
+
+def dataframe_to_xlsx(data):
+    """Render a DataFrame as XLSX bytes"""
+    return dataframes_to_xlsx({'Results': data})
+
+def _ist_raci_spalte(werte):
+    """Text column holding only RACI codes ('-' for no assignment) and at least one assignment"""
+    codes = set(werte.dropna().unique().tolist()) if werte.dtype == object or pd.api.types.is_string_dtype(werte) else set()
+    return bool(codes) and codes <= set("RACI-") and codes != {"-"}
+
+def _xlsx_blatt(workbook, name, data, formate):
+    """Write one sheet row by row: typed columns, frozen header, autofilter, RACI colour rules"""
+    sheet = workbook.add_worksheet(name.translate(_SHEET_ZEICHEN)[:31])
+    n, m = data.shape
+    raci = []
+    for j, (titel, werte) in enumerate(data.items()):
+        if pd.api.types.is_bool_dtype(werte):
+            fmt, breite = None, 8
+        elif pd.api.types.is_numeric_dtype(werte):
+            fmt, breite = None, 12
+        elif pd.api.types.is_datetime64_any_dtype(werte):
+            fmt, breite = formate["datum"], 12
+        else:
+            fmt = None
+            laenge = werte.head(1000).dropna().astype(str).str.len().max()
+            breite = min(60, max(10, 0 if pd.isna(laenge) else int(laenge) + 2))
+            if _ist_raci_spalte(werte):
+                raci.append(j)
+                breite = 8
+        sheet.set_column(j, j, max(breite, min(40, len(str(titel)) + 2)), fmt)
+
+    sheet.write_row(0, 0, [str(titel) for titel in data.columns], formate["kopf"])
+    for start in range(0, n, XLSX_BLOCK):
+        block = data.iloc[start:start + XLSX_BLOCK]
+        # Python scalars for xlsxwriter, one block at a time; NaN/NaT become empty cells
+        spalten = [werte.astype(object).where(werte.notna(), None).tolist() for _, werte in block.items()]
+        for i, zeile in enumerate(zip(*spalten), start=start + 1):
+            sheet.write_row(i, 0, zeile)
+
+    sheet.freeze_panes(1, 1 if raci else 0)
+    if m:
+        sheet.autofilter(0, 0, n, m - 1)
+    for j in raci:
+        for code, fmt in formate["raci"].items():
+            sheet.conditional_format(1, j, max(n, 1), j, {"type": "cell", "criteria": "==", "value": f'"{code}"', "format": fmt})
+
+@gemessen
+def dataframes_to_xlsx(sheets):
+    """Render {sheet name: DataFrame} as one workbook; names are cut to Excel's 31 characters
+
+    Streams through xlsxwriter's constant_memory mode: cells are written in row order and
+    flushed per row, so the writer itself does not grow with the row count.
+    """
+    import xlsxwriter
+
+    output = io.BytesIO()
+    workbook = xlsxwriter.Workbook(output, _XLSX_OPTIONEN)
+    formate = {
+        "kopf": workbook.add_format({"bold": True, "bg_color": "#dee2e6", "bottom": 1, "text_wrap": True, "valign": "top"}),
+        "datum": workbook.add_format({"num_format": "yyyy-mm-dd"}),
+        "raci": {code: workbook.add_format({"bg_color": farbe, "align": "center"}) for code, farbe in RACI_FARBEN.items()},
+    }
+    for name, data in sheets.items():
+        _xlsx_blatt(workbook, name, data, formate)
+    workbook.close()
+    return output.getvalue()
+
+@gemessen
+def export_to_pdf(content_dict, title, progress=None, tables=()):
+    """Export content to PDF; ``tables`` ([ReportTabelle]) follow the sections"""
+    return export_chapters_to_pdf([(None, content_dict, tables)], title, progress)
+
+@gemessen
+def export_chapters_to_pdf(chapters, title, progress=None):
+    """Export [(chapter title, content dict, tables)] to one PDF, each titled chapter on a new page
+
+    ``progress(fraction)`` is called while the layout runs; an exception it raises aborts the build.
+    """
+    from decision_compass.report import baue_report
+
+    return baue_report(title, chapters, progress)
+
+# --- Streaming CSV ---
+CSV_BLOCK = 1000  # rows per encoded chunk
+
+def csv_format(language):
+    """(delimiter, encoding, decimal separator) for a language: ';' and decimal commas for German"""
+    return csv_settings(get_text("csv_delimiter", language), get_text("csv_decimal", language))
+
+def tabelle_zeilen(records):
+    """(columns, row iterator) for table records (list of row dicts or dict of columns)"""
+    if isinstance(records, dict):
+        return list(records), zip(*records.values())
+    spalten = list(records[0]) if records else []
+    return spalten, ([zeile.get(s) for s in spalten] for zeile in records)
+
+def _csv_wert(wert, decimal):
+    if isinstance(wert, float):
+        if math.isnan(wert):
+            return ""
+        return repr(wert).replace(".", decimal) if decimal != "." else wert
+    return wert
+
+def csv_chunks(spalten, zeilen, delimiter=",", encoding="utf-8-sig", decimal=".", block=CSV_BLOCK):
+    """Encoded CSV as a generator of chunks of ``block`` rows; only the current chunk is held in memory
+
+    ``zeilen`` may be any iterator (e.g. a storage cursor). Characters the encoding cannot
+    represent are replaced; a BOM-writing encoding (utf-8-sig) emits it once at the start.
+    """
+    encoder = codecs.getincrementalencoder(encoding)(errors="replace")
+    puffer = io.StringIO()
+    writer = csv.writer(puffer, delimiter=delimiter)
+    writer.writerow(spalten)
+    for i, zeile in enumerate(zeilen, start=1):
+        writer.writerow([_csv_wert(wert, decimal) for wert in zeile])
+        if i % block == 0:
+            yield encoder.encode(puffer.getvalue())
+            puffer.seek(0)
+            puffer.truncate()
+    yield encoder.encode(puffer.getvalue(), final=True)
+
+@gemessen
+def csv_datei(spalten, zeilen, language):
+    """CSV bytes in the language's format, assembled from the chunks"""
+    return b"".join(csv_chunks(spalten, zeilen, *csv_format(language)))
+
+# --- Cached exports ---
+def pdf_export(content_dict, title, language, progress=None, tables=()):
+    """PDF bytes for a section dict and tables, served from the artifact cache when unchanged"""
+    return cached_artifact(
+        "pdf", [title, content_dict, list(tables)], language, lambda: export_to_pdf(content_dict, title, progress, tables).getvalue()
+    )
+
+def excel_export(records, language):
+    """XLSX bytes for table records (list of row dicts or dict of columns)"""
+    return cached_artifact("xlsx", records, language, lambda: dataframe_to_xlsx(pd.DataFrame(records)))
+
+def csv_export(records, language):
+    """CSV bytes in the language's format for table records (list of row dicts or dict of columns)"""
+    return cached_artifact("csv", records, language, lambda: csv_datei(*tabelle_zeilen(records), language))
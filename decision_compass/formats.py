@@ -0,0 +1,13 @@
+"""File formats and MIME types of the exports.
+
+Kept free of pandas and the export libraries: the app shell needs them on every
+rerun to draw the export controls, the rendering modules only when a file is built.
+"""
+PDF_MIME = "application/pdf"
+XLSX_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+CSV_MIME = "text/csv"
+ZIP_MIME = "application/zip"
+
+BUNDLE_FORMATE = ("xlsx", "pdf", "zip")
+BUNDLE_MIME = {"xlsx": XLSX_MIME, "pdf": PDF_MIME, "zip": ZIP_MIME}
+MODUL_MIME = {"pdf": PDF_MIME, "xlsx": XLSX_MIME, "csv": CSV_MIME}
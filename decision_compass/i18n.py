@@ -0,0 +1,72 @@
+"""Translation catalog for all UI strings.
+
+Each language is one JSON file in ``locales/`` (``de.json`` -> ``"DE"``); adding
+a file adds a language. The catalog is read once per process and lookups are
+plain dict accesses. Run ``python -m decision_compass.i18n`` to list keys that
+are missing compared to the default language.
+"""
+import json
+import logging
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+LOCALES_DIR = Path(__file__).resolve().parent / "locales"
+DEFAULT_LANGUAGE = "DE"
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def load_catalog():
+    """Read every locale file once: {language code: {key: value}}"""
+    catalog = {}
+    for pfad in sorted(LOCALES_DIR.glob("*.json")):
+        with open(pfad, encoding="utf-8") as f:
+            catalog[pfad.stem.upper()] = json.load(f)
+    for sprache, fehlend in missing_keys(catalog).items():
+        _LOGGER.warning("Locale %s is missing %d key(s): %s", sprache, len(fehlend), ", ".join(fehlend))
+    return catalog
+
+
+def missing_keys(catalog):
+    """Keys of the default language that other languages lack"""
+    referenz = set(catalog.get(DEFAULT_LANGUAGE, {}))
+    return {
+        sprache: sorted(referenz - set(eintraege))
+        for sprache, eintraege in catalog.items()
+        if referenz - set(eintraege)
+    }
+
+
+def available_languages():
+    """Language codes with the default language first"""
+    codes = list(load_catalog())
+    return sorted(codes, key=lambda code: (code != DEFAULT_LANGUAGE, code))
+
+
+def get_text(key, lang, **kwargs):
+    """Get translated text for given key, falling back to the default language and then to the key"""
+    catalog = load_catalog()
+    wert = catalog.get(lang, {}).get(key)
+    if wert is None:
+        wert = catalog[DEFAULT_LANGUAGE].get(key, key)
+    if kwargs:
+        return wert.format(**kwargs)
+    return wert
+
+
+def main():
+    load_catalog.cache_clear()
+    fehlend = missing_keys(load_catalog())
+    for sprache, keys in fehlend.items():
+        print(f"{sprache}: {len(keys)} missing key(s)")
+        for key in keys:
+            print(f"  {key}")
+    if not fehlend:
+        print(f"OK: {', '.join(available_languages())} complete")
+    return 1 if fehlend else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,256 @@
+"""Bulk import of Eisenhower tasks, RACI rows and BSC objectives from CSV or XLSX.
+
+Files in the export format round-trip: the raw field names, the column titles of
+the UI in any language, ';' or ',' separated CSV with or without BOM, decimal
+commas and the sheets of the bundle workbook are all accepted. Validation runs on
+whole columns; valid rows are stored in one transaction, every rejected row is
+listed in the error report with its line in the file.
+"""
+import io
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from decision_compass.i18n import available_languages, get_text
+from decision_compass.profiling import gemessen
+from decision_compass.storage import OBJECTIVE_FIELDS, PERSPEKTIVEN, QUADRANTEN, RICHTUNGEN
+
+IMPORT_MODULE = ("eisenhower_matrix", "raci_matrix", "balanced_scorecard")
+FEHLER_SPALTEN = ["zeile", "spalte", "wert", "fehler"]
+TITEL_KEYS = {"eisenhower_matrix": "eis_pdf_title", "raci_matrix": "raci_pdf_title", "balanced_scorecard": "bsc_pdf_title"}
+
+# anzahl: stored rows, fehler: DataFrame with FEHLER_SPALTEN (zeile = line in the file, header = 1)
+ImportErgebnis = namedtuple("ImportErgebnis", ["anzahl", "fehler"])
+
+
+def _uebersetzungen(key):
+    """Values of a locale key in every language"""
+    return [get_text(key, lang) for lang in available_languages()]
+
+
+def _schluessel(text):
+    return str(text).strip().casefold()
+
+
+# --- Reading ---
+def lese_tabelle(daten, dateiname, modul=None):
+    """DataFrame of strings ('' for empty cells) from CSV or XLSX bytes
+
+    For workbooks the sheet titled like the module (bundle export) is used, otherwise the first.
+    """
+    if dateiname.lower().endswith((".xlsx", ".xlsm")):
+        with pd.ExcelFile(io.BytesIO(daten)) as mappe:
+            titel = {_schluessel(t) for t in _uebersetzungen(TITEL_KEYS[modul])} if modul else set()
+            name = next((n for n in mappe.sheet_names if _schluessel(n) in titel), mappe.sheet_names[0])
+            return mappe.parse(name, dtype=str, keep_default_na=False)
+    for encoding in ("utf-8-sig", "cp1252", "latin-1"):
+        try:
+            text = daten.decode(encoding)
+            break
+        except UnicodeDecodeError:
+            continue
+    kopf = text.split("\n", 1)[0]
+    trenner = max(";,\t", key=kopf.count)
+    return pd.read_csv(io.StringIO(text), sep=trenner, dtype=str, keep_default_na=False)
+
+
+def _spalten(df, felder):
+    """{field: column name in df} for fields given as {field: [accepted titles]}, matched case-insensitively"""
+    vorhanden = {_schluessel(spalte): spalte for spalte in df.columns}
+    gefunden = {}
+    for feld, titel in felder.items():
+        for kandidat in (feld, *titel):
+            if _schluessel(kandidat) in vorhanden:
+                gefunden[feld] = vorhanden[_schluessel(kandidat)]
+                break
+    return gefunden
+
+
+def _text(df, spalte):
+    return df[spalte].astype(str).str.strip() if spalte in df else pd.Series("", index=df.index)
+
+
+def zahlen(werte):
+    """Vectorized ``storage._zahl``: (floats with NaN for empty, mask of unparsable cells)"""
+    text = werte.astype(str).str.replace(" ", "", regex=False).str.rstrip("%")
+    komma = text.str.contains(",", regex=False)
+    text = text.where(~komma, text.str.replace(".", "", regex=False).str.replace(",", ".", regex=False))
+    zahl = pd.to_numeric(text, errors="coerce")
+    return zahl, zahl.isna() & (text != "")
+
+
+class _Bericht:
+    """Collects per-row errors; ``ok`` is the mask of rows without any"""
+
+    def __init__(self, df, lang):
+        self.ok = np.ones(len(df), dtype=bool)
+        self.lang = lang
+        self.teile = []
+
+    def melde(self, maske, spalte, werte, key, **kwargs):
+        maske = np.asarray(maske, dtype=bool)
+        if maske.any():
+            zeilen = np.flatnonzero(maske)
+            self.ok &= ~maske
+            self.teile.append(pd.DataFrame({
+                "zeile": zeilen + 2,
+                "spalte": spalte,
+                "wert": np.asarray(werte, dtype=object)[zeilen] if werte is not None else "",
+                "fehler": get_text(key, self.lang, **kwargs),
+            }))
+
+    def fehler(self):
+        if not self.teile:
+            return pd.DataFrame(columns=FEHLER_SPALTEN)
+        return pd.concat(self.teile, ignore_index=True).sort_values("zeile", kind="stable").reset_index(drop=True)
+
+
+def _fehlende_spalten(fehlend, lang):
+    return ImportErgebnis(0, pd.DataFrame(
+        [{"zeile": 1, "spalte": feld, "wert": "", "fehler": get_text("import_missing_column", lang)} for feld in fehlend],
+        columns=FEHLER_SPALTEN,
+    ))
+
+
+# --- Validation per module ---
+def pruefe_tasks(df, lang):
+    """([(beschreibung, wichtigkeit, dringlichkeit, quadrant)], report); the quadrant follows from the two ratings"""
+    felder = {
+        "beschreibung": _uebersetzungen("task_column") + _uebersetzungen("task_description"),
+        "wichtigkeit": _uebersetzungen("importance"),
+        "dringlichkeit": _uebersetzungen("urgency"),
+    }
+    spalten = _spalten(df, felder)
+    fehlend = [feld for feld in felder if feld not in spalten]
+    if fehlend:
+        return None, _fehlende_spalten(fehlend, lang)
+    bericht = _Bericht(df, lang)
+    beschreibung = _text(df, spalten["beschreibung"])
+    bericht.melde(beschreibung == "", spalten["beschreibung"], beschreibung, "import_required")
+
+    ergebnis = {}
+    for feld, key in (("wichtigkeit", "importance_options"), ("dringlichkeit", "urgency_options")):
+        # Option 0 ("Wichtig"/"Important", "Dringend"/"Urgent") is the high one, in any language
+        stufe = {_schluessel(optionen[i]): i == 0 for optionen in _uebersetzungen(key) for i in range(2)}
+        werte = _text(df, spalten[feld])
+        hoch = werte.str.casefold().map(stufe)
+        bericht.melde(hoch.isna(), spalten[feld], werte, "import_unknown_value", erlaubt=" / ".join(get_text(key, lang)))
+        hoch = hoch.fillna(False).astype(bool).to_numpy()
+        ergebnis[feld] = np.where(hoch, get_text(key, lang)[0], get_text(key, lang)[1])
+        ergebnis[f"{feld}_hoch"] = hoch
+
+    quadrant = np.array(QUADRANTEN)[np.where(ergebnis["wichtigkeit_hoch"], 0, 2) + np.where(ergebnis["dringlichkeit_hoch"], 0, 1)]
+    ok = bericht.ok
+    tasks = list(zip(
+        beschreibung.to_numpy()[ok].tolist(), ergebnis["wichtigkeit"][ok].tolist(), ergebnis["dringlichkeit"][ok].tolist(), quadrant[ok].tolist()
+    ))
+    return tasks, bericht
+
+
+def pruefe_raci(df, lang):
+    """([(beschreibung, {role: code})], roles in column order, report); every column besides the task is a role"""
+    spalten = _spalten(df, {"beschreibung": ["Aufgabe", *_uebersetzungen("task_column"), *_uebersetzungen("task_description")]})
+    if "beschreibung" not in spalten:
+        return None, None, _fehlende_spalten(["Aufgabe"], lang)
+    bericht = _Bericht(df, lang)
+    beschreibung = _text(df, spalten["beschreibung"])
+    bericht.melde(beschreibung == "", spalten["beschreibung"], beschreibung, "import_required")
+
+    rollen = [str(spalte).strip() for spalte in df.columns if spalte != spalten["beschreibung"]]
+    codes = df[[s for s in df.columns if s != spalten["beschreibung"]]].astype(str).apply(lambda s: s.str.strip().str.upper()).to_numpy(dtype=object, copy=True)
+    codes[codes == ""] = "-"
+    for j, rolle in enumerate(rollen):
+        falsch = ~np.isin(codes[:, j], ["-", "R", "A", "C", "I"])
+        bericht.melde(falsch, rolle, codes[:, j], "import_unknown_value", erlaubt="R / A / C / I / -")
+
+    ok = bericht.ok
+    tasks = [
+        (text, {rollen[j]: code for j, code in enumerate(zeile) if code != "-"})
+        for text, zeile in zip(beschreibung.to_numpy()[ok].tolist(), codes[ok].tolist())
+    ]
+    return tasks, rollen, bericht
+
+
+def pruefe_objectives(df, lang):
+    """([{field: value}], report); perspectives and KPI directions as keys or names in any language, numbers as in the exports"""
+    felder = {
+        "perspektive": _uebersetzungen("perspective"),
+        "bereich": _uebersetzungen("business_unit"),
+        "ziel": _uebersetzungen("strategic_objective"),
+        "kennzahl": _uebersetzungen("kpi"),
+        "zielwert": _uebersetzungen("target_value"),
+        "istwert": _uebersetzungen("actual_value"),
+        "richtung": _uebersetzungen("kpi_direction"),
+        "gewicht": _uebersetzungen("weight"),
+        "massnahmen": _uebersetzungen("measures"),
+    }
+    spalten = _spalten(df, felder)
+    fehlend = [feld for feld in ("perspektive", "ziel", "kennzahl") if feld not in spalten]
+    if fehlend:
+        return None, _fehlende_spalten(fehlend, lang)
+    bericht = _Bericht(df, lang)
+    werte = {feld: _text(df, spalten.get(feld)) for feld in felder}
+
+    namen = {_schluessel(p): p for p in PERSPEKTIVEN}
+    for uebersetzung in _uebersetzungen("perspectives"):
+        namen.update({_schluessel(name): p for name, p in zip(uebersetzung, PERSPEKTIVEN)})
+    perspektive = werte["perspektive"].str.casefold().map(namen)
+    bericht.melde(perspektive.isna(), spalten["perspektive"], werte["perspektive"], "import_unknown_value",
+                  erlaubt=" / ".join(get_text("perspectives", lang)))
+    for feld in ("ziel", "kennzahl"):
+        bericht.melde(werte[feld] == "", spalten[feld], werte[feld], "import_required")
+
+    # An empty direction means higher is better
+    richtungen = {"": "hoch", **{_schluessel(r): r for r in RICHTUNGEN}}
+    for uebersetzung in _uebersetzungen("kpi_directions"):
+        richtungen.update({_schluessel(name): r for name, r in zip(uebersetzung, RICHTUNGEN)})
+    richtung = werte["richtung"].str.casefold().map(richtungen)
+    bericht.melde(richtung.isna(), spalten.get("richtung", "richtung"), werte["richtung"], "import_unknown_value",
+                  erlaubt=" / ".join(get_text("kpi_directions", lang)))
+
+    zahl = {}
+    for feld in ("zielwert", "istwert", "gewicht"):
+        zahl[feld], falsch = zahlen(werte[feld])
+        bericht.melde(falsch, spalten.get(feld, feld), werte[feld], "import_not_a_number")
+    gewicht = zahl["gewicht"].fillna(1.0)
+    bericht.melde(gewicht < 0, spalten.get("gewicht", "gewicht"), werte["gewicht"], "import_negative")
+
+    tabelle = pd.DataFrame({
+        "perspektive": perspektive, "bereich": werte["bereich"], "ziel": werte["ziel"], "kennzahl": werte["kennzahl"],
+        "zielwert": zahl["zielwert"], "istwert": zahl["istwert"], "richtung": richtung, "gewicht": gewicht, "massnahmen": werte["massnahmen"],
+    })[list(OBJECTIVE_FIELDS)][bericht.ok]
+    ziele = tabelle.astype(object).where(tabelle.notna(), None).to_dict("records")
+    return ziele, bericht
+
+
+# --- Import ---
+@gemessen
+def importiere(storage, workspace, modul, daten, dateiname, lang):
+    """Validate an uploaded file and store its valid rows; returns ImportErgebnis"""
+    try:
+        df = lese_tabelle(daten, dateiname, modul)
+    except (ValueError, UnicodeDecodeError, pd.errors.ParserError) as exc:
+        return ImportErgebnis(0, pd.DataFrame([{"zeile": 1, "spalte": "", "wert": dateiname, "fehler": str(exc)}], columns=FEHLER_SPALTEN))
+    df.columns = [str(spalte).strip() for spalte in df.columns]
+
+    if modul == "eisenhower_matrix":
+        zeilen, bericht = pruefe_tasks(df, lang)
+        if zeilen is None:
+            return bericht
+        storage.add_tasks(workspace, zeilen)
+    elif modul == "raci_matrix":
+        zeilen, rollen, bericht = pruefe_raci(df, lang)
+        if zeilen is None:
+            return bericht
+        for rolle in rollen:
+            storage.add_role(workspace, rolle)
+        storage.add_raci_tasks(workspace, zeilen)
+    elif modul == "balanced_scorecard":
+        zeilen, bericht = pruefe_objectives(df, lang)
+        if zeilen is None:
+            return bericht
+        storage.add_objectives(workspace, zeilen)
+    else:
+        raise ValueError(f"Unknown module {modul!r}, expected one of {', '.join(IMPORT_MODULE)}")
+    return ImportErgebnis(len(zeilen), bericht.fehler())
@@ -0,0 +1,178 @@
+"""Background export jobs: bounded queue, progress reporting, cooperative cancellation, result retention.
+
+A builder runs as ``builder(melde)`` in a worker thread and calls ``melde(anteil)``
+with its progress (0..1); after ``cancel()`` the next call raises ``JobCancelled``,
+which ends the job. Each owner (workspace) may have ``max_per_owner`` jobs queued or
+running, all owners together ``max_queued``. Finished results are kept for ``ttl`` seconds so a later rerun
+(or a reloaded page of the same workspace) can still fetch them; once they hold more
+than ``max_bytes`` together, the oldest finished jobs are dropped early.
+"""
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from decision_compass.config import job_settings
+
+logger = logging.getLogger(__name__)
+
+WARTEND, LAEUFT, FERTIG, FEHLER, ABGEBROCHEN = "wartend", "laeuft", "fertig", "fehler", "abgebrochen"
+STATUS = (WARTEND, LAEUFT, FERTIG, FEHLER, ABGEBROCHEN)
+
+
+class QueueFull(RuntimeError):
+    """Raised by ``JobQueue.submit`` while the maximum number of jobs is queued or running"""
+
+
+class OwnerQueueFull(QueueFull):
+    """Raised by ``JobQueue.submit`` while the owner already has its maximum number of jobs queued or running"""
+
+
+class JobCancelled(Exception):
+    """Raised inside a builder once its job was cancelled"""
+
+
+class ExportJob:
+    """State of one export; read by the UI, written by the worker"""
+
+    def __init__(self, owner, file_name, mime):
+        self.id = uuid.uuid4().hex
+        self.owner = owner
+        self.file_name = file_name
+        self.mime = mime
+        self.status = WARTEND
+        self.fortschritt = 0.0
+        self.ergebnis = None
+        self.fehler = None
+        self.erstellt = time.time()
+        self.beendet = None
+        self._abbrechen = threading.Event()
+
+    @property
+    def aktiv(self):
+        return self.status in (WARTEND, LAEUFT)
+
+    def melde(self, anteil):
+        """Progress callback for builders; raises JobCancelled after cancel()"""
+        if self._abbrechen.is_set():
+            raise JobCancelled(self.id)
+        self.fortschritt = min(1.0, max(self.fortschritt, float(anteil)))
+
+
+class JobQueue:
+    """Thread pool with a bounded number of outstanding jobs, per owner and in total"""
+
+    def __init__(self, workers=2, max_queued=8, ttl=600, max_bytes=256 * 1024 * 1024, max_per_owner=2):
+        self.max_queued = max_queued
+        self.max_per_owner = max_per_owner
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._executor = ThreadPoolExecutor(workers, thread_name_prefix="export-job")
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, owner, file_name, mime, builder):
+        """Queue ``builder(melde) -> bytes``
+
+        Raises OwnerQueueFull when ``owner`` has ``max_per_owner`` jobs outstanding, QueueFull when all owners
+        together have ``max_queued``.
+        """
+        with self._lock:
+            self._aufraeumen()
+            if self._aktive(owner) >= self.max_per_owner:
+                raise OwnerQueueFull(f"{owner} already has {self.max_per_owner} export jobs queued or running")
+            if sum(job.aktiv for job in self._jobs.values()) >= self.max_queued:
+                raise QueueFull(f"{self.max_queued} export jobs are already queued or running")
+            job = ExportJob(owner, file_name, mime)
+            self._jobs[job.id] = job
+        self._executor.submit(self._ausfuehren, job, builder)
+        return job
+
+    def _ausfuehren(self, job, builder):
+        if job._abbrechen.is_set():
+            job.status = ABGEBROCHEN
+        else:
+            job.status = LAEUFT
+            try:
+                job.ergebnis = builder(job.melde)
+                job.fortschritt = 1.0
+                job.status = FERTIG
+            except JobCancelled:
+                job.status = ABGEBROCHEN
+            except Exception as exc:
+                logger.exception("Export job %s (%s) failed", job.id, job.file_name)
+                job.fehler = str(exc)
+                job.status = FEHLER
+        with self._lock:
+            job.beendet = time.time()
+            self._aufraeumen()
+
+    def _aufraeumen(self):
+        """Drop jobs finished longer than ``ttl`` ago, then the oldest finished ones beyond ``max_bytes``"""
+        grenze = time.time() - self.ttl
+        for job_id in [j.id for j in self._jobs.values() if j.beendet is not None and j.beendet < grenze]:
+            del self._jobs[job_id]
+        # The newest result stays even on its own over the limit, its owner is about to download it
+        beendet = sorted((j for j in self._jobs.values() if j.beendet is not None), key=lambda j: j.beendet)
+        belegt = sum(len(j.ergebnis or b"") for j in beendet)
+        for job in beendet[:-1]:
+            if belegt <= self.max_bytes:
+                break
+            belegt -= len(job.ergebnis or b"")
+            del self._jobs[job.id]
+
+    def _aktive(self, owner):
+        return sum(job.aktiv and job.owner == owner for job in self._jobs.values())
+
+    def limit_erreicht(self, owner):
+        """True while ``owner`` cannot queue another job"""
+        with self._lock:
+            return self._aktive(owner) >= self.max_per_owner
+
+    def get(self, job_id):
+        with self._lock:
+            self._aufraeumen()
+            return self._jobs.get(job_id)
+
+    def jobs(self, owner):
+        """Jobs of one owner (workspace), oldest first"""
+        with self._lock:
+            self._aufraeumen()
+            return [job for job in self._jobs.values() if job.owner == owner]
+
+    def cancel(self, job_id):
+        """Request cancellation; a queued job never starts, a running one stops at its next progress report"""
+        job = self.get(job_id)
+        if job is None or not job.aktiv:
+            return False
+        job._abbrechen.set()
+        return True
+
+    def remove(self, job_id):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None and not job.aktiv:
+                del self._jobs[job_id]
+
+    def stats(self):
+        """Number of retained jobs per status"""
+        with self._lock:
+            anzahl = dict.fromkeys(STATUS, 0)
+            for job in self._jobs.values():
+                anzahl[job.status] += 1
+            return anzahl
+
+
+_queue = None
+_queue_lock = threading.Lock()
+
+
+def job_queue():
+    """Process-wide queue shared by all sessions"""
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = JobQueue(*job_settings())
+        return _queue
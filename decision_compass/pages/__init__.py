@@ -0,0 +1,5 @@
+"""Pages of the app, one module per navigation entry.
+
+app.py registers them with ``st.navigation``; a page module is imported the first
+time it is opened and its ``seite()`` runs on every rerun of that page only.
+"""
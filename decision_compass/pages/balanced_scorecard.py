@@ -0,0 +1,176 @@
+"""Balanced Scorecard: objectives per perspective with weighted achievement rollups."""
+import pandas as pd
+import streamlit as st
+
+from decision_compass.bsc import BscIndex
+from decision_compass.bundle import bsc_export
+from decision_compass.profiling import fragment_lauf
+from decision_compass.storage import PERSPEKTIVEN, RICHTUNGEN
+from decision_compass.ui import export_bereich, get_storage, import_bereich, t, sprache, workspace_id
+
+PERSPEKTIVEN_STIL = [
+    {"emoji": "💰", "color": "#e9ecef"},
+    {"emoji": "👥", "color": "#d8f3dc"},
+    {"emoji": "⚙️", "color": "#fff3cd"},
+    {"emoji": "📚", "color": "#cce7ff"}
+]
+
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def bsc_auswertung(_storage, workspace, revision):
+    """BSC index with rollups; ``revision`` is the cache key, so only writes cause a rebuild
+
+    Shared, not copied: a cache_data hit would unpickle the whole index on every (fragment) rerun.
+    The page only reads the result.
+    """
+    index = BscIndex(_storage.list_objectives(workspace))
+    return index, index.rollup(), index.rollup(nach_bereich=True)
+
+
+@st.fragment
+@fragment_lauf
+def scorecard_ansicht():
+    """Perspective tables, summary and unit breakdown; the unit filter reruns only this view"""
+    storage, workspace = get_storage(), workspace_id()
+    perspektiven_namen = dict(zip(PERSPEKTIVEN, t("perspectives")))
+
+    # Index and rollups are rebuilt only when an objective changes
+    bsc, bsc_rollup, bsc_rollup_bereiche = bsc_auswertung(storage, workspace, storage.objectives_revision(workspace))
+
+    bereich_filter = None
+    if len(bsc.bereiche) > 1:
+        bereich_filter = st.selectbox(
+            t("business_unit"), [None, *bsc.bereiche],
+            format_func=lambda b: t("all_units") if b is None else (b or t("no_unit"))
+        )
+    if bereich_filter is None:
+        rollup = bsc_rollup
+    else:
+        rollup = {k: v[bsc.bereiche.index(bereich_filter)] for k, v in bsc_rollup_bereiche.items()}
+
+    perspektiven = dict(zip(PERSPEKTIVEN, PERSPEKTIVEN_STIL))
+    spalten = {
+        "ziel": st.column_config.TextColumn(t("strategic_objective")),
+        "kennzahl": st.column_config.TextColumn(t("kpi")),
+        "zielwert": st.column_config.NumberColumn(t("target_value"), format="%g"),
+        "istwert": st.column_config.NumberColumn(t("actual_value"), format="%g"),
+        "richtung": st.column_config.SelectboxColumn(t("kpi_direction"), options=RICHTUNGEN,
+                                                     format_func=dict(zip(RICHTUNGEN, t("kpi_directions"))).get),
+        "erreichung": st.column_config.ProgressColumn(t("achievement"), min_value=0, max_value=100, format="%.0f %%"),
+        "gewicht": st.column_config.NumberColumn(t("weight"), format="%g"),
+        "massnahmen": st.column_config.TextColumn(t("measures")),
+        "bereich": st.column_config.TextColumn(t("business_unit")),
+    }
+    if len(bsc.bereiche) < 2:
+        del spalten["bereich"]
+
+    for perspektive, info in perspektiven.items():
+        zeilen = bsc.zeilen(perspektive, bereich_filter)
+
+        if len(zeilen):
+            st.markdown(f"""
+            <div style='background-color: {info['color']}; padding: 15px; border-radius: 10px; margin-bottom: 20px; border-left: 5px solid #495057;'>
+                <h4>{info['emoji']} {perspektiven_namen[perspektive]}</h4>
+            </div>
+            """, unsafe_allow_html=True)
+
+            tabelle = pd.DataFrame([bsc.ziele[i] for i in zeilen], columns=list(spalten))
+            tabelle["erreichung"] = bsc.erreichung[zeilen] * 100
+            st.dataframe(tabelle, column_config=spalten, hide_index=True, width="stretch")
+
+    # Zusammenfassung
+    st.subheader(t("summary"))
+    col1, col2, col3, col4 = st.columns(4)
+
+    for i, (perspektive, info) in enumerate(perspektiven.items()):
+        with [col1, col2, col3, col4][i]:
+            st.metric(f"{info['emoji']} {perspektiven_namen[perspektive]}", int(rollup["anzahl"][i]))
+            if rollup["gemessen"][i]:
+                st.caption(t(
+                    "bsc_rollup_caption",
+                    erreichung=f"{rollup['zielerreichung'][i]:.0f} %",
+                    score=f"{rollup['score'][i]:.0f} %",
+                    erreicht=int(rollup["erreicht"][i]),
+                    gemessen=int(rollup["gemessen"][i])
+                ))
+
+    if len(bsc.bereiche) > 1:
+        st.subheader(t("bsc_by_unit"))
+        st.dataframe(
+            pd.DataFrame(
+                bsc_rollup_bereiche["score"],
+                index=pd.Index([b or t("no_unit") for b in bsc.bereiche], name=t("business_unit")),
+                columns=[perspektiven_namen[p] for p in PERSPEKTIVEN]
+            ),
+            column_config={
+                perspektiven_namen[p]: st.column_config.ProgressColumn(min_value=0, max_value=100, format="%.0f %%")
+                for p in PERSPEKTIVEN
+            },
+            width="stretch"
+        )
+
+
+@st.fragment
+@fragment_lauf
+def ziele_bereich():
+    """Form, import, scorecard and export; adding or deleting objectives reruns only this fragment"""
+    language, storage, workspace = sprache(), get_storage(), workspace_id()
+    perspektiven_namen = dict(zip(PERSPEKTIVEN, t("perspectives")))
+
+    # Neue Ziele hinzufügen
+    with st.form("neues_bsc_ziel"):
+        st.subheader(t("add_new_objective"))
+
+        col1, col2 = st.columns(2)
+        with col1:
+            perspektive = st.selectbox(t("perspective"), PERSPEKTIVEN, format_func=perspektiven_namen.get)
+        with col2:
+            bereich = st.text_input(t("business_unit"))
+
+        ziel = st.text_input(t("strategic_objective"))
+        kennzahl = st.text_input(t("kpi"))
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            zielwert = st.number_input(t("target_value"), value=None, format="%g")
+        with col2:
+            istwert = st.number_input(t("actual_value"), value=None, format="%g")
+        with col3:
+            richtung = st.selectbox(t("kpi_direction"), RICHTUNGEN, format_func=dict(zip(RICHTUNGEN, t("kpi_directions"))).get,
+                                    help=t("kpi_direction_help"))
+        with col4:
+            gewicht = st.number_input(t("weight"), min_value=0.0, value=1.0, step=0.5)
+        massnahmen = st.text_area(t("measures"))
+
+        if st.form_submit_button(t("add_objective")):
+            if ziel and kennzahl:
+                storage.add_objective(workspace, perspektive, ziel, kennzahl, zielwert, massnahmen,
+                                      istwert=istwert, gewicht=gewicht, bereich=bereich.strip(), richtung=richtung)
+                st.success(t("objective_added"))
+
+    import_bereich("balanced_scorecard")
+
+    # Balanced Scorecard anzeigen
+    if sum(storage.count_objectives(workspace).values()):
+        st.subheader(t("your_bsc"))
+        scorecard_ansicht()
+
+        # Export Section (reads the stored objectives when the job runs)
+        st.divider()
+        st.subheader(t("export_header"))
+
+        export_bereich("balanced_scorecard", lambda: bsc_export(storage.list_objectives(workspace), language), gespeichert=True)
+
+        if st.button(t("delete_objectives")):
+            storage.clear_objectives(workspace)
+            st.rerun(scope="fragment")
+    else:
+        st.info(t("bsc_empty"))
+
+
+def seite():
+    st.title(t("bsc_title"))
+
+    with st.expander(t("about_tool")):
+        st.write(t("bsc_about"))
+
+    ziele_bereich()
@@ -0,0 +1,99 @@
+"""Eisenhower matrix: stored tasks by importance and urgency, paged per quadrant."""
+import streamlit as st
+
+from decision_compass.bundle import eisenhower_export
+from decision_compass.i18n import get_text
+from decision_compass.profiling import fragment_lauf, gemessen
+from decision_compass.templates import snippet
+from decision_compass.ui import export_bereich, get_storage, import_bereich, sprache, t, workspace_id
+
+QUADRANT_FARBEN = {"Q1": "#ff6b6b", "Q2": "#51cf66", "Q3": "#ffd43b", "Q4": "#868e96"}
+EISENHOWER_SEITENGROESSE = 25
+
+
+@gemessen
+def create_eisenhower_matrix(counts, load_page, lang, page_size=EISENHOWER_SEITENGROESSE):
+    """Create Eisenhower matrix as colored 2x2 grid, one page of tasks per quadrant
+
+    ``counts`` maps quadrant to its number of tasks, ``load_page(quadrant, offset, limit)``
+    returns the tasks of one page, so only the visible tasks are fetched and sent.
+    Task descriptions are escaped; the quadrant style comes from the shared stylesheet.
+    """
+    titles = get_text("quadrant_titles", lang)
+    no_tasks = get_text("no_tasks", lang)
+    zeilen = [st.columns(2), st.columns(2)]
+    for i, (q, color) in enumerate(QUADRANT_FARBEN.items()):
+        anzahl = counts.get(q, 0)
+        seiten = max(1, -(-anzahl // page_size))
+        with zeilen[i // 2][i % 2]:
+            seite = 1
+            if seiten > 1:
+                seite = st.number_input(get_text("page_of", lang, pages=seiten), min_value=1, max_value=seiten, value=1, step=1, key=f"eis_seite_{q}")
+            tasks = load_page(q, (seite - 1) * page_size, page_size) if anzahl else []
+            st.markdown(snippet("eisenhower_quadrant", "light", lang, no_tasks, farbe=color, titel=titles[q], anzahl=anzahl,
+                                eintraege=[task["beschreibung"] for task in tasks]), unsafe_allow_html=True)
+
+
+@st.fragment
+@fragment_lauf
+def matrix_ansicht():
+    """Quadrants with paging; turning a page reruns only this view"""
+    language, storage, workspace = sprache(), get_storage(), workspace_id()
+    create_eisenhower_matrix(
+        storage.count_tasks(workspace),
+        lambda q, offset, limit: storage.list_tasks(workspace, quadrant=q, offset=offset, limit=limit),
+        language
+    )
+
+
+@st.fragment
+@fragment_lauf
+def aufgaben_bereich():
+    """Form, import, matrix and export; adding or deleting tasks reruns only this fragment"""
+    language, storage, workspace = sprache(), get_storage(), workspace_id()
+
+    # Neue Aufgabe hinzufügen
+    with st.form("neue_aufgabe"):
+        st.subheader(t("add_new_task"))
+        aufgabe = st.text_input(t("task_description"))
+        wichtigkeit_optionen = t("importance_options")
+        dringlichkeit_optionen = t("urgency_options")
+        wichtigkeit = st.selectbox(t("importance"), wichtigkeit_optionen)
+        dringlichkeit = st.selectbox(t("urgency"), dringlichkeit_optionen)
+
+        if st.form_submit_button(t("add_task")):
+            if aufgabe:
+                wichtig = wichtigkeit == wichtigkeit_optionen[0]
+                dringend = dringlichkeit == dringlichkeit_optionen[0]
+                quadrant = f"Q{1 if wichtig and dringend else 2 if wichtig else 3 if dringend else 4}"
+                storage.add_task(workspace, aufgabe, wichtigkeit, dringlichkeit, quadrant)
+                st.success(t("task_added"))
+
+    import_bereich("eisenhower_matrix")
+
+    # Matrix anzeigen
+    if sum(storage.count_tasks(workspace).values()):
+        st.subheader(t("your_eisenhower_matrix"))
+        matrix_ansicht()
+
+        # Export Section (the full task list is only read when an export is requested)
+        st.divider()
+        st.subheader(t("export_header"))
+
+        export_bereich("eisenhower_matrix", lambda: eisenhower_export(storage.list_tasks(workspace), language), gespeichert=True)
+
+        # Lösch-Button
+        if st.button(t("delete_all_tasks")):
+            storage.clear_tasks(workspace)
+            st.rerun(scope="fragment")
+    else:
+        st.info(t("eis_empty"))
+
+
+def seite():
+    st.title(t("eis_title"))
+
+    with st.expander(t("about_tool")):
+        st.write(t("eis_about"))
+
+    aufgaben_bereich()
@@ -0,0 +1,175 @@
+"""RACI matrix: roles, tasks and the editable responsibility grid with consistency checks."""
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from decision_compass.bundle import raci_export
+from decision_compass.i18n import get_text
+from decision_compass.profiling import fragment_lauf, gemessen
+from decision_compass.raci import REGELN, RaciMatrix
+from decision_compass.ui import export_bereich, get_storage, import_bereich, sprache, t, workspace_id
+
+RACI_MAX_NAMEN = 5
+RACI_SEITENGROESSE = 500
+RACI_SYMBOLE = {"-": "·", "R": "🟥 R", "A": "🟧 A", "C": "🟦 C", "I": "🟩 I"}
+
+
+def raci_zellen_speichern(storage, workspace, key, task_ids):
+    """on_change of the RACI grid: write the edited cells straight to storage"""
+    aenderungen = [
+        (int(task_ids[zeile]), rolle, code)
+        for zeile, spalten in st.session_state[key]["edited_rows"].items()
+        for rolle, code in spalten.items()
+    ]
+    if aenderungen:
+        storage.set_raci_assignments(workspace, aenderungen)
+    # A fresh editor key drops the applied edits, the next run shows the stored state
+    st.session_state.raci_grid_version = st.session_state.get("raci_grid_version", 0) + 1
+
+
+@gemessen
+def create_raci_grid(matrix, storage, workspace, lang, page_size=RACI_SEITENGROESSE):
+    """Editable RACI grid: filter and page on the code array, the browser only gets one page
+
+    The grid renders virtualized and sorts by column header; cells are edited in
+    place and saved by ``raci_zellen_speichern``.
+    """
+    col1, col2, col3 = st.columns([2, 2, 1])
+    with col1:
+        suche = st.text_input(get_text("raci_filter_tasks", lang), key="raci_filter_text")
+    with col2:
+        rollen = st.multiselect(get_text("raci_filter_roles", lang), matrix.rollen, key="raci_filter_rollen") or matrix.rollen
+    with col3:
+        nur_verstoesse = st.checkbox(get_text("raci_only_issues", lang), key="raci_filter_verstoesse")
+
+    maske = np.ones(len(matrix), dtype=bool)
+    if suche:
+        maske &= pd.Series(matrix.aufgaben).str.contains(suche, case=False, regex=False).to_numpy()
+    if nur_verstoesse:
+        maske &= matrix.zeilen_mit_verstoss()
+    zeilen = np.flatnonzero(maske)
+
+    seiten = max(1, -(-len(zeilen) // page_size))
+    seite = 1
+    if seiten > 1:
+        seite = st.number_input(get_text("page_of", lang, pages=seiten), min_value=1, max_value=seiten, value=1, step=1, key="raci_seite")
+    zeilen = zeilen[(seite - 1) * page_size:seite * page_size]
+    if not len(zeilen):
+        st.info(get_text("no_entries", lang))
+        return
+
+    spalte = get_text("task_column", lang)
+    daten = pd.DataFrame(matrix.buchstaben(zeilen), columns=matrix.rollen)
+    daten.insert(0, spalte, [matrix.aufgaben[i] for i in zeilen])
+    key = f"raci_grid_{st.session_state.get('raci_grid_version', 0)}"
+    st.data_editor(
+        daten,
+        key=key,
+        hide_index=True,
+        width="stretch",
+        column_order=[spalte, *rollen],
+        disabled=[spalte],
+        column_config={
+            rolle: st.column_config.SelectboxColumn(rolle, options=list(RACI_SYMBOLE), required=True, format_func=RACI_SYMBOLE.get)
+            for rolle in rollen
+        },
+        on_change=raci_zellen_speichern,
+        args=(storage, workspace, key, matrix.task_ids[zeilen])
+    )
+    st.caption(get_text("raci_grid_hint", lang))
+
+
+@st.fragment
+@fragment_lauf
+def raci_ansicht():
+    """Grid, legend and consistency check; edits, filters and paging rerun only this view"""
+    language, storage, workspace = sprache(), get_storage(), workspace_id()
+
+    # One snapshot query, held as a tasks x roles code array
+    raci_matrix = RaciMatrix.from_snapshot(storage.raci_snapshot(workspace))
+    create_raci_grid(raci_matrix, storage, workspace, language)
+
+    # Legende
+    st.markdown(t("raci_legend"))
+
+    # Konsistenzprüfung
+    st.subheader(t("raci_check_header"))
+    verstoesse = raci_matrix.validate()
+    if any(len(idx) for idx in verstoesse.values()):
+        for regel in REGELN:
+            idx = verstoesse[regel]
+            if len(idx):
+                namen = raci_matrix.rollen if regel == "rolle_ohne_zuweisung" else raci_matrix.aufgaben
+                auszug = ", ".join(namen[i] for i in idx[:RACI_MAX_NAMEN]) + (" …" if len(idx) > RACI_MAX_NAMEN else "")
+                st.warning(t(f"raci_rule_{regel}", anzahl=len(idx), namen=auszug))
+    else:
+        st.success(t("raci_check_ok"))
+
+
+@st.fragment
+@fragment_lauf
+def raci_bereich():
+    """Roles, form, import, grid and export; adding roles or rows reruns only this fragment"""
+    language, storage, workspace = sprache(), get_storage(), workspace_id()
+
+    # Neue Workspaces mit Standardrollen starten
+    storage.ensure_roles(workspace, t("default_roles"))
+
+    # Rollen verwalten (added before the roles are read, so the form below already shows the new one)
+    st.subheader(t("define_roles"))
+    col1, col2 = st.columns([3, 1])
+
+    with col1:
+        neue_rolle = st.text_input(t("new_role"))
+
+    with col2:
+        if st.button(t("add_role")) and neue_rolle:
+            storage.add_role(workspace, neue_rolle)
+
+    raci_rollen = storage.list_roles(workspace)
+
+    # Aufgaben verwalten
+    st.subheader(t("define_tasks"))
+    with st.form("neue_raci_aufgabe"):
+        aufgaben_beschreibung = st.text_input(t("task_description"))
+
+        # RACI Auswahl für jede Rolle
+        raci_zuweisungen = {}
+        for rolle in raci_rollen:
+            raci_zuweisungen[rolle] = st.selectbox(
+                t("raci_for_role", rolle=rolle),
+                ["-", "R", "A", "C", "I"],
+                key=f"raci_{rolle}"
+            )
+
+        if st.form_submit_button(t("add_task")):
+            if aufgaben_beschreibung:
+                storage.add_raci_task(workspace, aufgaben_beschreibung, raci_zuweisungen)
+                st.success(t("task_added"))
+
+    import_bereich("raci_matrix")
+
+    if storage.count_raci_tasks(workspace):
+        st.subheader(t("raci_matrix_header"))
+        raci_ansicht()
+
+        # Export Section (reads the stored matrix when the job runs, so grid edits are included)
+        st.divider()
+        st.subheader(t("export_header"))
+
+        export_bereich("raci_matrix", lambda: raci_export(RaciMatrix.from_snapshot(storage.raci_snapshot(workspace)), language), gespeichert=True)
+
+        if st.button(t("delete_raci")):
+            storage.clear_raci_tasks(workspace)
+            st.rerun(scope="fragment")
+    else:
+        st.info(t("raci_empty"))
+
+
+def seite():
+    st.title(t("raci_title"))
+
+    with st.expander(t("about_tool")):
+        st.write(t("raci_about"))
+
+    raci_bereich()
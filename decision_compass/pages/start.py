@@ -0,0 +1,21 @@
+"""Start page: overview of the modules."""
+import streamlit as st
+
+from decision_compass.ui import t
+
+
+def seite():
+    st.title("🧭 Decision Compass")
+
+    st.write(t("welcome"))
+    st.write(t("choose_module"))
+
+    st.divider()
+
+    # Module descriptions
+    cols = st.columns(3)
+    for idx, info in enumerate(t("module_cards")):
+        with cols[idx % 3]:
+            st.subheader(f"{info['emoji']} {info['title']}")
+            st.write(info["description"])
+            st.button(t("open_module", title=info["title"]), key=f"btn_{idx}")
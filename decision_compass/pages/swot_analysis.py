@@ -0,0 +1,89 @@
+"""SWOT analysis: four text fields, quadrant view and strategy hints."""
+import streamlit as st
+
+from decision_compass.bundle import swot_export
+from decision_compass.i18n import get_text
+from decision_compass.profiling import fragment_lauf, gemessen
+from decision_compass.templates import SWOT_KLASSEN, snippet
+from decision_compass.ui import export_bereich, sprache, t
+
+
+@gemessen
+def create_swot_quadrant(strengths, weaknesses, opportunities, threats, lang):
+    """Create SWOT analysis as 2x2 quadrant visualization, one cached snippet per quadrant"""
+    titles = get_text("swot_quadrant_titles", lang)
+    no_entries = get_text("no_entries", lang)
+    felder = (strengths, weaknesses, opportunities, threats)
+    zeilen = [st.columns(2), st.columns(2)]
+    for i, (klasse, titel, text) in enumerate(zip(SWOT_KLASSEN, titles, felder)):
+        with zeilen[i // 2][i % 2]:
+            st.markdown(snippet("swot_quadrant", "light", lang, no_entries, klasse=klasse, titel=titel,
+                                eintraege=text.split("\n") if text else []), unsafe_allow_html=True)
+
+
+@st.fragment
+@fragment_lauf
+def swot_bereich():
+    """Inputs, quadrant, strategy hints and export; editing reruns only this fragment"""
+    language = sprache()
+
+    col1, col2 = st.columns(2)
+
+    # Inputs are restored from swot_felder, so they survive switching modules (and feed the global export)
+    felder = st.session_state.get("swot_felder", [""] * 4)
+    with col1:
+        st.subheader(t("internal_factors"))
+        staerken = st.text_area(t("strengths_label"), value=felder[0], placeholder=t("strengths_placeholder"), key="swot_staerken")
+        schwaechen = st.text_area(t("weaknesses_label"), value=felder[1], placeholder=t("weaknesses_placeholder"), key="swot_schwaechen")
+
+    with col2:
+        st.subheader(t("external_factors"))
+        chancen = st.text_area(t("opportunities_label"), value=felder[2], placeholder=t("opportunities_placeholder"), key="swot_chancen")
+        risiken = st.text_area(t("threats_label"), value=felder[3], placeholder=t("threats_placeholder"), key="swot_risiken")
+
+    if st.button(t("swot_create")):
+        st.session_state.swot_erstellt = True
+
+    if st.session_state.get("swot_erstellt"):
+        st.session_state.swot_felder = [staerken, schwaechen, chancen, risiken]
+        if staerken or schwaechen or chancen or risiken:
+            st.success(t("swot_created"))
+
+            # Visual SWOT Quadrant
+            create_swot_quadrant(staerken, schwaechen, chancen, risiken, language)
+
+            # Strategic Recommendations
+            st.subheader(t("strategic_implications"))
+            col1, col2 = st.columns(2)
+
+            with col1:
+                if staerken and chancen:
+                    st.info(t("so_strategy"))
+                if schwaechen and chancen:
+                    st.warning(t("wo_strategy"))
+
+            with col2:
+                if staerken and risiken:
+                    st.success(t("st_strategy"))
+                if schwaechen and risiken:
+                    st.error(t("wt_strategy"))
+
+            # Export Section
+            st.divider()
+            st.subheader(t("export_header"))
+
+            export_bereich("swot_analysis", lambda: swot_export([staerken, schwaechen, chancen, risiken], language))
+
+        else:
+            st.warning(t("swot_fill_one"))
+
+
+def seite():
+    st.title(t("swot_title"))
+
+    with st.expander(t("about_tool")):
+        st.write(t("swot_about"))
+
+    st.write(t("swot_intro"))
+
+    swot_bereich()
@@ -0,0 +1,145 @@
+"""Task analysis: questionnaire, task type scores and recommendation, plus the live team aggregate."""
+import pandas as pd
+import streamlit as st
+
+from decision_compass.bundle import analyse_export
+from decision_compass.profiling import fragment_lauf
+from decision_compass.scoring import FRAGEN, TYPEN, bewerte_antworten
+from decision_compass.team import erfasse_antwort, lade
+from decision_compass.ui import (
+    FARBEN, TYP_EMOJI, animated_progress, create_colored_box, export_bereich, get_storage, sprache, t, workspace_id
+)
+
+TEAM_AKTUALISIERUNG = 5  # seconds between refreshes of the team dashboard
+
+
+@st.fragment
+@fragment_lauf
+def analyse_bereich(mode):
+    """Questionnaire, result and export; submitting reruns only this fragment"""
+    language, colors = sprache(), FARBEN[mode]
+
+    # A shared link with ?team=<name> prefills the team field
+    if "team" in st.query_params and "team" not in st.session_state:
+        st.session_state.team = st.query_params["team"]
+
+    with st.form("fragen_form"):
+        antworten = []
+        for i, frage in enumerate(FRAGEN, start=1):
+            st.markdown(f"<span style='color:{colors['text']}; font-weight:bold'>{i}. {t(frage['key'])}</span>", unsafe_allow_html=True)
+            antwort = st.slider("", min_value=1, max_value=7, value=4, key=f"slider_{i}")
+            antworten.append((frage['typ'], antwort))
+        team = st.text_input(t("team_name"), key="team", help=t("team_name_help")).strip()
+        submitted = st.form_submit_button(t("start_analysis"))
+
+    # Keep the submitted answers so export clicks and later visits still see the result
+    if submitted:
+        st.session_state.analyse_antworten = antworten
+        if team:
+            storage, workspace = get_storage(), workspace_id()
+            neues_team = team not in storage.list_teams(workspace)
+            erfasse_antwort(storage, workspace, team, [wert for _, wert in antworten])
+            st.toast(t("team_added", team=team))
+            if neues_team:
+                st.rerun()  # the team dashboard outside this fragment starts polling
+
+    if "analyse_antworten" in st.session_state:
+        ergebnis = bewerte_antworten(st.session_state.analyse_antworten)
+        if ergebnis is None:
+            st.warning(t("no_task_recognized"))
+        else:
+            punkte = ergebnis["punkte"]
+            prozentuale_verteilung = ergebnis["prozentuale_verteilung"]
+            hybrid_typen = ergebnis["hybrid_typen"]
+            typ_namen = t("type_names")
+
+            st.success(t("analysis_complete"))
+
+            col1, col2 = st.columns(2)
+            with col1:
+                st.subheader(t("points_header"))
+                for typ, wert in punkte.items():
+                    animated_progress(value=wert, max_value=7, color=colors[typ], text=f"{TYP_EMOJI[typ]} {typ_namen[typ]}")
+            with col2:
+                st.subheader(t("distribution_header"))
+                for typ, prozent in prozentuale_verteilung.items():
+                    animated_progress(value=int(prozent), max_value=100, color=colors[typ], text=f"{TYP_EMOJI[typ]} {typ_namen[typ]} %", speed=0.01)
+
+            st.divider()
+            st.subheader(t("recommendation_header"))
+            typ_name = " + ".join([f"{TYP_EMOJI[typ]} {typ_namen[typ]}" for typ in hybrid_typen])
+
+            recommendations = t("recommendations")
+
+            bericht = ""
+            for typ in hybrid_typen:
+                bericht += recommendations[typ] + "\n\n"
+
+            create_colored_box(typ_name, bericht, colors["box"], theme=mode)
+
+            # Export Buttons
+            st.divider()
+            st.subheader(t("export_header"))
+            antworten = st.session_state.analyse_antworten
+            export_bereich("task_analysis", lambda: analyse_export(antworten, language))
+
+
+def team_bereich():
+    """Aggregate of the workspace's teams; each refresh reads one stored row per team"""
+    storage, workspace = get_storage(), workspace_id()
+    teams = storage.list_teams(workspace)
+    st.divider()
+    st.subheader(t("team_header"))
+    eigenes = st.session_state.get("team", "").strip()
+    auswahl = st.selectbox(t("team_select"), [None] + teams, index=1 + teams.index(eigenes) if eigenes in teams else 0,
+                           format_func=lambda team: t("team_all") if team is None else team, key="team_auswahl")
+    statistik = lade(storage, workspace, teams if auswahl is None else [auswahl])
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric(t("team_responses"), statistik.n)
+    col2.metric(t("team_recognized"), statistik.bewertet)
+    col3.metric(t("team_hybrid_share"), f"{statistik.hybrid_anteil():.0f} %" if statistik.bewertet else "–")
+
+    typ_namen = t("type_names")
+    st.markdown(f"**{t('team_types_header')}**")
+    typen = pd.DataFrame(statistik.typen())
+    typen.insert(0, "typ", [f"{TYP_EMOJI[typ]} {typ_namen[typ]}" for typ in TYPEN])
+    st.dataframe(typen.rename(columns=t("team_type_columns")).round(2), hide_index=True, width="stretch")
+
+    st.markdown(f"**{t('team_questions_header')}**")
+    fragen = pd.DataFrame(statistik.fragen()).drop(columns="einigkeit")
+    fragen.insert(0, "typ", [typ_namen[frage["typ"]] for frage in FRAGEN])
+    fragen.insert(0, "frage", [f"{i}. {t(frage['key'])}" for i, frage in enumerate(FRAGEN, start=1)])
+    fragen = fragen.sort_values("uneinigkeit", ascending=False)
+    st.dataframe(fragen.rename(columns=t("team_question_columns")).round(2), hide_index=True, width="stretch")
+    st.caption(t("team_agreement_hint"))
+
+    if auswahl is not None and st.button(t("team_reset")):
+        storage.clear_team(workspace, auswahl)
+        st.rerun()
+
+
+def seite():
+    st.title(t("ta_title"))
+
+    with st.expander(t("about_tool")):
+        st.write(t("ta_about"))
+
+    dark_mode = st.checkbox(t("dark_mode"), value=False)
+    mode = "dark" if dark_mode else "light"
+    colors = FARBEN[mode]
+
+    st.markdown(f"""
+    <style>
+    .stApp {{ background-color: {colors['background']}; color: {colors['text']}; }}
+    .css-1d391kg, .css-1d391kg * {{ color: {colors['text']} !important; }}
+    </style>
+    """, unsafe_allow_html=True)
+
+    st.write(t("ta_intro"))
+
+    analyse_bereich(mode)
+
+    # Live team dashboard: polls only while the workspace has team responses
+    if get_storage().list_teams(workspace_id()):
+        st.fragment(fragment_lauf(team_bereich), run_every=TEAM_AKTUALISIERUNG)()
@@ -0,0 +1,225 @@
+"""Opt-in timing of reruns and hot helpers.
+
+With DECISION_COMPASS_PROFILE unset (or ``off``) every span is a shared no-op. With
+``spans`` each rerun records its sections (``abschnitt``) and the nested helper spans
+(``span`` / ``@gemessen``); ``cprofile`` additionally runs cProfile for the rerun.
+Finished reruns are appended to the JSONL file in DECISION_COMPASS_PROFILE_LOG.
+A fragment that reruns on its own (``@fragment_lauf`` under ``@st.fragment``) is
+logged as a run of kind ``fragment``. Spans outside a run (export jobs in worker
+threads) are recorded as their own entry.
+"""
+import cProfile
+import contextvars
+import functools
+import io
+import json
+import pstats
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timezone
+
+from decision_compass.config import profiling_settings
+
+PROFILE_ZEILEN = 25  # functions kept from the cProfile stats, by cumulative time
+
+_aktuell = contextvars.ContextVar("decision_compass_lauf", default=None)
+_log_lock = threading.Lock()
+_AUS = nullcontext()
+
+
+class Lauf:
+    """Timings of one rerun (or one standalone span): [(name, depth, start ms, duration ms)]"""
+
+    def __init__(self, art, name, cprofile=False):
+        self.art, self.name = art, name
+        self.erstellt = datetime.now(timezone.utc).isoformat(timespec="milliseconds")
+        self.start = time.perf_counter()
+        self.spans = []
+        self.tiefe = 0
+        self.abschnitt = None
+        self.dauer_ms = None
+        self.profil = None
+        self._profiler = None
+        if cprofile:
+            self._profiler = cProfile.Profile()
+            try:
+                self._profiler.enable()
+            except ValueError:  # another profiler is active in this process
+                self._profiler = None
+
+    def _ms(self, t):
+        return (t - self.start) * 1000
+
+    def erfasse(self, name, tiefe, beginn, ende):
+        self.spans.append((name, tiefe, self._ms(beginn), (ende - beginn) * 1000))
+
+    def beende_abschnitt(self, jetzt):
+        if self.abschnitt is not None:
+            name, beginn = self.abschnitt
+            self.erfasse(name, 0, beginn, jetzt)
+            self.abschnitt = None
+
+    def beende(self):
+        jetzt = time.perf_counter()
+        self.beende_abschnitt(jetzt)
+        self.dauer_ms = self._ms(jetzt)
+        if self._profiler is not None:
+            self._profiler.disable()
+            self.profil = _profil_zeilen(self._profiler)
+            self._profiler = None
+        self.spans.sort(key=lambda s: (s[2], s[1]))  # parents before their children
+
+    def tabelle(self):
+        """Rows {name, depth, start_ms, ms, self_ms}; self time excludes nested spans"""
+        kinder = [0.0] * len(self.spans)
+        offen = []  # indices of the enclosing spans, one per depth
+        for i, (_, tiefe, _, dauer) in enumerate(self.spans):
+            del offen[tiefe:]
+            if offen:
+                kinder[offen[-1]] += dauer
+            offen.append(i)
+        return [
+            {"name": name, "depth": tiefe, "start_ms": round(start, 2), "ms": round(dauer, 2), "self_ms": round(dauer - kind, 2)}
+            for (name, tiefe, start, dauer), kind in zip(self.spans, kinder)
+        ]
+
+    def als_dict(self):
+        return {"ts": self.erstellt, "kind": self.art, "name": self.name, "total_ms": round(self.dauer_ms, 2),
+                "spans": self.tabelle(), "profile": self.profil}
+
+
+def _profil_zeilen(profiler):
+    stats = pstats.Stats(profiler, stream=io.StringIO())
+    eintraege = sorted(stats.stats.items(), key=lambda e: e[1][3], reverse=True)[:PROFILE_ZEILEN]
+    return [
+        {"function": f"{datei}:{zeile}({funktion})", "calls": aufrufe, "tottime_ms": round(tot * 1000, 2), "cumtime_ms": round(cum * 1000, 2)}
+        for (datei, zeile, funktion), (_, aufrufe, tot, cum, _) in eintraege
+    ]
+
+
+def _schreibe(lauf):
+    pfad = profiling_settings()[1]
+    if not pfad:
+        return
+    zeile = json.dumps(lauf.als_dict(), ensure_ascii=False)
+    with _log_lock, open(pfad, "a", encoding="utf-8") as f:
+        f.write(zeile + "\n")
+
+
+# --- Reruns ---
+def starte_lauf(name="rerun", art="rerun"):
+    """Begin timing the current rerun; returns None when profiling is off"""
+    alt = _aktuell.get()
+    if alt is not None and alt._profiler is not None:
+        alt._profiler.disable()  # previous rerun was cut short by st.rerun()/st.stop()
+    modus = profiling_settings()[0]
+    lauf = None if modus == "off" else Lauf(art, name, cprofile=modus == "cprofile")
+    _aktuell.set(lauf)
+    return lauf
+
+
+def abschnitt(name):
+    """Start the next top-level section of the rerun (ends the previous one)"""
+    lauf = _aktuell.get()
+    if lauf is not None:
+        jetzt = time.perf_counter()
+        lauf.beende_abschnitt(jetzt)
+        lauf.abschnitt = (name, jetzt)
+
+
+def beende_lauf():
+    """Finish the current rerun, append it to the log and return it (None when profiling is off)"""
+    lauf = _aktuell.get()
+    if lauf is None:
+        return None
+    _aktuell.set(None)
+    lauf.beende()
+    _schreibe(lauf)
+    return lauf
+
+
+# --- Fragments ---
+def _fragment_rerun():
+    """True while Streamlit reruns single fragments instead of the whole script"""
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx(suppress_warning=True)
+    return ctx is not None and bool(ctx.fragment_ids_this_run)
+
+
+def fragment_lauf(funktion=None, name=None):
+    """Decorator for ``st.fragment`` bodies: a span inside a full rerun, a run of its own when the fragment reruns alone
+
+    Goes under ``@st.fragment``. A fragment rerun skips app.py and with it ``starte_lauf``; a run
+    left over from a full rerun cut short by ``st.stop()`` is replaced instead of collecting the spans.
+    """
+    if funktion is None:
+        return functools.partial(fragment_lauf, name=name)
+    name = name or funktion.__name__
+
+    @functools.wraps(funktion)
+    def wrapper(*args, **kwargs):
+        lauf = _aktuell.get()
+        if lauf is not None and (lauf.art == "fragment" or not _fragment_rerun()):
+            with _span(lauf, name):
+                return funktion(*args, **kwargs)
+        if profiling_settings()[0] == "off":
+            return funktion(*args, **kwargs)
+        starte_lauf(name, art="fragment")
+        try:
+            return funktion(*args, **kwargs)
+        finally:
+            beende_lauf()
+
+    return wrapper
+
+
+# --- Spans ---
+@contextmanager
+def _span(lauf, name):
+    lauf.tiefe += 1
+    tiefe = lauf.tiefe
+    beginn = time.perf_counter()
+    try:
+        yield
+    finally:
+        lauf.erfasse(name, tiefe, beginn, time.perf_counter())
+        lauf.tiefe -= 1
+
+
+@contextmanager
+def _einzel_span(name):
+    lauf = Lauf("span", name)
+    token = _aktuell.set(lauf)
+    try:
+        with _span(lauf, name):
+            yield
+    finally:
+        _aktuell.reset(token)
+        lauf.beende()
+        _schreibe(lauf)
+
+
+def span(name):
+    """Context manager timing a block inside the current rerun; a standalone entry outside of one"""
+    lauf = _aktuell.get()
+    if lauf is not None:
+        return _span(lauf, name)
+    if profiling_settings()[0] == "off":
+        return _AUS
+    return _einzel_span(name)
+
+
+def gemessen(funktion=None, name=None):
+    """Decorator form of ``span``, named after the function unless ``name`` is given"""
+    if funktion is None:
+        return functools.partial(gemessen, name=name)
+    name = name or funktion.__name__
+
+    @functools.wraps(funktion)
+    def wrapper(*args, **kwargs):
+        with span(name):
+            return funktion(*args, **kwargs)
+
+    return wrapper
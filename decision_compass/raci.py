@@ -0,0 +1,91 @@
+"""Array-backed RACI matrix with vectorized consistency checks.
+
+Assignments are stored as a small-int (tasks x roles) matrix; 0 means no
+assignment and 1..4 follow ``storage.RACI_CODES`` (R, A, C, I).
+"""
+import numpy as np
+
+from decision_compass.storage import RACI_CODES
+
+CODES = ("-",) + RACI_CODES
+CODE = {code: i for i, code in enumerate(CODES)}
+_BUCHSTABEN = np.array(CODES, dtype=object)
+
+# Rule ids; the UI translates them via the catalog key "raci_rule_<id>"
+REGELN = ("mehrere_a", "kein_a", "kein_r", "rolle_ohne_zuweisung")
+
+
+class RaciMatrix:
+    """Tasks x roles code matrix plus index maps for both axes"""
+
+    def __init__(self, aufgaben, rollen, codes=None, task_ids=None):
+        self.aufgaben = list(aufgaben)
+        self.rollen = list(rollen)
+        if codes is None:
+            codes = np.zeros((len(self.aufgaben), len(self.rollen)), dtype=np.int8)
+        self.codes = np.asarray(codes, dtype=np.int8)
+        if self.codes.shape != (len(self.aufgaben), len(self.rollen)):
+            raise ValueError(f"Code matrix has shape {self.codes.shape}, expected {(len(self.aufgaben), len(self.rollen))}")
+        self.rollen_index = {rolle: j for j, rolle in enumerate(self.rollen)}
+        # Storage ids per row, so edits in a filtered or sorted view find their task
+        self.task_ids = np.arange(len(self.aufgaben)) if task_ids is None else np.asarray(task_ids, dtype=np.int64)
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        """Build from ``Storage.raci_snapshot``: (task rows, role rows, (task_id, role_id, code) rows)"""
+        aufgaben, rollen, zuweisungen = snapshot
+        task_ids = np.fromiter((task_id for task_id, _ in aufgaben), dtype=np.int64, count=len(aufgaben))
+        matrix = cls([text for _, text in aufgaben], [name for _, name in rollen], task_ids=task_ids)
+        if zuweisungen and aufgaben and rollen:
+            z = np.asarray(zuweisungen, dtype=np.int64)
+            role_ids = np.fromiter((role_id for role_id, _ in rollen), dtype=np.int64, count=len(rollen))
+            # Row ids arrive sorted, so positions are a binary search away
+            zeilen = np.searchsorted(task_ids, z[:, 0])
+            spalten = np.searchsorted(role_ids, z[:, 1])
+            matrix.codes[zeilen, spalten] = z[:, 2]
+        return matrix
+
+    @classmethod
+    def from_records(cls, records, rollen):
+        """Build from [{"beschreibung": ..., "zuweisungen": {role: code}}]"""
+        matrix = cls([r["beschreibung"] for r in records], rollen)
+        for i, record in enumerate(records):
+            for rolle, code in record["zuweisungen"].items():
+                if rolle in matrix.rollen_index:
+                    matrix.codes[i, matrix.rollen_index[rolle]] = CODE.get(code, 0)
+        return matrix
+
+    def __len__(self):
+        return len(self.aufgaben)
+
+    def buchstaben(self, zeilen=slice(None)):
+        """Codes of the selected rows as letters ('-', 'R', 'A', 'C', 'I')"""
+        return _BUCHSTABEN[self.codes[zeilen]]
+
+    def to_records(self, aufgabe_spalte="Aufgabe"):
+        """Rows as dicts (task column plus one column per role), as used by the exports"""
+        buchstaben = self.buchstaben()
+        return [
+            {aufgabe_spalte: aufgabe, **dict(zip(self.rollen, zeile))}
+            for aufgabe, zeile in zip(self.aufgaben, buchstaben.tolist())
+        ]
+
+    def zeilen_mit_verstoss(self):
+        """Boolean mask of tasks that break a per-task rule"""
+        a_pro_aufgabe = (self.codes == CODE["A"]).sum(axis=1)
+        return (a_pro_aufgabe != 1) | ~(self.codes == CODE["R"]).any(axis=1)
+
+    def validate(self):
+        """Check every rule in one sweep over the matrix
+
+        Returns {rule id: array of row indices (tasks) or column indices (roles)}.
+        """
+        a_pro_aufgabe = (self.codes == CODE["A"]).sum(axis=1)
+        r_pro_aufgabe = (self.codes == CODE["R"]).sum(axis=1)
+        rolle_belegt = (self.codes != 0).any(axis=0)
+        return {
+            "mehrere_a": np.flatnonzero(a_pro_aufgabe > 1),
+            "kein_a": np.flatnonzero(a_pro_aufgabe == 0),
+            "kein_r": np.flatnonzero(r_pro_aufgabe == 0),
+            "rolle_ohne_zuweisung": np.flatnonzero(~rolle_belegt),
+        }
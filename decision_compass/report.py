@@ -0,0 +1,166 @@
+"""Paginated PDF reports: text sections plus large tables as real ``Table`` flowables.
+
+Tables are cut into chunks of ``ZEILEN_PRO_BLOCK`` rows, each a ``LongTable`` whose
+header row repeats on every page, so layout work grows linearly with the row count
+(one huge table is re-split on every page). Tables wider than the page are split
+into column groups; the leading ``fest`` columns (e.g. the task name) repeat in
+every group. reportlab is imported on first use, like in ``export``.
+"""
+import io
+from collections import namedtuple
+from xml.sax.saxutils import escape
+
+# art: "text" (wraps, takes the remaining width), "kurz" (short label), "zahl" (right-aligned), "raci" (colored code)
+Spalte = namedtuple("Spalte", ["titel", "art"])
+ReportTabelle = namedtuple("ReportTabelle", ["titel", "spalten", "zeilen", "fest"], defaults=(1,))
+
+ZEILEN_PRO_BLOCK = 200
+RAND = 42  # page margin in points (1.5 cm)
+BREITE = {"raci": 44, "kurz": 72, "zahl": 54, "text": 120}
+SCHRIFT, SCHRIFTGROESSE = "Helvetica", 7.5
+RACI_FARBEN = {"R": "#ffc9c9", "A": "#ffd8a8", "C": "#a5d8ff", "I": "#b2f2bb"}
+
+
+def spaltengruppen(spalten, fest, frame_breite):
+    """Split column indices into groups that fit the frame; leading ``fest`` columns go into every group"""
+    basis = list(range(min(fest, len(spalten))))
+    rest = list(range(len(basis), len(spalten)))
+    basis_breite = sum(BREITE[spalten[i].art] for i in basis)
+    gruppen, gruppe, breite = [], [], basis_breite
+    for i in rest:
+        w = BREITE[spalten[i].art]
+        if gruppe and breite + w > frame_breite:
+            gruppen.append(basis + gruppe)
+            gruppe, breite = [], basis_breite
+        gruppe.append(i)
+        breite += w
+    if gruppe or not gruppen:
+        gruppen.append(basis + gruppe)
+    return gruppen
+
+
+def _breiten(spalten, frame_breite):
+    """Column widths: fixed per kind, text columns share what is left of the frame"""
+    fix = [BREITE[s.art] for s in spalten]
+    text = [i for i, s in enumerate(spalten) if s.art == "text"]
+    if text:
+        frei = frame_breite - sum(w for i, w in enumerate(fix) if i not in text)
+        for i in text:
+            fix[i] = max(BREITE["text"], frei / len(text))
+    return fix
+
+
+class _Stile:
+    """Paragraph and table styles, created once per document"""
+
+    def __init__(self):
+        from reportlab.lib import colors
+        from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+
+        self.styles = getSampleStyleSheet()
+        self.zelle = ParagraphStyle("Zelle", fontName=SCHRIFT, fontSize=SCHRIFTGROESSE, leading=SCHRIFTGROESSE + 1.5)
+        self.kopf = ParagraphStyle("Kopf", parent=self.zelle, fontName=SCHRIFT + "-Bold", wordWrap="CJK")
+        self.raci = {code: colors.HexColor(farbe) for code, farbe in RACI_FARBEN.items()}
+        self.basis = [
+            ("FONT", (0, 0), (-1, -1), SCHRIFT, SCHRIFTGROESSE),
+            ("VALIGN", (0, 0), (-1, -1), "TOP"),
+            ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#dee2e6")),
+            ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#f8f9fa")]),
+            ("GRID", (0, 0), (-1, -1), 0.25, colors.HexColor("#adb5bd")),
+            ("TOPPADDING", (0, 0), (-1, -1), 2),
+            ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
+        ]
+
+
+def _tabellen_story(tabelle, stile, frame_breite):
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+    from reportlab.platypus import LongTable, Paragraph, Spacer, TableStyle
+
+    story = []
+    gruppen = spaltengruppen(tabelle.spalten, tabelle.fest, frame_breite)
+    for g, gruppe in enumerate(gruppen):
+        spalten = [tabelle.spalten[i] for i in gruppe]
+        breiten = _breiten(spalten, frame_breite)
+        titel = tabelle.titel if len(gruppen) == 1 else f"{tabelle.titel} ({g + 1}/{len(gruppen)})"
+        story.append(Paragraph(f"<b>{escape(titel)}</b>", stile.styles["Heading3"]))
+
+        textspalten = [j for j, s in enumerate(spalten) if s.art == "text"]
+        zahlspalten = [j for j, s in enumerate(spalten) if s.art == "zahl"]
+        racispalten = [j for j, s in enumerate(spalten) if s.art == "raci"]
+        stil = list(stile.basis)
+        stil += [("ALIGN", (j, 0), (j, -1), "RIGHT") for j in zahlspalten]
+        stil += [("ALIGN", (j, 0), (j, -1), "CENTER") for j in racispalten]
+
+        for start in range(0, max(1, len(tabelle.zeilen)), ZEILEN_PRO_BLOCK):
+            block = tabelle.zeilen[start:start + ZEILEN_PRO_BLOCK]
+            daten = [[Paragraph(escape(s.titel), stile.kopf) for s in spalten]]
+            farben = []
+            for r, zeile in enumerate(block, start=1):
+                zellen = ["" if zeile[i] is None else zeile[i] for i in gruppe]
+                for j in textspalten:
+                    text = str(zellen[j])
+                    # Only text wider than its column pays for a Paragraph
+                    if stringWidth(text, SCHRIFT, SCHRIFTGROESSE) > breiten[j] - 12:
+                        zellen[j] = Paragraph(escape(text), stile.zelle)
+                for j in zahlspalten:
+                    if isinstance(zellen[j], float):
+                        zellen[j] = f"{zellen[j]:g}"
+                for j in racispalten:
+                    farbe = stile.raci.get(zellen[j])
+                    if farbe is not None:
+                        farben.append(("BACKGROUND", (j, r), (j, r), farbe))
+                daten.append(zellen)
+            story.append(LongTable(daten, colWidths=breiten, repeatRows=1, style=TableStyle(stil + farben)))
+        story.append(Spacer(1, 12))
+    return story
+
+
+def _abschnitte_story(abschnitte, styles):
+    from reportlab.platypus import Paragraph, Spacer
+
+    story = []
+    for section, content in abschnitte.items():
+        story.append(Paragraph(f"<b>{escape(str(section))}</b>", styles["Heading2"]))
+        # Escape before the line breaks become markup, user text like "a<b" is not a tag
+        story.append(Paragraph(escape(str(content)).replace("\n", "<br/>"), styles["Normal"]))
+        story.append(Spacer(1, 12))
+    return story
+
+
+def seitenformat(tabellen):
+    """A4 portrait, or landscape when a table's columns do not fit the portrait width"""
+    from reportlab.lib.pagesizes import A4, landscape
+
+    hochformat = A4[0] - 2 * RAND
+    breit = any(sum(BREITE[s.art] for s in t.spalten) > hochformat for t in tabellen)
+    return landscape(A4) if breit else A4
+
+
+def baue_report(titel, kapitel, progress=None):
+    """PDF for [(chapter title or None, sections dict, [ReportTabelle])], each titled chapter on a new page
+
+    ``progress(fraction)`` is called while the layout runs; an exception it raises aborts the build.
+    """
+    from reportlab.platypus import PageBreak, Paragraph, SimpleDocTemplate, Spacer
+
+    seite = seitenformat([t for _, _, tabellen in kapitel for t in tabellen])
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=seite, leftMargin=RAND, rightMargin=RAND, topMargin=RAND, bottomMargin=RAND)
+    stile = _Stile()
+    story = [Paragraph(f"<b>{escape(titel)}</b>", stile.styles["Title"]), Spacer(1, 12)]
+
+    for i, (kapitel_titel, abschnitte, tabellen) in enumerate(kapitel):
+        if kapitel_titel is not None:
+            if i:
+                story.append(PageBreak())
+            story.append(Paragraph(f"<b>{escape(kapitel_titel)}</b>", stile.styles["Heading1"]))
+        story.extend(_abschnitte_story(abschnitte, stile.styles))
+        for tabelle in tabellen:
+            story.extend(_tabellen_story(tabelle, stile, doc.width))
+
+    if progress is not None:
+        total = max(1, len(story))
+        doc.setProgressCallBack(lambda kind, value: progress(value / total) if kind == "PROGRESS" else None)
+    doc.build(story)
+    buffer.seek(0)
+    return buffer
@@ -0,0 +1,182 @@
+"""Scoring of the task-analysis questionnaire (Aufgaben-Analyse).
+
+The same rules drive the interactive Streamlit form and the batch CLI:
+
+    python -m decision_compass.scoring antworten.csv -o ergebnisse.xlsx
+"""
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# --- Questionnaire definition ---
+TYPEN = ("disjunktiv", "konjunktiv", "additiv")
+SCHWELLENWERT_HYBRID = 6
+KEINE_AUFGABE_SCHWELLE = 2.0
+MIN_ANTWORT, MAX_ANTWORT = 1, 7
+
+# Question texts live in the translation catalog (decision_compass/locales)
+FRAGEN = [
+    {"key": "question_1", "typ": "additiv"},
+    {"key": "question_2", "typ": "konjunktiv"},
+    {"key": "question_3", "typ": "disjunktiv"},
+    {"key": "question_4", "typ": "konjunktiv"},
+    {"key": "question_5", "typ": "additiv"},
+    {"key": "question_6", "typ": "disjunktiv"},
+    {"key": "question_7", "typ": "konjunktiv"},
+    {"key": "question_8", "typ": "disjunktiv"},
+    {"key": "question_9", "typ": "konjunktiv"},
+    {"key": "question_10", "typ": "additiv"},
+    {"key": "question_11", "typ": "additiv"},
+    {"key": "question_12", "typ": "disjunktiv"},
+]
+
+ANTWORT_SPALTEN = [f"frage_{i}" for i in range(1, len(FRAGEN) + 1)]
+
+# One row per task type, one column per question: answers @ TYP_MATRIX.T -> points per type
+TYP_MATRIX = np.array([[frage["typ"] == typ for frage in FRAGEN] for typ in TYPEN], dtype=np.int64)
+
+
+# --- Single respondent (interactive path) ---
+def bewerte_antworten(antworten, schwellenwert=SCHWELLENWERT_HYBRID):
+    """Score one list of (typ, antwort) pairs; returns None if no task is recognized"""
+    durchschnitt = sum([antwort for _, antwort in antworten]) / len(antworten)
+    if durchschnitt < KEINE_AUFGABE_SCHWELLE:
+        return None
+
+    punkte = {typ: 0 for typ in TYPEN}
+    for typ, antwort in antworten:
+        punkte[typ] += antwort
+
+    gesamtpunkte = sum(punkte.values())
+    prozentuale_verteilung = {typ: round((wert / gesamtpunkte) * 100, 1) for typ, wert in punkte.items()}
+    max_punkte = max(punkte.values())
+    hybrid_typen = [typ for typ, wert in punkte.items() if max_punkte - wert <= schwellenwert]
+    return {
+        "punkte": punkte,
+        "prozentuale_verteilung": prozentuale_verteilung,
+        "hybrid_typen": hybrid_typen,
+    }
+
+
+# --- Batch scoring (vectorized) ---
+def validiere_antwortmatrix(antworten):
+    """Return answers as an int64 (n, 12) array, raising ValueError on bad input"""
+    matrix = np.asarray(antworten)
+    if matrix.ndim != 2 or matrix.shape[1] != len(FRAGEN):
+        raise ValueError(f"Expected an (n, {len(FRAGEN)}) answer matrix, got shape {matrix.shape}")
+    if not np.issubdtype(matrix.dtype, np.number):
+        raise ValueError("Answers must be numeric")
+    if np.isnan(matrix.astype(np.float64)).any():
+        zeilen = np.flatnonzero(np.isnan(matrix.astype(np.float64)).any(axis=1))
+        raise ValueError(f"Missing answers in rows {zeilen[:10].tolist()}")
+    if (matrix != np.round(matrix)).any():
+        raise ValueError("Answers must be whole numbers")
+    matrix = matrix.astype(np.int64)
+    ausserhalb = (matrix < MIN_ANTWORT) | (matrix > MAX_ANTWORT)
+    if ausserhalb.any():
+        zeilen = np.flatnonzero(ausserhalb.any(axis=1))
+        raise ValueError(f"Answers must lie between {MIN_ANTWORT} and {MAX_ANTWORT} (rows {zeilen[:10].tolist()})")
+    return matrix
+
+
+def bewerte_batch(antworten, schwellenwert=SCHWELLENWERT_HYBRID):
+    """Score an (n, 12) answer matrix in one pass
+
+    Returns a dict of arrays:
+    ``punkte`` (n, 3) int, ``prozent`` (n, 3) float, ``hybrid`` (n, 3) bool and
+    ``keine_aufgabe`` (n,) bool. Columns follow ``TYPEN``; rows flagged as
+    ``keine_aufgabe`` carry zeros/NaN/False just like the form shows no result.
+    """
+    matrix = validiere_antwortmatrix(antworten)
+    keine_aufgabe = matrix.mean(axis=1) < KEINE_AUFGABE_SCHWELLE
+
+    punkte = matrix @ TYP_MATRIX.T
+    gesamtpunkte = punkte.sum(axis=1, keepdims=True)
+    prozent = np.round(punkte / gesamtpunkte * 100, 1)
+    hybrid = (punkte.max(axis=1, keepdims=True) - punkte) <= schwellenwert
+
+    punkte[keine_aufgabe] = 0
+    prozent[keine_aufgabe] = np.nan
+    hybrid[keine_aufgabe] = False
+    return {"punkte": punkte, "prozent": prozent, "hybrid": hybrid, "keine_aufgabe": keine_aufgabe}
+
+
+def hybrid_bezeichnungen(hybrid):
+    """Map an (n, 3) hybrid mask to labels like 'disjunktiv+additiv'"""
+    codes = hybrid.astype(np.int64) @ (1 << np.arange(len(TYPEN)))
+    labels = np.array(["+".join(typ for bit, typ in enumerate(TYPEN) if code >> bit & 1) for code in range(1 << len(TYPEN))], dtype=object)
+    return labels[codes]
+
+
+def antwortmatrix_aus_dataframe(df):
+    """Pick the 12 answer columns from a response table"""
+    if all(spalte in df.columns for spalte in ANTWORT_SPALTEN):
+        return df[ANTWORT_SPALTEN].to_numpy()
+    numerisch = df.select_dtypes("number").columns
+    if len(numerisch) == len(FRAGEN):
+        return df[numerisch].to_numpy()
+    raise ValueError(f"Expected columns {ANTWORT_SPALTEN[0]} … {ANTWORT_SPALTEN[-1]} or exactly {len(FRAGEN)} numeric columns")
+
+
+def bewerte_dataframe(df, schwellenwert=SCHWELLENWERT_HYBRID):
+    """Score every row of a response table and append the result columns"""
+    ergebnis = bewerte_batch(antwortmatrix_aus_dataframe(df), schwellenwert)
+    out = df.copy()
+    for i, typ in enumerate(TYPEN):
+        out[f"punkte_{typ}"] = ergebnis["punkte"][:, i]
+    for i, typ in enumerate(TYPEN):
+        out[f"prozent_{typ}"] = ergebnis["prozent"][:, i]
+    out["hybrid_typen"] = hybrid_bezeichnungen(ergebnis["hybrid"])
+    out["keine_aufgabe"] = ergebnis["keine_aufgabe"]
+    return out
+
+
+# --- CLI ---
+def lese_tabelle(pfad):
+    """Read a CSV or Excel file into a DataFrame"""
+    pfad = Path(pfad)
+    if pfad.suffix.lower() in (".xlsx", ".xls"):
+        return pd.read_excel(pfad)
+    df = pd.read_csv(pfad)
+    if len(df.columns) == 1:
+        # German Excel exports use semicolons
+        df = pd.read_csv(pfad, sep=";")
+    return df
+
+
+def schreibe_tabelle(df, pfad):
+    """Write a DataFrame as CSV or Excel depending on the file suffix"""
+    pfad = Path(pfad)
+    if pfad.suffix.lower() == ".xlsx":
+        df.to_excel(pfad, index=False, sheet_name="Results")
+    else:
+        df.to_csv(pfad, index=False)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score task-analysis questionnaires in batch.")
+    parser.add_argument("input", help="CSV or XLSX file with one response per row (columns frage_1 … frage_12)")
+    parser.add_argument("-o", "--output", help="Output CSV/XLSX file (default: CSV on stdout)")
+    parser.add_argument("--schwellenwert", type=int, default=SCHWELLENWERT_HYBRID, help="Hybrid threshold in points")
+    args = parser.parse_args(argv)
+
+    try:
+        ergebnis = bewerte_dataframe(lese_tabelle(args.input), args.schwellenwert)
+    except ValueError as exc:
+        parser.exit(2, f"error: {exc}\n")
+
+    if args.output:
+        schreibe_tabelle(ergebnis, args.output)
+        verteilung = ergebnis["hybrid_typen"].where(~ergebnis["keine_aufgabe"], "keine_aufgabe").value_counts()
+        print(f"{len(ergebnis)} responses scored -> {args.output}", file=sys.stderr)
+        print(verteilung.to_string(), file=sys.stderr)
+    else:
+        ergebnis.to_csv(sys.stdout, index=False)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,204 @@
+"""Monte Carlo sensitivity of the task-analysis scoring rules.
+
+How often do respondents land in hybrid classifications, and how often does a one-point
+change of a single answer change the result? Answer vectors are simulated (or resampled
+from real responses) in batches and scored with the rules of ``scoring.bewerte_batch``
+for every candidate hybrid threshold, no-task cutoff and question weighting:
+
+    python -m decision_compass.sensitivity --samples 1000000
+    python -m decision_compass.sensitivity --quelle antworten.csv --schwellenwerte 4 5 6 7 8 -o sensitivitaet.xlsx
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from decision_compass.scoring import (
+    FRAGEN, KEINE_AUFGABE_SCHWELLE, MAX_ANTWORT, MIN_ANTWORT, SCHWELLENWERT_HYBRID, TYP_MATRIX, TYPEN,
+    antwortmatrix_aus_dataframe, hybrid_bezeichnungen, lese_tabelle, validiere_antwortmatrix
+)
+
+QUELLEN = ("gleichverteilt", "latent")
+LATENT_STREUUNG = 1.0  # answer noise around a respondent's level per task type
+
+# Class codes: 0 = no task recognized, otherwise the hybrid mask as bits in TYPEN order
+KLASSEN = hybrid_bezeichnungen((np.arange(1 << len(TYPEN))[:, None] >> np.arange(len(TYPEN))) & 1)
+KLASSEN[0] = "keine_aufgabe"
+TYP_INDEX = TYP_MATRIX.argmax(axis=0)  # task type of every question
+
+
+# --- Answer sources ---
+def ziehe_antworten(quelle, n, rng):
+    """(n, 12) int8 answers: uniform, latent per-type levels, or rows resampled from a response matrix"""
+    if isinstance(quelle, np.ndarray):
+        return quelle[rng.integers(0, len(quelle), n)]
+    if quelle == "gleichverteilt":
+        return rng.integers(MIN_ANTWORT, MAX_ANTWORT + 1, (n, len(FRAGEN)), dtype=np.int8)
+    niveau = rng.uniform(MIN_ANTWORT, MAX_ANTWORT, (n, len(TYPEN)))[:, TYP_INDEX]
+    antworten = np.rint(niveau + rng.normal(0.0, LATENT_STREUUNG, niveau.shape))
+    return np.clip(antworten, MIN_ANTWORT, MAX_ANTWORT).astype(np.int8)
+
+
+def lade_quelle(quelle):
+    """Answer source name, or the validated answer matrix of a CSV/XLSX response file"""
+    if quelle in QUELLEN:
+        return quelle
+    return validiere_antwortmatrix(antwortmatrix_aus_dataframe(lese_tabelle(quelle))).astype(np.int8)
+
+
+# --- Vectorized rules ---
+def klassen(abstand, durchschnitt, schwellenwert, cutoff):
+    """Class codes of a batch: types within ``schwellenwert`` points of the best are hybrid, mean below ``cutoff`` is no task"""
+    codes = np.zeros(len(abstand), dtype=np.uint8)
+    for bit in range(len(TYPEN)):
+        codes |= (abstand[:, bit] <= schwellenwert).view(np.uint8) << bit
+    codes[durchschnitt < cutoff] = 0
+    return codes
+
+
+def _abstand(punkte):
+    return punkte.max(axis=1, keepdims=True) - punkte
+
+
+def nachbarn(antworten, rng):
+    """One random answer per row moved by one point (inwards at the scale ends): (question, step)"""
+    n = len(antworten)
+    frage = rng.integers(0, len(FRAGEN), n)
+    schritt = np.where(rng.random(n) < 0.5, -1, 1)
+    wert = antworten[np.arange(n), frage]
+    schritt[wert + schritt < MIN_ANTWORT] = 1
+    schritt[wert + schritt > MAX_ANTWORT] = -1
+    return frage, schritt
+
+
+# --- Simulation ---
+def simuliere(quelle, samples, schwellenwerte, cutoffs, streuungen, batch=250_000, seed=0):
+    """Counts over ``samples`` answer vectors, turned into the report tables by ``tabellen``"""
+    rng = np.random.default_rng(seed)
+    k, q = len(KLASSEN), len(FRAGEN)
+    zaehler = {
+        "schwelle_klassen": np.zeros((len(schwellenwerte), k), dtype=np.int64),
+        "schwelle_flips": np.zeros(len(schwellenwerte), dtype=np.int64),
+        "cutoff_klassen": np.zeros((len(cutoffs), k), dtype=np.int64),
+        "cutoff_flips": np.zeros(len(cutoffs), dtype=np.int64),
+        "frage_anzahl": np.zeros(q, dtype=np.int64),
+        "frage_flips": np.zeros(q, dtype=np.int64),
+        "gewicht_flips": np.zeros(len(streuungen), dtype=np.int64),
+        "samples": 0,
+    }
+    gewichte = TYP_MATRIX.T.astype(np.float32)
+    for start in range(0, samples, batch):
+        n = min(batch, samples - start)
+        antworten = ziehe_antworten(quelle, n, rng)
+        summen = antworten.sum(axis=1, dtype=np.int64)
+        durchschnitt = summen / q
+        punkte = antworten.astype(np.float32) @ gewichte
+
+        # Neighbour: the same answers with one of them moved by one point
+        frage, schritt = nachbarn(antworten, rng)
+        punkte_n = punkte.copy()
+        punkte_n[np.arange(n), TYP_INDEX[frage]] += schritt
+        durchschnitt_n = (summen + schritt) / q
+        abstand, abstand_n = _abstand(punkte), _abstand(punkte_n)
+
+        for i, schwelle in enumerate(schwellenwerte):
+            codes = klassen(abstand, durchschnitt, schwelle, KEINE_AUFGABE_SCHWELLE)
+            zaehler["schwelle_klassen"][i] += np.bincount(codes, minlength=k)
+            zaehler["schwelle_flips"][i] += np.count_nonzero(codes != klassen(abstand_n, durchschnitt_n, schwelle, KEINE_AUFGABE_SCHWELLE))
+        for i, cutoff in enumerate(cutoffs):
+            codes = klassen(abstand, durchschnitt, SCHWELLENWERT_HYBRID, cutoff)
+            zaehler["cutoff_klassen"][i] += np.bincount(codes, minlength=k)
+            zaehler["cutoff_flips"][i] += np.count_nonzero(codes != klassen(abstand_n, durchschnitt_n, SCHWELLENWERT_HYBRID, cutoff))
+
+        basis = klassen(abstand, durchschnitt, SCHWELLENWERT_HYBRID, KEINE_AUFGABE_SCHWELLE)
+        geflippt = basis != klassen(abstand_n, durchschnitt_n, SCHWELLENWERT_HYBRID, KEINE_AUFGABE_SCHWELLE)
+        zaehler["frage_anzahl"] += np.bincount(frage, minlength=q)
+        zaehler["frage_flips"] += np.bincount(frage[geflippt], minlength=q)
+
+        # Question weights drawn per respondent from [1 - s, 1 + s], compared with equal weights
+        for i, streuung in enumerate(streuungen):
+            faktoren = rng.uniform(1 - streuung, 1 + streuung, antworten.shape).astype(np.float32)
+            gewichtet = (antworten * faktoren) @ gewichte
+            codes = klassen(_abstand(gewichtet), durchschnitt, SCHWELLENWERT_HYBRID, KEINE_AUFGABE_SCHWELLE)
+            zaehler["gewicht_flips"][i] += np.count_nonzero(codes != basis)
+        zaehler["samples"] += n
+    return zaehler
+
+
+def _verteilung(klassen_zaehler, flips, n, index):
+    anteile = pd.DataFrame(klassen_zaehler / n * 100, columns=KLASSEN, index=index)
+    anteile["hybrid"] = anteile[[name for name in KLASSEN[1:] if "+" in name]].sum(axis=1)
+    anteile["flip"] = flips / n * 100
+    return anteile
+
+
+def tabellen(zaehler, schwellenwerte, cutoffs, streuungen):
+    """Report tables in percent of the simulated answer vectors
+
+    - ``schwellenwerte`` / ``cutoffs``: class distribution, hybrid share and flip rate per candidate
+      (the other rule at its current value); flip = class changes when one answer moves by one point
+    - ``fragen``: flip rate by the question that moved (current rules)
+    - ``gewichtung``: classes that change when question weights vary by ±s around 1
+    """
+    n = zaehler["samples"]
+    fragen = pd.DataFrame({
+        "typ": [frage["typ"] for frage in FRAGEN],
+        "flip": zaehler["frage_flips"] / np.maximum(zaehler["frage_anzahl"], 1) * 100,
+    }, index=pd.Index(range(1, len(FRAGEN) + 1), name="frage"))
+    return {
+        "schwellenwerte": _verteilung(zaehler["schwelle_klassen"], zaehler["schwelle_flips"], n, pd.Index(schwellenwerte, name="schwellenwert")),
+        "cutoffs": _verteilung(zaehler["cutoff_klassen"], zaehler["cutoff_flips"], n, pd.Index(cutoffs, name="cutoff")),
+        "fragen": fragen,
+        "gewichtung": pd.DataFrame({"flip": zaehler["gewicht_flips"] / n * 100}, index=pd.Index(streuungen, name="streuung")),
+    }
+
+
+# --- CLI ---
+def schreibe_tabellen(ergebnis, pfad):
+    """One sheet per table for .xlsx, otherwise one CSV with a ``tabelle`` column"""
+    pfad = Path(pfad)
+    if pfad.suffix.lower() == ".xlsx":
+        with pd.ExcelWriter(pfad) as writer:
+            for name, df in ergebnis.items():
+                df.to_excel(writer, sheet_name=name)
+    else:
+        pd.concat({name: df.reset_index() for name, df in ergebnis.items()}, names=["tabelle"]).droplevel(1).to_csv(pfad)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Monte Carlo sensitivity of the task-analysis scoring rules.")
+    parser.add_argument("--samples", type=int, default=1_000_000, help="Simulated answer vectors")
+    parser.add_argument("--quelle", default="gleichverteilt",
+                        help="'gleichverteilt', 'latent' (answers scatter around a level per task type) or a CSV/XLSX file to resample")
+    parser.add_argument("--schwellenwerte", type=float, nargs="+", default=list(range(0, 13)), help="Candidate hybrid thresholds in points")
+    parser.add_argument("--cutoffs", type=float, nargs="+", default=[1.5, 1.75, 2.0, 2.25, 2.5, 3.0], help="Candidate no-task cutoffs (mean answer)")
+    parser.add_argument("--gewichtung", type=float, nargs="+", default=[0.1, 0.25, 0.5], help="Question weight spreads s (weights in [1-s, 1+s])")
+    parser.add_argument("--batch", type=int, default=250_000, help="Answer vectors per NumPy batch")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", help="Write the tables to this CSV/XLSX file")
+    args = parser.parse_args(argv)
+
+    try:
+        quelle = lade_quelle(args.quelle)
+    except (OSError, ValueError) as exc:
+        parser.exit(2, f"error: {exc}\n")
+
+    start = time.perf_counter()
+    zaehler = simuliere(quelle, args.samples, args.schwellenwerte, args.cutoffs, args.gewichtung, args.batch, args.seed)
+    dauer = time.perf_counter() - start
+    ergebnis = tabellen(zaehler, args.schwellenwerte, args.cutoffs, args.gewichtung)
+
+    for name, df in ergebnis.items():
+        print(f"\n# {name} (%)")
+        print(df.to_string(float_format=lambda x: f"{x:.2f}"))
+    if args.output:
+        schreibe_tabellen(ergebnis, args.output)
+    print(f"{zaehler['samples']} answer vectors in {dauer:.2f} s ({zaehler['samples'] / dauer:,.0f}/s)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,761 @@
+"""Persistence for Eisenhower tasks, RACI matrices, Balanced Scorecard objectives and team aggregates.
+
+Every record belongs to a workspace (one per user/board). ``Storage`` defines the
+interface; ``SQLiteStorage`` is the default backend and ``MemoryStorage`` keeps
+everything in the current process. Select one with ``open_storage(url)``:
+
+    sqlite:///path/to/decision_compass.db
+    memory://
+"""
+import json
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from pathlib import Path
+
+QUADRANTEN = ("Q1", "Q2", "Q3", "Q4")
+PERSPEKTIVEN = ("finanzen", "kunden", "prozesse", "lernen")
+RICHTUNGEN = ("hoch", "niedrig")  # KPI direction: higher or lower actuals are better
+RACI_CODES = ("R", "A", "C", "I")
+TASK_FIELDS = ("beschreibung", "wichtigkeit", "dringlichkeit", "quadrant")
+OBJECTIVE_FIELDS = ("perspektive", "bereich", "ziel", "kennzahl", "zielwert", "istwert", "richtung", "gewicht", "massnahmen")
+
+
+class Storage(ABC):
+    """Interface of the storage backends; a backend must implement every abstract method"""
+
+    # --- Eisenhower ---
+    @abstractmethod
+    def add_task(self, workspace, beschreibung, wichtigkeit, dringlichkeit, quadrant):
+        """Store one task in its quadrant (``QUADRANTEN``)"""
+
+    @abstractmethod
+    def add_tasks(self, workspace, tasks):
+        """Store [(beschreibung, wichtigkeit, dringlichkeit, quadrant)] in one transaction"""
+
+    @abstractmethod
+    def list_tasks(self, workspace, quadrant=None, offset=0, limit=None):
+        """Tasks in insertion order, optionally for one quadrant and one page"""
+
+    @abstractmethod
+    def count_tasks(self, workspace):
+        """{quadrant: number of tasks}"""
+
+    @abstractmethod
+    def iter_tasks(self, workspace, batch=1000):
+        """Tasks as (beschreibung, wichtigkeit, dringlichkeit, quadrant) in insertion order, read in batches"""
+
+    @abstractmethod
+    def clear_tasks(self, workspace):
+        """Delete all tasks of the workspace"""
+
+    # --- RACI ---
+    @abstractmethod
+    def list_roles(self, workspace):
+        """Role names in insertion order"""
+
+    @abstractmethod
+    def add_role(self, workspace, name):
+        """Add a role; an existing name is kept as it is"""
+
+    def ensure_roles(self, workspace, defaults):
+        """Seed a new workspace with default roles"""
+        if not self.list_roles(workspace):
+            for name in defaults:
+                self.add_role(workspace, name)
+
+    @abstractmethod
+    def add_raci_task(self, workspace, beschreibung, zuweisungen):
+        """Store a task; ``zuweisungen`` maps role name to R/A/C/I ('-' is not stored)"""
+
+    @abstractmethod
+    def add_raci_tasks(self, workspace, tasks):
+        """Store [(beschreibung, {role: code})] in one transaction; all roles must exist"""
+
+    @abstractmethod
+    def list_raci_tasks(self, workspace, offset=0, limit=None):
+        """[{"beschreibung": ..., "zuweisungen": {role: code}}] in insertion order"""
+
+    @abstractmethod
+    def count_raci_tasks(self, workspace):
+        """Number of RACI tasks"""
+
+    @abstractmethod
+    def iter_raci_rows(self, workspace, batch=1000):
+        """(beschreibung, codes) per task in insertion order, codes aligned with ``list_roles`` and '-' if unassigned"""
+
+    @abstractmethod
+    def raci_snapshot(self, workspace):
+        """Compact view for array processing
+
+        Returns ([(task_id, beschreibung)], [(role_id, name)], [(task_id, role_id, code)]),
+        ids ascending in insertion order and code as 1-based index into ``RACI_CODES``.
+        """
+
+    @abstractmethod
+    def set_raci_assignments(self, workspace, aenderungen):
+        """Apply [(task_id, role name, code)] in one transaction; '-' removes the assignment"""
+
+    @abstractmethod
+    def clear_raci_tasks(self, workspace):
+        """Delete all RACI tasks and their assignments; the roles stay"""
+
+    # --- Balanced Scorecard ---
+    @abstractmethod
+    def add_objective(self, workspace, perspektive, ziel, kennzahl, zielwert, massnahmen, istwert=None, gewicht=1.0, bereich="", richtung="hoch"):
+        """Store an objective; ``zielwert``/``istwert`` are numbers (or None), ``bereich`` is the business unit
+
+        ``richtung`` is "hoch" when higher actuals are better, "niedrig" for KPIs like costs or defect rates.
+        """
+
+    @abstractmethod
+    def add_objectives(self, workspace, ziele):
+        """Store [{field: value}] (``OBJECTIVE_FIELDS``, bereich/istwert/richtung/gewicht/massnahmen optional) in one transaction"""
+
+    @abstractmethod
+    def list_objectives(self, workspace, perspektive=None):
+        """[{"id", "perspektive", "bereich", "ziel", "kennzahl", "zielwert", "istwert", "richtung", "gewicht", "massnahmen"}] in insertion order"""
+
+    @abstractmethod
+    def objectives_revision(self, workspace):
+        """Counter that changes with every write to the workspace's objectives (cache key)"""
+
+    @abstractmethod
+    def iter_objectives(self, workspace, batch=1000):
+        """Objectives as tuples in ``OBJECTIVE_FIELDS`` order (without id), in insertion order, read in batches"""
+
+    @abstractmethod
+    def count_objectives(self, workspace):
+        """{perspective: number of objectives}"""
+
+    @abstractmethod
+    def clear_objectives(self, workspace):
+        """Delete all objectives of the workspace"""
+
+    # --- Team questionnaires ---
+    @abstractmethod
+    def list_teams(self, workspace):
+        """Names of the teams with a stored aggregate, sorted"""
+
+    @abstractmethod
+    def team_stats(self, workspace, team):
+        """Stored aggregate of a team (the dict of ``team.TeamStatistik.als_dict``) or None"""
+
+    @abstractmethod
+    def update_team_stats(self, workspace, team, aktualisiere):
+        """Replace a team's aggregate by ``aktualisiere(current or None)`` atomically; returns the new one"""
+
+    @abstractmethod
+    def clear_team(self, workspace, team):
+        """Delete a team's aggregate"""
+
+
+def _pruefe(wert, erlaubt, name):
+    if wert not in erlaubt:
+        raise ValueError(f"Unknown {name} {wert!r}, expected one of {', '.join(erlaubt)}")
+
+
+def _zahl(wert, name):
+    """Numeric KPI value: int/float or a number string ('1.234,5' and '85 %' are accepted); '' means None"""
+    if wert is None or isinstance(wert, (int, float)):
+        return None if wert is None or wert != wert else float(wert)
+    text = str(wert).strip().replace(" ", "").rstrip("%")
+    if not text:
+        return None
+    if "," in text:
+        text = text.replace(".", "").replace(",", ".")
+    try:
+        return float(text)
+    except ValueError:
+        raise ValueError(f"{name} must be a number, got {wert!r}") from None
+
+
+def _objective(perspektive, ziel, kennzahl, zielwert, massnahmen, istwert, gewicht, bereich, richtung="hoch"):
+    _pruefe(perspektive, PERSPEKTIVEN, "perspective")
+    _pruefe(richtung, RICHTUNGEN, "KPI direction")
+    gewicht = _zahl(gewicht, "gewicht")
+    if gewicht is None or gewicht < 0:
+        raise ValueError(f"gewicht must be a non-negative number, got {gewicht!r}")
+    return {
+        "perspektive": perspektive,
+        "bereich": bereich or "",
+        "ziel": ziel,
+        "kennzahl": kennzahl,
+        "zielwert": _zahl(zielwert, "zielwert"),
+        "istwert": _zahl(istwert, "istwert"),
+        "richtung": richtung,
+        "gewicht": gewicht,
+        "massnahmen": massnahmen or "",
+    }
+
+
+def _objective_aus(ziel):
+    """``_objective`` for a dict keyed by ``OBJECTIVE_FIELDS``; richtung defaults to "hoch", gewicht to 1"""
+    werte = {feld: ziel.get(feld) for feld in OBJECTIVE_FIELDS}
+    werte["gewicht"] = ziel.get("gewicht", 1.0)
+    werte["richtung"] = ziel.get("richtung") or "hoch"
+    return _objective(**werte)
+
+
+def _zuweisungen(zuweisungen):
+    zuweisungen = {rolle: code for rolle, code in zuweisungen.items() if code and code != "-"}
+    for code in zuweisungen.values():
+        _pruefe(code, RACI_CODES, "RACI code")
+    return zuweisungen
+
+
+# --- In-process backend ---
+class MemoryStorage(Storage):
+    """Process-local storage, indexed by quadrant and perspective like the SQLite tables"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tasks = defaultdict(lambda: {q: [] for q in QUADRANTEN})
+        self._task_seq = 0
+        self._roles = defaultdict(list)
+        self._raci = defaultdict(list)
+        self._objectives = defaultdict(lambda: {p: [] for p in PERSPEKTIVEN})
+        self._objective_seq = 0
+        self._objective_rev = defaultdict(int)
+        self._teams = defaultdict(dict)
+
+    def add_task(self, workspace, beschreibung, wichtigkeit, dringlichkeit, quadrant):
+        _pruefe(quadrant, QUADRANTEN, "quadrant")
+        with self._lock:
+            self._task_seq += 1
+            self._tasks[workspace][quadrant].append((self._task_seq, {
+                "beschreibung": beschreibung,
+                "wichtigkeit": wichtigkeit,
+                "dringlichkeit": dringlichkeit,
+                "quadrant": quadrant
+            }))
+
+    def add_tasks(self, workspace, tasks):
+        tasks = list(tasks)
+        for task in tasks:
+            _pruefe(task[3], QUADRANTEN, "quadrant")
+        with self._lock:
+            for task in tasks:
+                self._task_seq += 1
+                self._tasks[workspace][task[3]].append((self._task_seq, dict(zip(TASK_FIELDS, task))))
+
+    def list_tasks(self, workspace, quadrant=None, offset=0, limit=None):
+        with self._lock:
+            if quadrant is not None:
+                eintraege = list(self._tasks[workspace][quadrant])
+            else:
+                eintraege = sorted(e for q in QUADRANTEN for e in self._tasks[workspace][q])
+        ende = None if limit is None else offset + limit
+        return [task for _, task in eintraege[offset:ende]]
+
+    def count_tasks(self, workspace):
+        with self._lock:
+            return {q: len(self._tasks[workspace][q]) for q in QUADRANTEN}
+
+    def iter_tasks(self, workspace, batch=1000):
+        with self._lock:
+            eintraege = sorted(e for q in QUADRANTEN for e in self._tasks[workspace][q])
+        for _, task in eintraege:
+            yield tuple(task[feld] for feld in TASK_FIELDS)
+
+    def clear_tasks(self, workspace):
+        with self._lock:
+            self._tasks.pop(workspace, None)
+
+    def list_roles(self, workspace):
+        with self._lock:
+            return list(self._roles[workspace])
+
+    def add_role(self, workspace, name):
+        with self._lock:
+            if name not in self._roles[workspace]:
+                self._roles[workspace].append(name)
+
+    def add_raci_task(self, workspace, beschreibung, zuweisungen):
+        zuweisungen = _zuweisungen(zuweisungen)
+        with self._lock:
+            unbekannt = set(zuweisungen) - set(self._roles[workspace])
+            if unbekannt:
+                raise ValueError(f"Unknown role(s): {', '.join(sorted(unbekannt))}")
+            self._raci[workspace].append({"beschreibung": beschreibung, "zuweisungen": zuweisungen})
+
+    def add_raci_tasks(self, workspace, tasks):
+        tasks = [(beschreibung, _zuweisungen(zuweisungen)) for beschreibung, zuweisungen in tasks]
+        with self._lock:
+            unbekannt = {rolle for _, z in tasks for rolle in z} - set(self._roles[workspace])
+            if unbekannt:
+                raise ValueError(f"Unknown role(s): {', '.join(sorted(unbekannt))}")
+            self._raci[workspace].extend({"beschreibung": b, "zuweisungen": z} for b, z in tasks)
+
+    def list_raci_tasks(self, workspace, offset=0, limit=None):
+        ende = None if limit is None else offset + limit
+        with self._lock:
+            return [dict(t, zuweisungen=dict(t["zuweisungen"])) for t in self._raci[workspace][offset:ende]]
+
+    def count_raci_tasks(self, workspace):
+        with self._lock:
+            return len(self._raci[workspace])
+
+    def iter_raci_rows(self, workspace, batch=1000):
+        with self._lock:
+            rollen = list(self._roles[workspace])
+            tasks = list(self._raci[workspace])
+        for start in range(0, len(tasks), batch):
+            with self._lock:
+                block = [(t["beschreibung"], tuple(t["zuweisungen"].get(rolle, "-") for rolle in rollen)) for t in tasks[start:start + batch]]
+            yield from block
+
+    def raci_snapshot(self, workspace):
+        with self._lock:
+            rollen = list(enumerate(self._roles[workspace]))
+            rollen_id = {name: i for i, name in rollen}
+            aufgaben = [(i, t["beschreibung"]) for i, t in enumerate(self._raci[workspace])]
+            zuweisungen = [
+                (i, rollen_id[rolle], RACI_CODES.index(code) + 1)
+                for i, t in enumerate(self._raci[workspace])
+                for rolle, code in t["zuweisungen"].items()
+            ]
+        return aufgaben, rollen, zuweisungen
+
+    def set_raci_assignments(self, workspace, aenderungen):
+        aenderungen = [(task_id, rolle, code or "-") for task_id, rolle, code in aenderungen]
+        _zuweisungen({rolle: code for _, rolle, code in aenderungen})
+        with self._lock:
+            unbekannt = {rolle for _, rolle, _ in aenderungen} - set(self._roles[workspace])
+            if unbekannt:
+                raise ValueError(f"Unknown role(s): {', '.join(sorted(unbekannt))}")
+            tasks = self._raci[workspace]
+            for task_id, rolle, code in aenderungen:
+                if code == "-":
+                    tasks[task_id]["zuweisungen"].pop(rolle, None)
+                else:
+                    tasks[task_id]["zuweisungen"][rolle] = code
+
+    def clear_raci_tasks(self, workspace):
+        with self._lock:
+            self._raci.pop(workspace, None)
+
+    def add_objective(self, workspace, perspektive, ziel, kennzahl, zielwert, massnahmen, istwert=None, gewicht=1.0, bereich="", richtung="hoch"):
+        ziel = _objective(perspektive, ziel, kennzahl, zielwert, massnahmen, istwert, gewicht, bereich, richtung)
+        with self._lock:
+            self._objective_seq += 1
+            self._objective_rev[workspace] += 1
+            self._objectives[workspace][perspektive].append((self._objective_seq, {"id": self._objective_seq, **ziel}))
+
+    def add_objectives(self, workspace, ziele):
+        ziele = [_objective_aus(z) for z in ziele]
+        with self._lock:
+            self._objective_rev[workspace] += 1
+            for ziel in ziele:
+                self._objective_seq += 1
+                self._objectives[workspace][ziel["perspektive"]].append((self._objective_seq, {"id": self._objective_seq, **ziel}))
+
+    def list_objectives(self, workspace, perspektive=None):
+        with self._lock:
+            if perspektive is not None:
+                eintraege = list(self._objectives[workspace][perspektive])
+            else:
+                eintraege = sorted(e for p in PERSPEKTIVEN for e in self._objectives[workspace][p])
+        return [dict(ziel) for _, ziel in eintraege]
+
+    def count_objectives(self, workspace):
+        with self._lock:
+            return {p: len(self._objectives[workspace][p]) for p in PERSPEKTIVEN}
+
+    def objectives_revision(self, workspace):
+        with self._lock:
+            return self._objective_rev[workspace]
+
+    def iter_objectives(self, workspace, batch=1000):
+        with self._lock:
+            eintraege = sorted(e for p in PERSPEKTIVEN for e in self._objectives[workspace][p])
+        for _, ziel in eintraege:
+            yield tuple(ziel[feld] for feld in OBJECTIVE_FIELDS)
+
+    def clear_objectives(self, workspace):
+        with self._lock:
+            self._objective_rev[workspace] += 1
+            self._objectives.pop(workspace, None)
+
+    def list_teams(self, workspace):
+        with self._lock:
+            return sorted(self._teams[workspace])
+
+    def team_stats(self, workspace, team):
+        with self._lock:
+            return self._teams[workspace].get(team)
+
+    def update_team_stats(self, workspace, team, aktualisiere):
+        with self._lock:
+            daten = self._teams[workspace][team] = aktualisiere(self._teams[workspace].get(team))
+            return daten
+
+    def clear_team(self, workspace, team):
+        with self._lock:
+            self._teams[workspace].pop(team, None)
+
+
+# --- SQLite backend ---
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS eisenhower_tasks (
+    id INTEGER PRIMARY KEY,
+    workspace TEXT NOT NULL,
+    beschreibung TEXT NOT NULL,
+    wichtigkeit TEXT NOT NULL,
+    dringlichkeit TEXT NOT NULL,
+    quadrant TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_eisenhower_workspace_quadrant ON eisenhower_tasks (workspace, quadrant, id);
+
+CREATE TABLE IF NOT EXISTS raci_roles (
+    id INTEGER PRIMARY KEY,
+    workspace TEXT NOT NULL,
+    name TEXT NOT NULL,
+    UNIQUE (workspace, name)
+);
+
+CREATE TABLE IF NOT EXISTS raci_tasks (
+    id INTEGER PRIMARY KEY,
+    workspace TEXT NOT NULL,
+    beschreibung TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_raci_tasks_workspace ON raci_tasks (workspace, id);
+
+CREATE TABLE IF NOT EXISTS raci_assignments (
+    task_id INTEGER NOT NULL REFERENCES raci_tasks (id) ON DELETE CASCADE,
+    role_id INTEGER NOT NULL REFERENCES raci_roles (id) ON DELETE CASCADE,
+    code TEXT NOT NULL,
+    PRIMARY KEY (task_id, role_id)
+);
+CREATE INDEX IF NOT EXISTS idx_raci_assignments_role ON raci_assignments (role_id, code);
+
+CREATE TABLE IF NOT EXISTS revisions (
+    workspace TEXT NOT NULL,
+    modul TEXT NOT NULL,
+    rev INTEGER NOT NULL,
+    PRIMARY KEY (workspace, modul)
+);
+
+CREATE TABLE IF NOT EXISTS team_stats (
+    workspace TEXT NOT NULL,
+    team TEXT NOT NULL,
+    daten TEXT NOT NULL,
+    PRIMARY KEY (workspace, team)
+);
+
+CREATE TABLE IF NOT EXISTS bsc_objectives (
+    id INTEGER PRIMARY KEY,
+    workspace TEXT NOT NULL,
+    perspektive TEXT NOT NULL,
+    bereich TEXT NOT NULL DEFAULT '',
+    ziel TEXT NOT NULL,
+    kennzahl TEXT NOT NULL,
+    zielwert REAL,
+    istwert REAL,
+    richtung TEXT NOT NULL DEFAULT 'hoch',
+    gewicht REAL NOT NULL DEFAULT 1,
+    massnahmen TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_bsc_workspace_perspektive ON bsc_objectives (workspace, perspektive, id);
+"""
+
+
+class SQLiteStorage(Storage):
+    """SQLite-backed storage; one connection per thread, WAL journal for concurrent readers"""
+
+    def __init__(self, path):
+        self.path = str(path)
+        self._local = threading.local()
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        with self._conn() as conn:
+            conn.executescript(SCHEMA)
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA foreign_keys = ON")
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _seite(sql, params, offset, limit):
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params = (*params, limit, offset)
+        elif offset:
+            sql += " LIMIT -1 OFFSET ?"
+            params = (*params, offset)
+        return sql, params
+
+    # --- Eisenhower ---
+    def add_task(self, workspace, beschreibung, wichtigkeit, dringlichkeit, quadrant):
+        _pruefe(quadrant, QUADRANTEN, "quadrant")
+        with self._conn() as conn:
+            conn.execute(
+                "INSERT INTO eisenhower_tasks (workspace, beschreibung, wichtigkeit, dringlichkeit, quadrant) VALUES (?, ?, ?, ?, ?)",
+                (workspace, beschreibung, wichtigkeit, dringlichkeit, quadrant),
+            )
+
+    def add_tasks(self, workspace, tasks):
+        tasks = list(tasks)
+        for task in tasks:
+            _pruefe(task[3], QUADRANTEN, "quadrant")
+        with self._conn() as conn:
+            conn.executemany(
+                "INSERT INTO eisenhower_tasks (workspace, beschreibung, wichtigkeit, dringlichkeit, quadrant) VALUES (?, ?, ?, ?, ?)",
+                [(workspace, *task) for task in tasks],
+            )
+
+    def list_tasks(self, workspace, quadrant=None, offset=0, limit=None):
+        sql = "SELECT beschreibung, wichtigkeit, dringlichkeit, quadrant FROM eisenhower_tasks WHERE workspace = ?"
+        params = (workspace,)
+        if quadrant is not None:
+            sql += " AND quadrant = ?"
+            params += (quadrant,)
+        sql, params = self._seite(sql + " ORDER BY id", params, offset, limit)
+        return [dict(row) for row in self._conn().execute(sql, params)]
+
+    def _batches(self, sql, params, batch):
+        """Rows of a query through one cursor, ``batch`` rows fetched at a time"""
+        cursor = self._conn().execute(sql, params)
+        try:
+            while rows := cursor.fetchmany(batch):
+                yield from rows
+        finally:
+            cursor.close()
+
+    def iter_tasks(self, workspace, batch=1000):
+        sql = f"SELECT {', '.join(TASK_FIELDS)} FROM eisenhower_tasks WHERE workspace = ? ORDER BY id"
+        for row in self._batches(sql, (workspace,), batch):
+            yield tuple(row)
+
+    def count_tasks(self, workspace):
+        anzahl = dict.fromkeys(QUADRANTEN, 0)
+        rows = self._conn().execute(
+            "SELECT quadrant, COUNT(*) FROM eisenhower_tasks WHERE workspace = ? GROUP BY quadrant", (workspace,)
+        )
+        anzahl.update(dict(rows.fetchall()))
+        return anzahl
+
+    def clear_tasks(self, workspace):
+        with self._conn() as conn:
+            conn.execute("DELETE FROM eisenhower_tasks WHERE workspace = ?", (workspace,))
+
+    # --- RACI ---
+    def list_roles(self, workspace):
+        rows = self._conn().execute("SELECT name FROM raci_roles WHERE workspace = ? ORDER BY id", (workspace,))
+        return [name for (name,) in rows]
+
+    def add_role(self, workspace, name):
+        with self._conn() as conn:
+            conn.execute("INSERT OR IGNORE INTO raci_roles (workspace, name) VALUES (?, ?)", (workspace, name))
+
+    def add_raci_task(self, workspace, beschreibung, zuweisungen):
+        zuweisungen = _zuweisungen(zuweisungen)
+        with self._conn() as conn:
+            rollen = dict(conn.execute("SELECT name, id FROM raci_roles WHERE workspace = ?", (workspace,)).fetchall())
+            unbekannt = set(zuweisungen) - set(rollen)
+            if unbekannt:
+                raise ValueError(f"Unknown role(s): {', '.join(sorted(unbekannt))}")
+            task_id = conn.execute(
+                "INSERT INTO raci_tasks (workspace, beschreibung) VALUES (?, ?)", (workspace, beschreibung)
+            ).lastrowid
+            conn.executemany(
+                "INSERT INTO raci_assignments (task_id, role_id, code) VALUES (?, ?, ?)",
+                [(task_id, rollen[rolle], code) for rolle, code in zuweisungen.items()],
+            )
+
+    def add_raci_tasks(self, workspace, tasks):
+        tasks = [(beschreibung, _zuweisungen(zuweisungen)) for beschreibung, zuweisungen in tasks]
+        with self._conn() as conn:
+            rollen = dict(conn.execute("SELECT name, id FROM raci_roles WHERE workspace = ?", (workspace,)).fetchall())
+            unbekannt = {rolle for _, z in tasks for rolle in z} - set(rollen)
+            if unbekannt:
+                raise ValueError(f"Unknown role(s): {', '.join(sorted(unbekannt))}")
+            zuweisungen = []
+            for beschreibung, z in tasks:
+                task_id = conn.execute(
+                    "INSERT INTO raci_tasks (workspace, beschreibung) VALUES (?, ?)", (workspace, beschreibung)
+                ).lastrowid
+                zuweisungen.extend((task_id, rollen[rolle], code) for rolle, code in z.items())
+            conn.executemany("INSERT INTO raci_assignments (task_id, role_id, code) VALUES (?, ?, ?)", zuweisungen)
+
+    def list_raci_tasks(self, workspace, offset=0, limit=None):
+        sql, params = self._seite(
+            "SELECT id, beschreibung FROM raci_tasks WHERE workspace = ? ORDER BY id", (workspace,), offset, limit
+        )
+        conn = self._conn()
+        tasks = {row["id"]: {"beschreibung": row["beschreibung"], "zuweisungen": {}} for row in conn.execute(sql, params)}
+        if tasks:
+            zuweisungen = conn.execute(
+                f"SELECT a.task_id, r.name, a.code FROM raci_assignments a JOIN raci_roles r ON r.id = a.role_id "
+                f"WHERE a.task_id IN ({','.join('?' * len(tasks))})",
+                tuple(tasks),
+            )
+            for task_id, rolle, code in zuweisungen:
+                tasks[task_id]["zuweisungen"][rolle] = code
+        return list(tasks.values())
+
+    def count_raci_tasks(self, workspace):
+        return self._conn().execute("SELECT COUNT(*) FROM raci_tasks WHERE workspace = ?", (workspace,)).fetchone()[0]
+
+    def iter_raci_rows(self, workspace, batch=1000):
+        rollen = self._conn().execute("SELECT id FROM raci_roles WHERE workspace = ? ORDER BY id", (workspace,)).fetchall()
+        spalte = {role_id: j for j, (role_id,) in enumerate(rollen)}
+        # One pass over tasks joined with their assignments, grouped by task id
+        rows = self._batches(
+            "SELECT t.id, t.beschreibung, a.role_id, a.code FROM raci_tasks t "
+            "LEFT JOIN raci_assignments a ON a.task_id = t.id WHERE t.workspace = ? ORDER BY t.id",
+            (workspace,), batch,
+        )
+        aktuell, beschreibung, codes = None, None, None
+        for task_id, text, role_id, code in rows:
+            if task_id != aktuell:
+                if aktuell is not None:
+                    yield beschreibung, tuple(codes)
+                aktuell, beschreibung, codes = task_id, text, ["-"] * len(rollen)
+            if role_id is not None:
+                codes[spalte[role_id]] = code
+        if aktuell is not None:
+            yield beschreibung, tuple(codes)
+
+    def raci_snapshot(self, workspace):
+        conn = self._conn()
+        aufgaben = conn.execute("SELECT id, beschreibung FROM raci_tasks WHERE workspace = ? ORDER BY id", (workspace,)).fetchall()
+        rollen = conn.execute("SELECT id, name FROM raci_roles WHERE workspace = ? ORDER BY id", (workspace,)).fetchall()
+        zuweisungen = conn.execute(
+            "SELECT a.task_id, a.role_id, instr('RACI', a.code) FROM raci_assignments a "
+            "JOIN raci_tasks t ON t.id = a.task_id WHERE t.workspace = ?",
+            (workspace,),
+        ).fetchall()
+        return [tuple(r) for r in aufgaben], [tuple(r) for r in rollen], zuweisungen
+
+    def set_raci_assignments(self, workspace, aenderungen):
+        aenderungen = [(task_id, rolle, code or "-") for task_id, rolle, code in aenderungen]
+        _zuweisungen({rolle: code for _, rolle, code in aenderungen})
+        with self._conn() as conn:
+            rollen = dict(conn.execute("SELECT name, id FROM raci_roles WHERE workspace = ?", (workspace,)).fetchall())
+            unbekannt = {rolle for _, rolle, _ in aenderungen} - set(rollen)
+            if unbekannt:
+                raise ValueError(f"Unknown role(s): {', '.join(sorted(unbekannt))}")
+            conn.executemany(
+                "DELETE FROM raci_assignments WHERE task_id = ? AND role_id = ? "
+                "AND task_id IN (SELECT id FROM raci_tasks WHERE workspace = ?)",
+                [(task_id, rollen[rolle], workspace) for task_id, rolle, code in aenderungen if code == "-"],
+            )
+            conn.executemany(
+                "INSERT INTO raci_assignments (task_id, role_id, code) "
+                "SELECT id, ?, ? FROM raci_tasks WHERE id = ? AND workspace = ? "
+                "ON CONFLICT (task_id, role_id) DO UPDATE SET code = excluded.code",
+                [(rollen[rolle], code, task_id, workspace) for task_id, rolle, code in aenderungen if code != "-"],
+            )
+
+    def clear_raci_tasks(self, workspace):
+        with self._conn() as conn:
+            conn.execute("DELETE FROM raci_tasks WHERE workspace = ?", (workspace,))
+
+    # --- Balanced Scorecard ---
+    @staticmethod
+    def _neue_revision(conn, workspace, modul):
+        conn.execute(
+            "INSERT INTO revisions (workspace, modul, rev) VALUES (?, ?, 1) "
+            "ON CONFLICT (workspace, modul) DO UPDATE SET rev = rev + 1",
+            (workspace, modul),
+        )
+
+    def add_objective(self, workspace, perspektive, ziel, kennzahl, zielwert, massnahmen, istwert=None, gewicht=1.0, bereich="", richtung="hoch"):
+        ziel = _objective(perspektive, ziel, kennzahl, zielwert, massnahmen, istwert, gewicht, bereich, richtung)
+        with self._conn() as conn:
+            conn.execute(
+                "INSERT INTO bsc_objectives (workspace, perspektive, bereich, ziel, kennzahl, zielwert, istwert, richtung, gewicht, massnahmen) "
+                "VALUES (:workspace, :perspektive, :bereich, :ziel, :kennzahl, :zielwert, :istwert, :richtung, :gewicht, :massnahmen)",
+                dict(ziel, workspace=workspace),
+            )
+            self._neue_revision(conn, workspace, "bsc")
+
+    def add_objectives(self, workspace, ziele):
+        ziele = [_objective_aus(z) for z in ziele]
+        with self._conn() as conn:
+            conn.executemany(
+                "INSERT INTO bsc_objectives (workspace, perspektive, bereich, ziel, kennzahl, zielwert, istwert, richtung, gewicht, massnahmen) "
+                "VALUES (:workspace, :perspektive, :bereich, :ziel, :kennzahl, :zielwert, :istwert, :richtung, :gewicht, :massnahmen)",
+                [dict(ziel, workspace=workspace) for ziel in ziele],
+            )
+            self._neue_revision(conn, workspace, "bsc")
+
+    def list_objectives(self, workspace, perspektive=None):
+        sql = ("SELECT id, perspektive, bereich, ziel, kennzahl, zielwert, istwert, richtung, gewicht, massnahmen "
+               "FROM bsc_objectives WHERE workspace = ?")
+        params = (workspace,)
+        if perspektive is not None:
+            sql += " AND perspektive = ?"
+            params += (perspektive,)
+        return [dict(row) for row in self._conn().execute(sql + " ORDER BY id", params)]
+
+    def iter_objectives(self, workspace, batch=1000):
+        sql = f"SELECT {', '.join(OBJECTIVE_FIELDS)} FROM bsc_objectives WHERE workspace = ? ORDER BY id"
+        for row in self._batches(sql, (workspace,), batch):
+            yield tuple(row)
+
+    def count_objectives(self, workspace):
+        anzahl = dict.fromkeys(PERSPEKTIVEN, 0)
+        rows = self._conn().execute(
+            "SELECT perspektive, COUNT(*) FROM bsc_objectives WHERE workspace = ? GROUP BY perspektive", (workspace,)
+        )
+        anzahl.update(dict(rows.fetchall()))
+        return anzahl
+
+    def objectives_revision(self, workspace):
+        row = self._conn().execute("SELECT rev FROM revisions WHERE workspace = ? AND modul = 'bsc'", (workspace,)).fetchone()
+        return row[0] if row else 0
+
+    def clear_objectives(self, workspace):
+        with self._conn() as conn:
+            conn.execute("DELETE FROM bsc_objectives WHERE workspace = ?", (workspace,))
+            self._neue_revision(conn, workspace, "bsc")
+
+    # --- Team questionnaires ---
+    def list_teams(self, workspace):
+        rows = self._conn().execute("SELECT team FROM team_stats WHERE workspace = ? ORDER BY team", (workspace,))
+        return [team for (team,) in rows]
+
+    def team_stats(self, workspace, team):
+        row = self._conn().execute("SELECT daten FROM team_stats WHERE workspace = ? AND team = ?", (workspace, team)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def update_team_stats(self, workspace, team, aktualisiere):
+        conn = self._conn()
+        # Write lock before reading, so concurrent submissions (also from other processes) cannot lose an update
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT daten FROM team_stats WHERE workspace = ? AND team = ?", (workspace, team)).fetchone()
+            daten = aktualisiere(json.loads(row[0]) if row else None)
+            conn.execute(
+                "INSERT INTO team_stats (workspace, team, daten) VALUES (?, ?, ?) "
+                "ON CONFLICT (workspace, team) DO UPDATE SET daten = excluded.daten",
+                (workspace, team, json.dumps(daten)),
+            )
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        return daten
+
+    def clear_team(self, workspace, team):
+        with self._conn() as conn:
+            conn.execute("DELETE FROM team_stats WHERE workspace = ? AND team = ?", (workspace, team))
+
+
+def open_storage(url):
+    """Create the backend for a storage URL (sqlite:///path or memory://)"""
+    if url.startswith("sqlite:///"):
+        return SQLiteStorage(url[len("sqlite:///"):])
+    if url in ("memory", "memory://"):
+        return MemoryStorage()
+    raise ValueError(f"Unsupported storage URL {url!r}")
@@ -0,0 +1,152 @@
+"""Team aggregate of task-analysis responses, updated online as answers arrive.
+
+Only running statistics are kept (Welford mean/M2 per question and per task type,
+class counts), so memory is flat and a new response costs O(1) no matter how many
+came before. Aggregates of several teams combine exactly (Chan et al.) into a
+department view. Agreement is r_wg against a uniform null distribution of the
+7-point answer scale (James, Demaree & Wolf): 1 = everybody answered alike,
+0 = no more agreement than random answers; r_wg(J) is used per task type.
+"""
+import numpy as np
+
+from decision_compass.scoring import FRAGEN, MAX_ANTWORT, MIN_ANTWORT, TYP_MATRIX, TYPEN, bewerte_antworten
+
+# Variance of uniformly random answers on the scale: (A^2 - 1) / 12
+NULL_VARIANZ = ((MAX_ANTWORT - MIN_ANTWORT + 1) ** 2 - 1) / 12
+
+# Class codes as in decision_compass.sensitivity: 0 = no task recognized, else hybrid mask in TYPEN order
+KLASSEN_ANZAHL = 1 << len(TYPEN)
+
+
+def _welford(n, mittel, m2, x):
+    delta = x - mittel
+    mittel += delta / n
+    m2 += delta * (x - mittel)
+
+
+def _kombiniere(n_a, mittel_a, m2_a, n_b, mittel_b, m2_b):
+    n = n_a + n_b
+    if n == 0:
+        return mittel_a, m2_a
+    delta = mittel_b - mittel_a
+    return mittel_a + delta * n_b / n, m2_a + m2_b + delta ** 2 * n_a * n_b / n
+
+
+def _varianz(n, m2):
+    return m2 / (n - 1) if n > 1 else np.full_like(m2, np.nan)
+
+
+def rwg(varianz):
+    """Single-item agreement 1 - s^2 / null variance, limited to [0, 1] (NaN stays NaN)"""
+    return np.clip(1 - varianz / NULL_VARIANZ, 0.0, 1.0)
+
+
+def rwg_j(varianzen):
+    """Multi-item agreement over the J items of one scale from their mean variance"""
+    anteil = np.minimum(np.mean(varianzen) / NULL_VARIANZ, 1.0)
+    j = len(varianzen)
+    return j * (1 - anteil) / (j * (1 - anteil) + anteil) if anteil > 0 else 1.0
+
+
+class TeamStatistik:
+    """Running statistics of a team's responses
+
+    ``frage_*`` cover every response (answers per question), ``typ_*`` and ``klassen``
+    only responses in which a task was recognized (points per task type, class counts).
+    """
+
+    def __init__(self):
+        self.n = 0
+        self.frage_mittel = np.zeros(len(FRAGEN))
+        self.frage_m2 = np.zeros(len(FRAGEN))
+        self.bewertet = 0
+        self.typ_mittel = np.zeros(len(TYPEN))
+        self.typ_m2 = np.zeros(len(TYPEN))
+        self.klassen = np.zeros(KLASSEN_ANZAHL, dtype=np.int64)
+
+    def erfasse(self, antworten):
+        """Add one response (12 answers in ``FRAGEN`` order)"""
+        antworten = np.asarray(antworten, dtype=float)
+        self.n += 1
+        _welford(self.n, self.frage_mittel, self.frage_m2, antworten)
+        ergebnis = bewerte_antworten([(frage["typ"], int(wert)) for frage, wert in zip(FRAGEN, antworten)])
+        if ergebnis is None:
+            self.klassen[0] += 1
+            return
+        self.bewertet += 1
+        _welford(self.bewertet, self.typ_mittel, self.typ_m2, np.array([ergebnis["punkte"][typ] for typ in TYPEN], dtype=float))
+        self.klassen[sum(1 << TYPEN.index(typ) for typ in ergebnis["hybrid_typen"])] += 1
+
+    def kombiniere(self, andere):
+        """Aggregate of both teams, as if all responses had been added to one"""
+        summe = TeamStatistik()
+        summe.n = self.n + andere.n
+        summe.frage_mittel, summe.frage_m2 = _kombiniere(self.n, self.frage_mittel, self.frage_m2, andere.n, andere.frage_mittel, andere.frage_m2)
+        summe.bewertet = self.bewertet + andere.bewertet
+        summe.typ_mittel, summe.typ_m2 = _kombiniere(self.bewertet, self.typ_mittel, self.typ_m2, andere.bewertet, andere.typ_mittel, andere.typ_m2)
+        summe.klassen = self.klassen + andere.klassen
+        return summe
+
+    # --- Results ---
+    def fragen(self):
+        """Per question: mean, standard deviation, agreement r_wg and disagreement 1 - r_wg"""
+        varianz = _varianz(self.n, self.frage_m2)
+        einigkeit = rwg(varianz)
+        return {"mittel": self.frage_mittel.copy(), "std": np.sqrt(varianz), "einigkeit": einigkeit, "uneinigkeit": 1 - einigkeit}
+
+    def typen(self):
+        """Per task type: mean and standard deviation of the points, agreement r_wg(J) over its questions, share of results"""
+        varianz = _varianz(self.n, self.frage_m2)
+        einigkeit = np.array([rwg_j(varianz[TYP_MATRIX[i] == 1]) if self.n > 1 else np.nan for i in range(len(TYPEN))])
+        codes = np.arange(KLASSEN_ANZAHL)
+        anteil = np.array([self.klassen[codes & (1 << i) > 0].sum() for i in range(len(TYPEN))]) / max(self.bewertet, 1) * 100
+        return {"mittel": self.typ_mittel.copy(), "std": np.sqrt(_varianz(self.bewertet, self.typ_m2)), "einigkeit": einigkeit, "anteil": anteil}
+
+    def hybrid_anteil(self):
+        """Percent of recognized responses classified as more than one task type"""
+        hybrid = sum(int(self.klassen[code]) for code in range(1, KLASSEN_ANZAHL) if code & (code - 1))
+        return hybrid / self.bewertet * 100 if self.bewertet else float("nan")
+
+    # --- Persistence ---
+    def als_dict(self):
+        return {
+            "n": self.n, "frage_mittel": self.frage_mittel.tolist(), "frage_m2": self.frage_m2.tolist(),
+            "bewertet": self.bewertet, "typ_mittel": self.typ_mittel.tolist(), "typ_m2": self.typ_m2.tolist(),
+            "klassen": self.klassen.tolist(),
+        }
+
+    @classmethod
+    def aus_dict(cls, daten):
+        statistik = cls()
+        if daten:
+            statistik.n, statistik.bewertet = daten["n"], daten["bewertet"]
+            for feld in ("frage_mittel", "frage_m2", "typ_mittel", "typ_m2"):
+                setattr(statistik, feld, np.array(daten[feld], dtype=float))
+            statistik.klassen = np.array(daten["klassen"], dtype=np.int64)
+        return statistik
+
+
+def erfasse_antwort(storage, workspace, team, antworten):
+    """Add one response to the team's stored aggregate in a single transaction; returns the new aggregate"""
+    def aktualisiere(daten):
+        statistik = TeamStatistik.aus_dict(daten)
+        statistik.erfasse(antworten)
+        return statistik.als_dict()
+
+    return TeamStatistik.aus_dict(storage.update_team_stats(workspace, team, aktualisiere))
+
+
+def erfasse_antworten(storage, workspace, team, matrix):
+    """Add an (n, 12) answer matrix to the team's stored aggregate in a single transaction"""
+    neu = TeamStatistik()
+    for zeile in matrix:
+        neu.erfasse(zeile)
+    return TeamStatistik.aus_dict(storage.update_team_stats(workspace, team, lambda daten: TeamStatistik.aus_dict(daten).kombiniere(neu).als_dict()))
+
+
+def lade(storage, workspace, teams):
+    """Combined aggregate of the given teams"""
+    statistik = TeamStatistik()
+    for team in teams:
+        statistik = statistik.kombiniere(TeamStatistik.aus_dict(storage.team_stats(workspace, team)))
+    return statistik
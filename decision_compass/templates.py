@@ -0,0 +1,109 @@
+"""HTML snippets of the module views: one stylesheet, escaped user text and cached rendering.
+
+The CSS of all views is compiled once into ``STYLESHEET`` and sent once per full run by
+the app shell instead of a <style> block per call. Snippets are ``string.Template``
+substitutions in which every value is escaped with ``html.escape``; rendered snippets are
+kept in an LRU cache keyed by (content hash, theme, language). Quadrants are separate
+snippets, so an unchanged one is a byte-identical message Streamlit can serve from the
+browser's message cache.
+"""
+import html
+import re
+import threading
+from string import Template
+
+from decision_compass.cache import ArtifactCache, artifact_key
+
+SNIPPET_CACHE_ENTRIES = 1024
+SNIPPET_CACHE_BYTES = 16 * 1024 * 1024
+
+
+# --- Stylesheet ---
+def _kompiliere(css):
+    """Drop the indentation and line breaks of a CSS source"""
+    return re.sub(r"\s*([{}:;,])\s*", r"\1", re.sub(r"\s+", " ", css)).strip()
+
+
+STYLESHEET = _kompiliere("""
+.dc-swot {
+    padding: 15px;
+    border-radius: 10px;
+    min-height: 200px;
+    margin-bottom: 15px;
+}
+.dc-swot.strengths { background-color: #d4edda; border-left: 5px solid #28a745; }
+.dc-swot.weaknesses { background-color: #f8d7da; border-left: 5px solid #dc3545; }
+.dc-swot.opportunities { background-color: #cce7ff; border-left: 5px solid #007bff; }
+.dc-swot.threats { background-color: #fff3cd; border-left: 5px solid #ffc107; }
+.dc-quadrant {
+    padding: 15px;
+    border-radius: 10px;
+    min-height: 250px;
+    margin-bottom: 10px;
+}
+.dc-box {
+    padding: 15px;
+    border-radius: 10px;
+    margin-bottom: 15px;
+}
+.dc-box h3 { margin-top: 0; }
+.dc-progress {
+    background-color: #e6e6e6;
+    border-radius: 5px;
+    height: 8px;
+    overflow: hidden;
+    margin: 6px 0;
+}
+.dc-progress > div { height: 100%; animation: dc-grow 0.1s ease-out; }
+@keyframes dc-grow { from { width: 0; } }
+""")
+
+SWOT_KLASSEN = ("strengths", "weaknesses", "opportunities", "threats")
+
+# --- Templates ---
+_VORLAGEN = {
+    "swot_quadrant": Template('<div class="dc-swot $klasse"><h4>$titel</h4>$eintraege</div>'),
+    "eisenhower_quadrant": Template(
+        '<div class="dc-quadrant" style="background-color: ${farbe}20; border-left: 5px solid $farbe">'
+        '<h4>$titel ($anzahl)</h4>$eintraege</div>'
+    ),
+    "box": Template(
+        '<div class="dc-box" style="border: 2px solid $rand; background-color: $hintergrund">\n'
+        '<h3>$titel</h3>\n$inhalt\n</div>'
+    ),
+}
+
+
+def aufzaehlung(eintraege, leer):
+    """Escaped entries as '• a<br>• b', or the escaped placeholder in italics when there are none"""
+    if not eintraege:
+        return f"<em>{html.escape(leer)}</em>"
+    return "• " + "<br>• ".join(html.escape(str(eintrag)) for eintrag in eintraege)
+
+
+def _rendere(name, leer, werte):
+    felder = {
+        feld: aufzaehlung(wert, leer) if isinstance(wert, (list, tuple)) else html.escape(str(wert))
+        for feld, wert in werte.items()
+    }
+    return _VORLAGEN[name].substitute(felder)
+
+
+# --- Cache ---
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def snippet_cache():
+    """Process-wide cache of rendered snippets shared by all sessions"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ArtifactCache(SNIPPET_CACHE_ENTRIES, SNIPPET_CACHE_BYTES)
+        return _cache
+
+
+def snippet(name, theme, lang, leer="", **werte):
+    """Render template ``name``; lists become bullet lists (``leer`` when empty), everything is escaped"""
+    key = artifact_key([name, leer, werte], lang, theme)
+    return snippet_cache().get_or_build(key, lambda: _rendere(name, leer, werte))
@@ -0,0 +1,179 @@
+"""Streamlit helpers shared by the app shell (app.py) and the pages in ``decision_compass.pages``.
+
+Only streamlit and the light modules are imported here, so the start page runs
+without pandas; the import, export and bundle modules are loaded on first use.
+"""
+import hmac
+import time
+import uuid
+
+import streamlit as st
+
+from decision_compass.config import profiling_settings, progress_mode, storage_url
+from decision_compass.formats import MODUL_MIME
+from decision_compass.i18n import available_languages, get_text
+from decision_compass.jobs import FERTIG, OwnerQueueFull, QueueFull, job_queue
+from decision_compass.profiling import fragment_lauf, gemessen
+from decision_compass.storage import open_storage
+from decision_compass.templates import snippet
+
+# --- Shared definitions ---
+SEITEN = ("start", "task_analysis", "swot_analysis", "eisenhower_matrix", "raci_matrix", "balanced_scorecard")
+
+TYP_EMOJI = {"disjunktiv": "⭐", "konjunktiv": "⛓️", "additiv": "➕"}
+
+FARBEN = {
+    "light": {"disjunktiv": "#E63946", "konjunktiv": "#F1FA3C", "additiv": "#2A9D8F", "background": "#FFFFFF", "text": "#000000", "box": "#f9f9f9"},
+    "dark": {"disjunktiv": "#FF6B6B", "konjunktiv": "#FFD93D", "additiv": "#4ECDC4", "background": "#121212", "text": "#FFFFFF", "box": "#1E1E1E"}
+}
+
+
+# --- Session context ---
+def sprache():
+    """Language chosen in the sidebar (widget key ``sprache``)"""
+    return st.session_state.get("sprache") or available_languages()[0]
+
+
+def t(key, **kwargs):
+    """Translate key into the selected language"""
+    return get_text(key, sprache(), **kwargs)
+
+
+@st.cache_resource
+def get_storage():
+    """Storage backend shared by all sessions of this process"""
+    return open_storage(storage_url())
+
+
+def workspace_id():
+    """Per-user workspace, kept in the URL (?ws=...) so a board can be reopened later
+
+    Page switches drop the query string, so the id is also kept in the session and written back.
+    """
+    ws = st.query_params.get("ws", "")
+    if ws.isalnum() and len(ws) <= 64:
+        st.session_state.workspace = ws
+    else:
+        ws = st.session_state.setdefault("workspace", uuid.uuid4().hex)
+        st.query_params["ws"] = ws
+    return ws
+
+
+def admin_ansicht():
+    """True when the session was opened with ?admin=<DECISION_COMPASS_ADMIN_TOKEN>"""
+    token = profiling_settings()[2]
+    if "admin" in st.query_params:
+        st.session_state.admin_token = st.query_params["admin"]
+    return bool(token) and hmac.compare_digest(st.session_state.get("admin_token", "").encode(), token.encode())
+
+
+# --- Utility Functions ---
+@gemessen
+def animated_progress(value, max_value, color, text, speed=0.02):
+    """Progress bar with final value display, rendered according to the deployment's progress mode"""
+    max_value = max(max_value, 1)
+    percent = min(value / max_value, 1.0)
+    mode = progress_mode()
+    if mode == "sleep":
+        placeholder = st.empty()
+        for i in range(1, value + 1):
+            placeholder.progress(min(i / max_value, 1.0), text=f"{text}: {i}")
+            time.sleep(speed)
+    elif mode == "css":
+        # The browser animates the bar (.dc-progress in templates.STYLESHEET); the script thread returns immediately
+        st.markdown(f"<div class='dc-progress'><div style='width:{percent * 100:.1f}%; background-color:{color}; "
+                    f"animation-duration:{max(value * speed, 0.1):.2f}s'></div></div>", unsafe_allow_html=True)
+    else:
+        st.progress(percent, text=f"{text}: {value}")
+    st.markdown(f"<span style='color:{color}; font-weight:bold'>{text}: {value}</span>", unsafe_allow_html=True)
+
+
+@gemessen
+def create_colored_box(title, content, bg_color, border_color="#888888", theme="light"):
+    """Create a styled colored box (title and content are escaped, markdown in the content still applies)"""
+    st.markdown(snippet("box", theme, sprache(), titel=title, inhalt=content, hintergrund=bg_color, rand=border_color),
+                unsafe_allow_html=True)
+
+
+# --- Export / import sections ---
+def export_starten(file_name, mime, builder):
+    """Queue an export job for this workspace; progress and download appear in the sidebar
+
+    Returns True when the job was queued.
+    """
+    try:
+        job_queue().submit(workspace_id(), file_name, mime, builder)
+        st.toast(t("job_queued", datei=file_name))
+        return True
+    except OwnerQueueFull:
+        st.warning(t("job_owner_limit", anzahl=job_queue().max_per_owner))
+        return False
+    except QueueFull:
+        st.warning(t("job_queue_full"))
+        return False
+
+
+@st.fragment
+@fragment_lauf
+def export_bereich(name, lade_inhalt, gespeichert=False):
+    """PDF/Excel/CSV buttons of a module; ``lade_inhalt()`` runs inside the background job
+
+    CSV of ``gespeichert`` modules is streamed straight from the store instead of the loaded content.
+    A click reruns only this fragment; the whole app reruns once if the sidebar job list is not polling yet.
+    """
+    language, storage, workspace = sprache(), get_storage(), workspace_id()
+    knoepfe = (("pdf", "export_pdf"), ("xlsx", "export_excel"), ("csv", "export_csv"))
+    for spalte, (fmt, knopf) in zip(st.columns(3), knoepfe):
+        with spalte:
+            if st.button(t(knopf)):
+                from decision_compass.bundle import modul_datei, store_tabelle
+                from decision_compass.export import csv_datei
+
+                if fmt == "csv" and gespeichert:
+                    builder = lambda melde: csv_datei(*store_tabelle(storage, workspace, name, language), language)
+                else:
+                    builder = lambda melde, fmt=fmt: modul_datei(lade_inhalt(), fmt, language, melde)
+                if export_starten(f"{name}.{fmt}", MODUL_MIME[fmt], builder) and not st.session_state.get("job_polling"):
+                    st.rerun()
+
+
+def import_bereich(name):
+    """Upload of a CSV/XLSX file in the module's export format; valid rows are stored, rejected ones reported per line"""
+    with st.expander(t("import_header")):
+        datei = st.file_uploader(t("import_file"), type=["csv", "xlsx"], key=f"import_{name}")
+        if datei is None or not st.button(t("import_start"), key=f"import_start_{name}"):
+            return
+        from decision_compass.export import csv_datei
+        from decision_compass.importer import importiere
+
+        language = sprache()
+        ergebnis = importiere(get_storage(), workspace_id(), name, datei.getvalue(), datei.name, language)
+        if ergebnis.anzahl:
+            st.success(t("import_done", anzahl=ergebnis.anzahl))
+        if len(ergebnis.fehler):
+            bericht = ergebnis.fehler.rename(columns=t("import_error_columns"))
+            st.warning(t("import_skipped", anzahl=ergebnis.fehler["zeile"].nunique()))
+            st.dataframe(bericht, hide_index=True, width="stretch")
+            st.download_button(t("import_error_report"), data=csv_datei(bericht.columns, bericht.itertuples(index=False), language),
+                               file_name=f"{name}_import_errors.csv", mime=MODUL_MIME["csv"], on_click="ignore")
+
+
+def export_auftraege(polling):
+    """Export jobs of this workspace with progress, cancel and download; reruns itself while jobs are active"""
+    queue = job_queue()
+    jobs = queue.jobs(workspace_id())
+    status_namen = t("job_status")
+    if queue.limit_erreicht(workspace_id()):
+        st.caption(t("job_owner_limit", anzahl=queue.max_per_owner))
+    for job in reversed(jobs):
+        if job.aktiv:
+            st.progress(job.fortschritt, text=f"{job.file_name} – {status_namen[job.status]}")
+            st.button(t("job_cancel"), key=f"job_abbrechen_{job.id}", on_click=queue.cancel, args=(job.id,))
+        elif job.status == FERTIG:
+            st.download_button(f"📥 {job.file_name}", data=job.ergebnis, file_name=job.file_name, mime=job.mime,
+                               key=f"job_download_{job.id}", on_click="ignore")
+        else:
+            st.caption(t("job_failed", datei=job.file_name, fehler=job.fehler) if job.fehler else f"{job.file_name} – {status_namen[job.status]}")
+    if polling and not any(job.aktiv for job in jobs):
+        # Last job finished: one full rerun turns the polling off
+        st.rerun()